@@ -1,5 +1,6 @@
 """GitHub API client implementation."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
@@ -7,11 +8,28 @@ from typing import Any
 import httpx
 from pydantic import BaseModel
 
+from ..constants import DEFAULT_TIMEOUT, HTTP_NOT_MODIFIED
 from ..utils import get_settings
 from .exceptions import GitHubAPIError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
+# Totals for every interaction type GraphQL can count, in one request
+_ACTIVITY_COUNTS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    issues { totalCount }
+    pullRequests { totalCount }
+    stargazers { totalCount }
+    forks { totalCount }
+    releases { totalCount }
+    defaultBranchRef {
+      target { ... on Commit { history { totalCount } } }
+    }
+  }
+}
+"""
+
 
 class RateLimit(BaseModel):
     """GitHub API rate limit information."""
@@ -34,7 +52,7 @@ class GitHubClient:
             "Authorization": f"Bearer {self.token}",
             "User-Agent": "github-stats/0.1.0",
         }
-        self._client = httpx.Client(headers=self.headers, timeout=30.0)
+        self._client = httpx.Client(headers=self.headers, timeout=DEFAULT_TIMEOUT)
 
     def __enter__(self):
         """Context manager entry."""
@@ -71,6 +89,40 @@ class GitHubClient:
             logger.error(f"Unexpected error: {e}")
             raise
 
+    def check_unchanged(
+        self,
+        endpoint: str,
+        etag: str | None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[bool, str | None]:
+        """Probe the first item of a list endpoint with a conditional request.
+
+        A 304 Not Modified reply does not count against the rate limit.
+
+        Args:
+            endpoint: List endpoint path
+            etag: ETag from the previous probe, if any
+            params: Extra query parameters the real fetch uses
+
+        Returns:
+            Whether the endpoint is unchanged since ``etag``, and its ETag
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = self._client.get(
+                f"{self.base_url}{endpoint}",
+                params={**(params or {}), "per_page": 1},
+                headers=headers,
+            )
+            if response.status_code == HTTP_NOT_MODIFIED:
+                return True, etag
+            self._check_rate_limit(response)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise GitHubAPIError(f"API request failed: {e}") from e
+
+        return False, response.headers.get("ETag")
+
     def get_rate_limit(self) -> RateLimit:
         """Get current rate limit status."""
         data = self._request("GET", "/rate_limit")
@@ -87,6 +139,85 @@ class GitHubClient:
         """Get repository details."""
         return self._request("GET", f"/repos/{owner}/{repo}")
 
+    def graphql(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Run a GraphQL query and return its ``data``."""
+        response = self._request(
+            "POST", "/graphql", json={"query": query, "variables": variables or {}}
+        )
+        if response.get("errors"):
+            raise GitHubAPIError(f"GraphQL query failed: {response['errors']}")
+        return response.get("data") or {}
+
+    def get_repository_activity_counts(self, owner: str, repo: str) -> dict[str, int]:
+        """Get per-type interaction totals for a repository in one request.
+
+        Returns:
+            Totals keyed by tracking operation name (commits on the default
+            branch, issues, pull_requests, stargazers, forks, releases), or
+            an empty dict if the repository was not found
+        """
+        data = self.graphql(_ACTIVITY_COUNTS_QUERY, {"owner": owner, "name": repo})
+        repository = data.get("repository")
+        if not repository:
+            return {}
+
+        target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+        return {
+            "commits": target.get("history", {}).get("totalCount", 0),
+            "issues": repository["issues"]["totalCount"],
+            "pull_requests": repository["pullRequests"]["totalCount"],
+            "stargazers": repository["stargazers"]["totalCount"],
+            "forks": repository["forks"]["totalCount"],
+            "releases": repository["releases"]["totalCount"],
+        }
+
+    def get_repositories(
+        self, full_names: list[str], max_concurrency: int = 10
+    ) -> dict[str, dict[str, Any]]:
+        """Get details for many repositories concurrently.
+
+        Args:
+            full_names: Repository names in ``owner/repo`` form
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Repository details keyed by full name; repositories whose request
+            failed are omitted
+        """
+        return asyncio.run(self._get_repositories(full_names, max_concurrency))
+
+    async def _get_repositories(
+        self, full_names: list[str], max_concurrency: int
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch repositories over one async connection pool."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with httpx.AsyncClient(
+            base_url=self.base_url, headers=self.headers, timeout=DEFAULT_TIMEOUT
+        ) as client:
+
+            async def fetch(full_name: str) -> dict[str, Any] | None:
+                async with semaphore:
+                    try:
+                        response = await client.get(f"/repos/{full_name}")
+                        self._check_rate_limit(response)
+                        response.raise_for_status()
+                        repository: dict[str, Any] = response.json()
+                        return repository
+                    except (httpx.HTTPError, GitHubAPIError) as e:
+                        logger.error("Failed to fetch repository %s: %s", full_name, e)
+                        return None
+
+            results = await asyncio.gather(*(fetch(name) for name in full_names))
+
+        return {
+            name: data
+            for name, data in zip(full_names, results, strict=True)
+            if data is not None
+        }
+
     def list_organization_repos(
         self, org_name: str, per_page: int = 100
     ) -> list[dict[str, Any]]:
@@ -157,8 +288,13 @@ class GitHubClient:
         state: str = "all",
         since: datetime | None = None,
         per_page: int = 100,
+        include_pulls: bool = True,
     ) -> list[dict[str, Any]]:
-        """Get repository issues."""
+        """Get repository issues.
+
+        The issues endpoint also returns pull requests; pass
+        ``include_pulls=False`` to drop them page by page as they arrive.
+        """
         params = {"state": state, "per_page": per_page}
 
         if since:
@@ -176,7 +312,10 @@ class GitHubClient:
             if not response:
                 break
 
-            issues.extend(response)
+            if include_pulls:
+                issues.extend(response)
+            else:
+                issues.extend(item for item in response if "pull_request" not in item)
 
             if len(response) < per_page:
                 break
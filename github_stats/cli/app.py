@@ -12,6 +12,7 @@ from ..reports import EmailReporter, ReportScheduler
 from ..tracking import InteractionTracker
 from ..utils import check_db_has_data, get_db, init_db, setup_logging
 from ..utils.config import get_settings
+from ..utils.snapshot import write_interactions_snapshot
 
 app = typer.Typer(
     name="github-stats",
@@ -52,6 +53,24 @@ def init():
     console.print("[bold green]Database initialized successfully![/bold green]")
 
 
+@app.command()
+def snapshot(
+    path: str | None = typer.Option(
+        None, "--path", "-p", help="Output file (defaults to INTERACTIONS_SNAPSHOT)"
+    ),
+) -> None:
+    """Write a Parquet snapshot of interactions for the dashboard."""
+    setup_logging()
+
+    try:
+        count = write_interactions_snapshot(path)
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    console.print(f"[bold green]Wrote snapshot of {count} interactions[/bold green]")
+
+
 @app.command()
 def track_org(
     org_name: str = typer.Argument(..., help="GitHub organization name"),
@@ -88,40 +107,45 @@ def track_org(
                 repos = client.list_organization_repos(org_name)
                 for repo in repos:
                     console.print(f"[dim]Tracking {repo['full_name']}...[/dim]")
-                    repo_info = tracker.track_repository(repo["full_name"], org_name)
-
-                    if repo_info["exists"]:
-                        # Track all interaction types for each repository
-                        owner, repo_name = repo["full_name"].split("/")
-
-                        # Track all interaction types for each repo
-                        commits = tracker.track_commits(owner, repo_name)
-                        issues = tracker.track_issues(owner, repo_name)
-                        prs = tracker.track_pull_requests(owner, repo_name)
-                        stars = tracker.track_stargazers(owner, repo_name)
-                        forks = tracker.track_forks(owner, repo_name)
-                        releases = tracker.track_releases(owner, repo_name)
-                        workflows = tracker.track_workflow_runs(owner, repo_name)
-
-                        total_interactions = (
-                            len(commits)
-                            + len(issues)
-                            + len(prs)
-                            + len(stars)
-                            + len(forks)
-                            + len(releases)
-                            + len(workflows)
-                        )
-                        console.print(
-                            f"[green]✓[/green] {repo['full_name']} - "
-                            f"{total_interactions} total interactions"
-                        )
-                    else:
-                        console.print(
-                            f"[yellow]⚠[/yellow] {repo['full_name']} - "
-                            "basic tracking only"
+                    # One session and transaction per repository
+                    with get_db() as db:
+                        repo_info = tracker.track_repository(
+                            repo["full_name"], org_name, db=db
                         )
 
+                        if repo_info["exists"]:
+                            # Track all interaction types for each repository
+                            owner, repo_name = repo["full_name"].split("/")
+
+                            commits = tracker.track_commits(owner, repo_name, db=db)
+                            issues = tracker.track_issues(owner, repo_name, db=db)
+                            prs = tracker.track_pull_requests(owner, repo_name, db=db)
+                            stars = tracker.track_stargazers(owner, repo_name, db=db)
+                            forks = tracker.track_forks(owner, repo_name, db=db)
+                            releases = tracker.track_releases(owner, repo_name, db=db)
+                            workflows = tracker.track_workflow_runs(
+                                owner, repo_name, db=db
+                            )
+
+                            total_interactions = (
+                                commits
+                                + issues
+                                + prs
+                                + stars
+                                + forks
+                                + releases
+                                + workflows
+                            )
+                            console.print(
+                                f"[green]✓[/green] {repo['full_name']} - "
+                                f"{total_interactions} total interactions"
+                            )
+                        else:
+                            console.print(
+                                f"[yellow]⚠[/yellow] {repo['full_name']} - "
+                                "basic tracking only"
+                            )
+
                 console.print(
                     f"[bold green]Tracked {len(repos)} repositories with "
                     "full data[/bold green]"
@@ -174,38 +198,32 @@ def track_repo(
             # Always track all interaction types for existing repositories
             console.print("[bold]Fetching commits...[/bold]")
             commit_interactions = tracker.track_commits(owner, repo_name)
-            console.print(
-                f"[green]✓[/green] Tracked {len(commit_interactions)} commits"
-            )
+            console.print(f"[green]✓[/green] Tracked {commit_interactions} commits")
 
             console.print("[bold]Fetching issues...[/bold]")
             issue_interactions = tracker.track_issues(owner, repo_name)
-            console.print(f"[green]✓[/green] Tracked {len(issue_interactions)} issues")
+            console.print(f"[green]✓[/green] Tracked {issue_interactions} issues")
 
             console.print("[bold]Fetching pull requests...[/bold]")
             pr_interactions = tracker.track_pull_requests(owner, repo_name)
-            console.print(
-                f"[green]✓[/green] Tracked {len(pr_interactions)} pull requests"
-            )
+            console.print(f"[green]✓[/green] Tracked {pr_interactions} pull requests")
 
             console.print("[bold]Fetching stargazers...[/bold]")
             star_interactions = tracker.track_stargazers(owner, repo_name)
-            console.print(f"[green]✓[/green] Tracked {len(star_interactions)} stars")
+            console.print(f"[green]✓[/green] Tracked {star_interactions} stars")
 
             console.print("[bold]Fetching forks...[/bold]")
             fork_interactions = tracker.track_forks(owner, repo_name)
-            console.print(f"[green]✓[/green] Tracked {len(fork_interactions)} forks")
+            console.print(f"[green]✓[/green] Tracked {fork_interactions} forks")
 
             console.print("[bold]Fetching releases...[/bold]")
             release_interactions = tracker.track_releases(owner, repo_name)
-            console.print(
-                f"[green]✓[/green] Tracked {len(release_interactions)} releases"
-            )
+            console.print(f"[green]✓[/green] Tracked {release_interactions} releases")
 
             console.print("[bold]Fetching workflow runs...[/bold]")
             workflow_interactions = tracker.track_workflow_runs(owner, repo_name)
             console.print(
-                f"[green]✓[/green] Tracked {len(workflow_interactions)} workflow runs"
+                f"[green]✓[/green] Tracked {workflow_interactions} workflow runs"
             )
         else:
             if repo_info["error"]:
@@ -294,10 +312,24 @@ def list_orgs():
     """List all tracked organizations."""
     setup_logging()
 
-    from ..models import Organization
+    from sqlalchemy import func
+
+    from ..models import Organization, Repository
 
     with get_db() as db:
-        orgs = db.query(Organization).order_by(Organization.name).all()
+        # Only the listed columns, with repository counts from one grouped join
+        orgs = (
+            db.query(
+                Organization.name,
+                Organization.github_id,
+                Organization.created_at,
+                func.count(Repository.id).label("repo_count"),
+            )
+            .outerjoin(Repository, Repository.organization_id == Organization.id)
+            .group_by(Organization.id)
+            .order_by(Organization.name)
+            .all()
+        )
 
         if not orgs:
             console.print("[yellow]No organizations tracked yet.[/yellow]")
@@ -310,11 +342,10 @@ def list_orgs():
         table.add_column("Added", style="magenta")
 
         for org in orgs:
-            repo_count = len(org.repositories)
             table.add_row(
                 org.name,
                 str(org.github_id) if org.github_id else "-",
-                str(repo_count),
+                str(org.repo_count),
                 org.created_at.strftime("%Y-%m-%d %H:%M"),
             )
 
@@ -328,10 +359,24 @@ def list_repos(
     """List all tracked repositories."""
     setup_logging()
 
-    from ..models import Organization, Repository
+    from sqlalchemy import func
+
+    from ..models import Interaction, Organization, Repository
 
     with get_db() as db:
-        query = db.query(Repository).order_by(Repository.full_name)
+        # Only the listed columns, with interaction counts from one grouped join
+        query = (
+            db.query(
+                Repository.full_name,
+                Repository.github_id,
+                Repository.is_private,
+                Repository.created_at,
+                func.count(Interaction.id).label("interaction_count"),
+            )
+            .outerjoin(Interaction, Interaction.repository_id == Repository.id)
+            .group_by(Repository.id)
+            .order_by(Repository.full_name)
+        )
 
         if org:
             org_obj = db.query(Organization).filter_by(name=org).first()
@@ -352,12 +397,11 @@ def list_repos(
         table.add_column("Added", style="blue")
 
         for repo in repos:
-            interaction_count = len(repo.interactions)
             table.add_row(
                 repo.full_name,
                 str(repo.github_id) if repo.github_id else "-",
                 "Yes" if repo.is_private else "No",
-                str(interaction_count),
+                str(repo.interaction_count),
                 repo.created_at.strftime("%Y-%m-%d %H:%M"),
             )
 
@@ -2,6 +2,7 @@
 
 # HTTP Status Codes
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
 HTTP_FORBIDDEN = 403
 HTTP_NOT_FOUND = 404
 HTTP_RATE_LIMIT_EXCEEDED = 429
@@ -10,9 +11,28 @@ HTTP_RATE_LIMIT_EXCEEDED = 429
 DEFAULT_PER_PAGE = 100
 DEFAULT_TIMEOUT = 30.0
 MIN_RATE_LIMIT_WARNING = 10
+SYNC_MAX_WORKERS = 4  # concurrent endpoint fetches per repository sync
 
 # Database Configuration
 DEFAULT_DATABASE_URL = "sqlite:///./github_stats.db"
+DB_POOL_RECYCLE = 1800  # seconds before pooled server connections are replaced
+
+# Dashboard Configuration
+DASHBOARD_CACHE_TTL = 300  # seconds to reuse cached dashboard query results
+DATA_MANAGEMENT_CACHE_TTL = 30  # seconds to reuse Data Management listings
+QUERY_RESULTS_CACHE_TTL = 60  # seconds to reuse Query Builder results
+QUERY_RESULTS_CACHE_ENTRIES = 32  # distinct filter sets kept per cached query
+QUERY_EXPORT_CHUNK_SIZE = 5000  # rows fetched per round trip for CSV exports
+QUERY_PREVIEW_MAX_VALUES = 20  # selected values shown per filter in the SQL preview
+TIMELINE_MAX_DAYS = 365  # daily points plotted before switching to weeks
+
+# Timeline ranges offered on dashboard pages, in days; None covers all time
+TIME_RANGE_DAYS = {
+    "Last 7 days": 7,
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "All time": None,
+}
 
 # Email Configuration
 DEFAULT_SMTP_PORT = 587
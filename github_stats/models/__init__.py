@@ -1,6 +1,19 @@
 """Database models for GitHub Stats tracking."""
 
 from .base import Base
-from .interactions import Interaction, InteractionType, Organization, Repository
+from .interactions import (
+    Interaction,
+    InteractionType,
+    Organization,
+    Repository,
+    SyncCursor,
+)
 
-__all__ = ["Base", "Interaction", "InteractionType", "Repository", "Organization"]
+__all__ = [
+    "Base",
+    "Interaction",
+    "InteractionType",
+    "Repository",
+    "Organization",
+    "SyncCursor",
+]
@@ -4,7 +4,18 @@ import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    column,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -42,10 +53,10 @@ class Organization(Base):
     )
 
     repositories: Mapped[list["Repository"]] = relationship(
-        "Repository", back_populates="organization"
+        "Repository", back_populates="organization", passive_deletes=True
     )
     interactions: Mapped[list["Interaction"]] = relationship(
-        "Interaction", back_populates="organization"
+        "Interaction", back_populates="organization", passive_deletes=True
     )
 
 
@@ -59,7 +70,7 @@ class Repository(Base):
     full_name: Mapped[str] = mapped_column(String(512), unique=True, index=True)
     github_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     organization_id: Mapped[int | None] = mapped_column(
-        ForeignKey("organizations.id"), nullable=True
+        ForeignKey("organizations.id", ondelete="SET NULL"), nullable=True, index=True
     )
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_private: Mapped[bool] = mapped_column(default=False)
@@ -73,7 +84,27 @@ class Repository(Base):
         "Organization", back_populates="repositories"
     )
     interactions: Mapped[list["Interaction"]] = relationship(
-        "Interaction", back_populates="repository"
+        "Interaction", back_populates="repository", passive_deletes=True
+    )
+    sync_cursors: Mapped[list["SyncCursor"]] = relationship(
+        "SyncCursor", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class SyncCursor(Base):
+    """Last seen ETag of a repository's REST endpoint, for conditional syncs."""
+
+    __tablename__ = "sync_cursors"
+    __table_args__ = (UniqueConstraint("repository_id", "endpoint"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    repository_id: Mapped[int] = mapped_column(
+        ForeignKey("repositories.id", ondelete="CASCADE")
+    )
+    endpoint: Mapped[str] = mapped_column(String(512))
+    etag: Mapped[str] = mapped_column(String(255))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
 
@@ -81,18 +112,64 @@ class Interaction(Base):
     """Record of a GitHub interaction."""
 
     __tablename__ = "interactions"
+    __table_args__ = (
+        # Dashboard queries filter on a timestamp range and type, repository
+        # or organization
+        Index("ix_interactions_ts_type", "timestamp", "type"),
+        Index("ix_interactions_repo_ts_type", "repository_id", "timestamp", "type"),
+        Index("ix_interactions_org_ts", "organization_id", "timestamp"),
+        # Query Builder filters a timestamp range with organizations and
+        # repositories, or users and actions, and lists distinct users and
+        # actions for its filter options
+        Index(
+            "ix_interactions_ts_org_repo",
+            "timestamp",
+            "organization_id",
+            "repository_id",
+        ),
+        Index(
+            "ix_interactions_user_ts",
+            "user",
+            "timestamp",
+            sqlite_where=column("user").isnot(None),
+            postgresql_where=column("user").isnot(None),
+        ),
+        # Developer Statistics groups a user's interactions by action
+        Index(
+            "ix_interactions_user_action",
+            "user",
+            "action",
+            sqlite_where=column("user").isnot(None),
+            postgresql_where=column("user").isnot(None),
+        ),
+        Index(
+            "ix_interactions_action",
+            "action",
+            sqlite_where=column("action").isnot(None),
+            postgresql_where=column("action").isnot(None),
+        ),
+        # One row per GitHub resource, so re-syncing an endpoint is idempotent.
+        # A unique index rather than a constraint so init_db() can add it to
+        # databases created before it existed
+        Index(
+            "ux_interactions_resource",
+            "repository_id",
+            "type",
+            "resource_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     type: Mapped[InteractionType] = mapped_column(Enum(InteractionType))
     repository_id: Mapped[int | None] = mapped_column(
-        ForeignKey("repositories.id"), nullable=True
+        ForeignKey("repositories.id", ondelete="CASCADE"), nullable=True
     )
     organization_id: Mapped[int | None] = mapped_column(
-        ForeignKey("organizations.id"), nullable=True
-    )
-    timestamp: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, index=True
+        ForeignKey("organizations.id", ondelete="CASCADE"), nullable=True
     )
+    # Indexed by the timestamp-led composites above
+    timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     user: Mapped[str | None] = mapped_column(String(255), nullable=True)
     action: Mapped[str | None] = mapped_column(String(255), nullable=True)
     resource_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
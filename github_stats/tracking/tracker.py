@@ -1,26 +1,394 @@
 """Core tracking functionality for GitHub interactions."""
 
 import logging
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, cast
 
+import httpx
 from dateutil import parser as date_parser
-from sqlalchemy.orm import Session
-
-from ..api import GitHubClient
-from ..constants import ERROR_MESSAGES, LOG_MESSAGES
-from ..models import Interaction, InteractionType, Organization, Repository
+from sqlalchemy import CursorResult, Engine, Insert, Table, event, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, raiseload
+
+from ..api import GitHubAPIError, GitHubClient
+from ..constants import ERROR_MESSAGES, LOG_MESSAGES, SYNC_MAX_WORKERS
+from ..models import (
+    Interaction,
+    InteractionType,
+    Organization,
+    Repository,
+    SyncCursor,
+)
 from ..utils import get_db
 
 logger = logging.getLogger(__name__)
 
+# Failures a tracking call recovers from: GitHub API errors (including rate
+# limiting), transport errors, and database errors while storing results.
+_TRACKING_ERRORS = (GitHubAPIError, httpx.HTTPError, SQLAlchemyError)
+
+_Getter = Callable[[dict[str, Any]], Any]
+
+# Statement counter of the innermost _count_queries block on each thread;
+# tracking runs on worker threads, so each call counts only its own queries
+_query_counter = threading.local()
+_counted_engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+_counted_engines_lock = threading.Lock()
+
+
+def _count_statement(*_args: Any) -> None:
+    """Add one to the current thread's query counter, if it is counting."""
+    counter = getattr(_query_counter, "current", None)
+    if counter is not None:
+        counter[0] += 1
+
+
+def _install_query_counter(engine: Engine) -> None:
+    """Listen for statements on an engine once, however many threads count."""
+    with _counted_engines_lock:
+        if engine not in _counted_engines:
+            event.listen(engine, "before_cursor_execute", _count_statement)
+            _counted_engines.add(engine)
+
+
+# Dialects whose INSERT supports ON CONFLICT clauses
+_CONFLICT_INSERTS: dict[str, Callable[[Table], postgresql.Insert | sqlite.Insert]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Interaction types whose resources change state after creation (an issue is
+# closed, a run completes), and the columns refreshed when they are re-synced
+_MUTABLE_TYPES = frozenset(
+    {
+        InteractionType.ISSUE,
+        InteractionType.PULL_REQUEST,
+        InteractionType.RELEASE,
+        InteractionType.WORKFLOW_RUN,
+    }
+)
+_REFRESHED_COLUMNS = ("timestamp", "user", "action", "resource_url", "extra_data")
+
+
+def _get(*path: str) -> _Getter:
+    """Build a getter for a nested key path in a GitHub API response item."""
+    *parents, leaf = path
+
+    if not parents:
+        return lambda item: item.get(leaf)
+
+    def getter(item: dict[str, Any]) -> Any:
+        for key in parents:
+            item = item.get(key) or {}
+        return item.get(leaf)
+
+    return getter
+
+
+def _get_str(*path: str) -> _Getter:
+    """Build a getter that stringifies the value at a nested key path."""
+    getter = _get(*path)
+    return lambda item: str(getter(item))
+
+
+def _get_labels(item: dict[str, Any]) -> list[str | None]:
+    """Get label names from an issue item."""
+    return [label.get("name") for label in item.get("labels", [])]
+
+
+def _const(value: Any) -> _Getter:
+    """Build a getter that always returns the same value."""
+    return lambda item: value
+
+
+def _prefixed(prefix: str, *path: str) -> _Getter:
+    """Build a getter that prefixes the value at a nested key path."""
+    getter = _get(*path)
+    return lambda item: f"{prefix}{getter(item)}"
+
+
+def _wrapped(wrapper: str, getter: _Getter) -> _Getter:
+    """Apply getter to item[wrapper] when present, else to the item itself.
+
+    Stargazers come back wrapped in ``{"starred_at": ..., "user": {...}}`` when
+    requested with the star media type, and as bare user objects otherwise.
+    """
+    return lambda item: getter(item.get(wrapper) or item)
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a GitHub timestamp, returning None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        parsed: datetime = date_parser.parse(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed
+
+
+# GitHub REST endpoint templates per tracking operation
+_API_ENDPOINTS = {
+    "commits": "/repos/{}/{}/commits",
+    "issues": "/repos/{}/{}/issues",
+    "pull_requests": "/repos/{}/{}/pulls",
+    "stargazers": "/repos/{}/{}/stargazers",
+    "forks": "/repos/{}/{}/forks",
+    "releases": "/repos/{}/{}/releases",
+    "workflow_runs": "/repos/{}/{}/actions/runs",
+}
+
+# Operations whose endpoints can list the most recently changed item first,
+# so an unchanged first item means nothing new to fetch, with the query
+# parameters that give that order. Issues and pull requests are probed by
+# update time so edits to older items are picked up; releases and workflow
+# runs change after creation but cannot be listed by update time, so they
+# are always fetched.
+_CONDITIONAL_PARAMS = {
+    "commits": {},
+    "issues": {"state": "all", "sort": "updated", "direction": "desc"},
+    "pull_requests": {"state": "all", "sort": "updated", "direction": "desc"},
+    "forks": {},
+}
+
+
+@lru_cache(maxsize=512)
+def _api_endpoint(operation_name: str, owner: str, repo: str) -> str:
+    """Build the API endpoint path for a tracking operation."""
+    template = _API_ENDPOINTS.get(operation_name)
+    if template is None:
+        return f"/repos/{owner}/{repo}/{operation_name}"
+    return template.format(owner, repo)
+
+
+# Declarative field specs per interaction type. "timestamp" points at the
+# GitHub date string used as the interaction timestamp; the remaining keys map
+# Interaction columns (and extra_data keys) to getters over the API item.
+_INTERACTION_SPECS: dict[InteractionType, dict[str, Any]] = {
+    InteractionType.COMMIT: {
+        "timestamp": _get("commit", "author", "date"),
+        "user": _get("commit", "author", "name"),
+        "action": _const("commit"),
+        "resource_id": _get("sha"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "message": _get("commit", "message"),
+            "sha": _get("sha"),
+            "committer_date": _get("commit", "committer", "date"),
+            "author_date": _get("commit", "author", "date"),
+        },
+    },
+    InteractionType.ISSUE: {
+        "timestamp": _get("created_at"),
+        "user": _get("user", "login"),
+        "action": _prefixed("issue_", "state"),
+        "resource_id": _get_str("number"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "title": _get("title"),
+            "state": _get("state"),
+            "created_at": _get("created_at"),
+            "updated_at": _get("updated_at"),
+            "closed_at": _get("closed_at"),
+            "labels": _get_labels,
+        },
+    },
+    InteractionType.PULL_REQUEST: {
+        "timestamp": _get("created_at"),
+        "user": _get("user", "login"),
+        "action": _prefixed("pr_", "state"),
+        "resource_id": _get_str("number"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "title": _get("title"),
+            "state": _get("state"),
+            "merged": lambda item: item.get("merged", False),
+            "base": _get("base", "ref"),
+            "head": _get("head", "ref"),
+            "created_at": _get("created_at"),
+            "updated_at": _get("updated_at"),
+            "merged_at": _get("merged_at"),
+            "closed_at": _get("closed_at"),
+        },
+    },
+    InteractionType.STAR: {
+        "timestamp": _get("starred_at"),
+        "user": _wrapped("user", _get("login")),
+        "action": _const("star"),
+        "resource_id": _wrapped("user", _get_str("id")),
+        "resource_url": _wrapped("user", _get("html_url")),
+        "extra_data": {
+            "starred_at": _get("starred_at"),
+            "user_type": _wrapped("user", _get("type")),
+        },
+    },
+    InteractionType.FORK: {
+        "timestamp": _get("created_at"),
+        "user": _get("owner", "login"),
+        "action": _const("fork"),
+        "resource_id": _get_str("id"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "fork_name": _get("full_name"),
+            "created_at": _get("created_at"),
+            "private": lambda item: item.get("private", False),
+        },
+    },
+    InteractionType.RELEASE: {
+        "timestamp": _get("published_at"),
+        "user": _get("author", "login"),
+        "action": _const("release"),
+        "resource_id": _get_str("id"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "tag_name": _get("tag_name"),
+            "name": _get("name"),
+            "draft": lambda item: item.get("draft", False),
+            "prerelease": lambda item: item.get("prerelease", False),
+            "published_at": _get("published_at"),
+            "created_at": _get("created_at"),
+        },
+    },
+    InteractionType.WORKFLOW_RUN: {
+        "timestamp": _get("created_at"),
+        "user": _get("actor", "login"),
+        "action": _prefixed("workflow_", "status"),
+        "resource_id": _get_str("id"),
+        "resource_url": _get("html_url"),
+        "extra_data": {
+            "workflow_id": _get("workflow_id"),
+            "status": _get("status"),
+            "conclusion": _get("conclusion"),
+            "run_number": _get("run_number"),
+            "event": _get("event"),
+            "created_at": _get("created_at"),
+            "updated_at": _get("updated_at"),
+        },
+    },
+}
+
+
+def _compile_extractor(
+    spec: dict[str, Any],
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Compile a field spec into a function mapping an API item to columns."""
+    timestamp_getter = spec["timestamp"]
+    column_getters = tuple(
+        (name, getter)
+        for name, getter in spec.items()
+        if name not in ("timestamp", "extra_data")
+    )
+    extra_getters = tuple(spec["extra_data"].items())
+
+    def extract(item: dict[str, Any]) -> dict[str, Any]:
+        data = {name: getter(item) for name, getter in column_getters}
+        data["timestamp"] = _parse_timestamp(timestamp_getter(item))
+        data["extra_data"] = {name: getter(item) for name, getter in extra_getters}
+        return data
+
+    return extract
+
+
+_EXTRACTORS: dict[InteractionType, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    interaction_type: _compile_extractor(spec)
+    for interaction_type, spec in _INTERACTION_SPECS.items()
+}
+
+
+def _insert_interactions(db: Session, interaction_type: InteractionType) -> Insert:
+    """Build the interactions INSERT, handling stored resources where supported.
+
+    Resources already stored are refreshed for mutable types and skipped for
+    the rest.
+    """
+    table = cast(Table, Interaction.__table__)
+    dialect_insert = _CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        return insert(table)
+
+    stmt = dialect_insert(table)
+    if interaction_type not in _MUTABLE_TYPES:
+        return stmt.on_conflict_do_nothing()
+    return stmt.on_conflict_do_update(
+        index_elements=["repository_id", "type", "resource_id"],
+        set_={column: stmt.excluded[column] for column in _REFRESHED_COLUMNS},
+    )
+
+
+def _execute_rows(db: Session, stmt: Insert, rows: list[dict[str, Any]]) -> int:
+    """Execute an INSERT for rows, returning how many were inserted or updated.
+
+    Falls back to the number of rows given when the driver reports no count.
+    """
+    result = cast(CursorResult[Any], db.execute(stmt, rows))
+    rowcount = result.rowcount
+    return rowcount if rowcount >= 0 else len(rows)
+
 
 class InteractionTracker:
     """Track and record GitHub interactions."""
 
-    def __init__(self, github_client: GitHubClient | None = None):
-        """Initialize tracker with GitHub client."""
+    def __init__(
+        self,
+        github_client: GitHubClient | None = None,
+        commit_every: int = 10_000,
+    ):
+        """Initialize tracker with GitHub client.
+
+        Args:
+            github_client: Client used for GitHub API calls
+            commit_every: Commit after this many inserted interaction rows, so
+                very large fetches are written in bounded transactions
+        """
         self.client = github_client or GitHubClient()
+        self.commit_every = commit_every
+
+    @contextmanager
+    def _session(self, db: Session | None) -> Iterator[Session]:
+        """Yield the caller's session, or open a transactional one via get_db().
+
+        Passing ``db`` lets a caller run several track_* calls in one session
+        and transaction; the caller then owns the commit. Each call runs in a
+        SAVEPOINT of that transaction, so a failed call rolls back only its
+        own work and later calls can still use the session.
+        """
+        if db is not None:
+            with db.begin_nested():
+                yield db
+        else:
+            with get_db() as owned:
+                yield owned
+
+    @contextmanager
+    def _count_queries(self, db: Session) -> Iterator[list[int]]:
+        """Count SQL statements this thread executes on the session's engine.
+
+        Only active with DEBUG logging; yields a one-item list whose value is
+        the running count, so it can be read after the block to spot N+1
+        regressions. Statements run by other threads are not counted, and a
+        nested block's count is added to the enclosing one.
+        """
+        counter = [0]
+        if not logger.isEnabledFor(logging.DEBUG):
+            yield counter
+            return
+
+        _install_query_counter(db.get_bind().engine)
+        outer = getattr(_query_counter, "current", None)
+        _query_counter.current = counter
+        try:
+            yield counter
+        finally:
+            _query_counter.current = outer
+            if outer is not None:
+                outer[0] += counter[0]
 
     def track_api_call(
         self,
@@ -28,58 +396,45 @@ class InteractionTracker:
         method: str = "GET",
         organization: str | None = None,
         repository: str | None = None,
-        extra_data: dict | None = None,
+        extra_data: dict[str, Any] | None = None,
+        db: Session | None = None,
     ) -> None:
         """Track a generic API call interaction."""
-        with get_db() as db:
-            org_id = None
-            repo_id = None
-
+        with self._session(db) as db:
             if organization:
-                org_id = self._get_or_create_organization(db, organization).id
+                self._get_or_create_organization(db, organization)
 
             if repository:
-                repo_id = self._get_or_create_repository(
-                    db, repository, organization
-                ).id
+                self._get_or_create_repository(db, repository, organization)
 
             # Skip API call tracking to avoid synthetic timestamps
             # API calls are meta-interactions and don't need to be tracked as data points
-            return
-
-            db.add(interaction)
-            db.commit()
+            logger.debug("Tracked API call: %s %s", method, endpoint)
 
-            logger.debug(f"Tracked API call: {method} {endpoint}")
-
-    def track_organization(self, org_name: str) -> dict[str, Any]:
+    def track_organization(
+        self, org_name: str, db: Session | None = None
+    ) -> dict[str, Any]:
         """Track organization and fetch its details."""
         org_info = {"name": org_name, "exists": False, "error": None}
 
-        with get_db() as db:
+        with self._session(db) as db:
             org = self._get_or_create_organization(db, org_name)
             org_info["id"] = org.id
             org_info["name"] = org.name
 
-            # Fetch and update organization details
+            # Fetch and update organization details; the SAVEPOINT keeps a
+            # failed flush from leaving the session unusable
             try:
                 org_data = self.client.get_organization(org_name)
-                org.github_id = org_data.get("id")
-                org.description = org_data.get("description")
-                org.last_synced_at = datetime.now()
+                with db.begin_nested():
+                    org.github_id = org_data.get("id")
+                    org.description = org_data.get("description")
+                    org.last_synced_at = datetime.now()
                 org_info["exists"] = True
                 org_info["github_id"] = org_data.get("id")
                 org_info["description"] = org_data.get("description")
-                db.commit()
-
-                # Track the API call
-                self.track_api_call(
-                    f"/orgs/{org_name}",
-                    organization=org_name,
-                    extra_data={"github_id": org_data.get("id")},
-                )
-            except Exception as e:
-                logger.error(f"Failed to fetch organization {org_name}: {e}")
+            except _TRACKING_ERRORS as e:
+                logger.error("Failed to fetch organization %s: %s", org_name, e)
                 org_info["error"] = str(e)
 
             return org_info
@@ -88,11 +443,12 @@ class InteractionTracker:
         self,
         repo_full_name: str,
         organization: str | None = None,
+        db: Session | None = None,
     ) -> dict[str, Any]:
         """Track repository and fetch its details."""
         repo_info = {"full_name": repo_full_name, "exists": False, "error": None}
 
-        with get_db() as db:
+        with self._session(db) as db:
             repo = self._get_or_create_repository(db, repo_full_name, organization)
 
             repo_info["id"] = repo.id
@@ -106,28 +462,21 @@ class InteractionTracker:
                 owner = organization
                 repo_name = repo_full_name
 
-            # Fetch and update repository details
+            # Fetch and update repository details; the SAVEPOINT keeps a
+            # failed flush from leaving the session unusable
             try:
                 repo_data = self.client.get_repository(owner, repo_name)
-                repo.github_id = repo_data.get("id")
-                repo.description = repo_data.get("description")
-                repo.is_private = repo_data.get("private", False)
-                repo.last_synced_at = datetime.now()
+                with db.begin_nested():
+                    repo.github_id = repo_data.get("id")
+                    repo.description = repo_data.get("description")
+                    repo.is_private = repo_data.get("private", False)
+                    repo.last_synced_at = datetime.now()
                 repo_info["exists"] = True
                 repo_info["github_id"] = repo_data.get("id")
                 repo_info["description"] = repo_data.get("description")
                 repo_info["is_private"] = repo_data.get("private", False)
-                db.commit()
-
-                # Track the API call
-                self.track_api_call(
-                    f"/repos/{owner}/{repo_name}",
-                    organization=organization,
-                    repository=repo_full_name,
-                    extra_data={"github_id": repo_data.get("id")},
-                )
-            except Exception as e:
-                logger.error(f"Failed to fetch repository {repo_full_name}: {e}")
+            except _TRACKING_ERRORS as e:
+                logger.error("Failed to fetch repository %s: %s", repo_full_name, e)
                 repo_info["error"] = str(e)
 
             return repo_info
@@ -138,63 +487,30 @@ class InteractionTracker:
         repo: str,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> list[Interaction]:
-        """Track commits for a repository."""
-        interactions = []
+        db: Session | None = None,
+    ) -> int:
+        """Track commits for a repository.
+
+        Returns:
+            Number of interactions stored
+        """
+        interactions = 0
 
         try:
             commits = self.client.get_repository_commits(owner, repo, since, until)
 
-            with get_db() as db:
+            with self._session(db) as db, self._count_queries(db) as queries:
                 repo_obj = self._get_or_create_repository(db, f"{owner}/{repo}", owner)
 
-                for commit in commits:
-                    # Extract commit timestamp from GitHub API
-                    commit_date_str = (
-                        commit.get("commit", {}).get("author", {}).get("date")
-                    )
-                    commit_timestamp = None
-                    if commit_date_str:
-                        try:
-                            commit_timestamp = date_parser.parse(commit_date_str)
-                        except (ValueError, TypeError):
-                            commit_timestamp = None
-
-                    interaction = Interaction(
-                        type=InteractionType.COMMIT,
-                        repository_id=repo_obj.id,
-                        organization_id=repo_obj.organization_id,
-                        timestamp=commit_timestamp,  # Use real GitHub timestamp
-                        user=commit.get("commit", {}).get("author", {}).get("name"),
-                        action="commit",
-                        resource_id=commit.get("sha"),
-                        resource_url=commit.get("html_url"),
-                        extra_data={
-                            "message": commit.get("commit", {}).get("message"),
-                            "sha": commit.get("sha"),
-                            "committer_date": commit.get("commit", {})
-                            .get("committer", {})
-                            .get("date"),
-                            "author_date": commit_date_str,
-                        },
-                    )
-                    db.add(interaction)
-                    interactions.append(interaction)
-
-                db.commit()
-
-                # Track the API call
-                self.track_api_call(
-                    f"/repos/{owner}/{repo}/commits",
-                    organization=owner,
-                    repository=f"{owner}/{repo}",
-                    extra_data={"count": len(commits)},
+                interactions = self._create_interactions_batch(
+                    db, InteractionType.COMMIT, repo_obj, commits
                 )
 
-                logger.debug(f"Tracked {len(commits)} commits for {owner}/{repo}")
+                logger.debug("Tracked %d commits for %s/%s", len(commits), owner, repo)
+                logger.debug("track_commits issued %d queries", queries[0])
 
-        except Exception as e:
-            logger.error(f"Failed to track commits for {owner}/{repo}: {e}")
+        except _TRACKING_ERRORS as e:
+            logger.error("Failed to track commits for %s/%s: %s", owner, repo, e)
 
         return interactions
 
@@ -204,67 +520,34 @@ class InteractionTracker:
         repo: str,
         state: str = "all",
         since: datetime | None = None,
-    ) -> list[Interaction]:
-        """Track issues for a repository."""
-        interactions = []
+        db: Session | None = None,
+    ) -> int:
+        """Track issues for a repository.
+
+        Returns:
+            Number of interactions stored
+        """
+        interactions = 0
 
         try:
-            issues = self.client.get_repository_issues(owner, repo, state, since)
+            # Pull requests come back from the issues endpoint too; the client
+            # drops them per page so they are never accumulated or extracted
+            issues = self.client.get_repository_issues(
+                owner, repo, state, since, include_pulls=False
+            )
 
-            with get_db() as db:
+            with self._session(db) as db, self._count_queries(db) as queries:
                 repo_obj = self._get_or_create_repository(db, f"{owner}/{repo}", owner)
 
-                for issue in issues:
-                    # Skip pull requests (they come in issues endpoint too)
-                    if "pull_request" in issue:
-                        continue
-
-                    # Extract issue timestamp from GitHub API
-                    issue_date_str = issue.get("created_at")
-                    issue_timestamp = None
-                    if issue_date_str:
-                        try:
-                            issue_timestamp = date_parser.parse(issue_date_str)
-                        except (ValueError, TypeError):
-                            issue_timestamp = None
-
-                    interaction = Interaction(
-                        type=InteractionType.ISSUE,
-                        repository_id=repo_obj.id,
-                        organization_id=repo_obj.organization_id,
-                        timestamp=issue_timestamp,  # Use real GitHub timestamp
-                        user=issue.get("user", {}).get("login"),
-                        action=f"issue_{issue.get('state')}",
-                        resource_id=str(issue.get("number")),
-                        resource_url=issue.get("html_url"),
-                        extra_data={
-                            "title": issue.get("title"),
-                            "state": issue.get("state"),
-                            "created_at": issue.get("created_at"),
-                            "updated_at": issue.get("updated_at"),
-                            "closed_at": issue.get("closed_at"),
-                            "labels": [
-                                label.get("name") for label in issue.get("labels", [])
-                            ],
-                        },
-                    )
-                    db.add(interaction)
-                    interactions.append(interaction)
-
-                db.commit()
-
-                # Track the API call
-                self.track_api_call(
-                    f"/repos/{owner}/{repo}/issues",
-                    organization=owner,
-                    repository=f"{owner}/{repo}",
-                    extra_data={"count": len(interactions), "state": state},
+                interactions = self._create_interactions_batch(
+                    db, InteractionType.ISSUE, repo_obj, issues
                 )
 
-                logger.debug(f"Tracked {len(interactions)} issues for {owner}/{repo}")
+                logger.debug("Tracked %d issues for %s/%s", interactions, owner, repo)
+                logger.debug("track_issues issued %d queries", queries[0])
 
-        except Exception as e:
-            logger.error(f"Failed to track issues for {owner}/{repo}: {e}")
+        except _TRACKING_ERRORS as e:
+            logger.error("Failed to track issues for %s/%s: %s", owner, repo, e)
 
         return interactions
 
@@ -273,64 +556,32 @@ class InteractionTracker:
         owner: str,
         repo: str,
         state: str = "all",
-    ) -> list[Interaction]:
-        """Track pull requests for a repository."""
-        interactions = []
+        db: Session | None = None,
+    ) -> int:
+        """Track pull requests for a repository.
+
+        Returns:
+            Number of interactions stored
+        """
+        interactions = 0
 
         try:
             pulls = self.client.get_repository_pulls(owner, repo, state)
 
-            with get_db() as db:
+            with self._session(db) as db, self._count_queries(db) as queries:
                 repo_obj = self._get_or_create_repository(db, f"{owner}/{repo}", owner)
 
-                for pr in pulls:
-                    # Extract PR timestamp from GitHub API
-                    created_at_str = pr.get("created_at")
-                    pr_timestamp = None
-                    if created_at_str:
-                        try:
-                            pr_timestamp = date_parser.parse(created_at_str)
-                        except (ValueError, TypeError):
-                            pr_timestamp = None
-
-                    interaction = Interaction(
-                        type=InteractionType.PULL_REQUEST,
-                        repository_id=repo_obj.id,
-                        organization_id=repo_obj.organization_id,
-                        timestamp=pr_timestamp,  # Use real GitHub timestamp
-                        user=pr.get("user", {}).get("login"),
-                        action=f"pr_{pr.get('state')}",
-                        resource_id=str(pr.get("number")),
-                        resource_url=pr.get("html_url"),
-                        extra_data={
-                            "title": pr.get("title"),
-                            "state": pr.get("state"),
-                            "merged": pr.get("merged", False),
-                            "base": pr.get("base", {}).get("ref"),
-                            "head": pr.get("head", {}).get("ref"),
-                            "created_at": created_at_str,
-                            "updated_at": pr.get("updated_at"),
-                            "merged_at": pr.get("merged_at"),
-                            "closed_at": pr.get("closed_at"),
-                        },
-                    )
-                    db.add(interaction)
-                    interactions.append(interaction)
-
-                db.commit()
-
-                # Track the API call
-                self.track_api_call(
-                    f"/repos/{owner}/{repo}/pulls",
-                    organization=owner,
-                    repository=f"{owner}/{repo}",
-                    extra_data={"count": len(pulls), "state": state},
+                interactions = self._create_interactions_batch(
+                    db, InteractionType.PULL_REQUEST, repo_obj, pulls
                 )
 
-                logger.debug(f"Tracked {len(pulls)} pull requests for {owner}/{repo}")
+                logger.debug(
+                    "Tracked %d pull requests for %s/%s", len(pulls), owner, repo
+                )
+                logger.debug("track_pull_requests issued %d queries", queries[0])
 
-        except Exception as e:
-            logger.error(f"Failed to track pull requests for {owner}/{repo}: {e}")
+        except _TRACKING_ERRORS as e:
+            logger.error("Failed to track pull requests for %s/%s: %s", owner, repo, e)
 
         return interactions
 
@@ -338,164 +589,209 @@ class InteractionTracker:
         self,
         owner: str,
         repo: str,
-    ) -> list[Interaction]:
-        """Track stargazers for a repository."""
-
-        def extract_star_data(star: dict[str, Any]) -> dict[str, Any]:
-            # Extract star timestamp from GitHub API
-            starred_at_str = star.get("starred_at")
-            star_timestamp = None
-            if starred_at_str:
-                try:
-                    star_timestamp = date_parser.parse(starred_at_str)
-                except (ValueError, TypeError):
-                    star_timestamp = None
-
-            return {
-                "timestamp": star_timestamp,  # Use real GitHub timestamp
-                "user": star.get("user", {}).get("login") if star.get("user") else star.get("login"),
-                "action": "star",
-                "resource_id": str(star.get("user", {}).get("id")) if star.get("user") else str(star.get("id")),
-                "resource_url": star.get("user", {}).get("html_url") if star.get("user") else star.get("html_url"),
-                "extra_data": {
-                    "starred_at": starred_at_str,
-                    "user_type": star.get("user", {}).get("type") if star.get("user") else star.get("type"),
-                },
-            }
+        db: Session | None = None,
+    ) -> int:
+        """Track stargazers for a repository.
 
+        Returns:
+            Number of interactions stored
+        """
         return self._track_with_error_handling(
             "stargazers",
             owner,
             repo,
             lambda: self.client.get_repository_stargazers(owner, repo),
             InteractionType.STAR,
-            extract_star_data,
+            db,
         )
 
     def track_forks(
         self,
         owner: str,
         repo: str,
-    ) -> list[Interaction]:
-        """Track forks for a repository."""
-
-        def extract_fork_data(fork: dict[str, Any]) -> dict[str, Any]:
-            # Extract fork timestamp from GitHub API
-            created_at_str = fork.get("created_at")
-            fork_timestamp = None
-            if created_at_str:
-                try:
-                    fork_timestamp = date_parser.parse(created_at_str)
-                except (ValueError, TypeError):
-                    fork_timestamp = None
-
-            return {
-                "timestamp": fork_timestamp,  # Use real GitHub timestamp
-                "user": fork.get("owner", {}).get("login"),
-                "action": "fork",
-                "resource_id": str(fork.get("id")),
-                "resource_url": fork.get("html_url"),
-                "extra_data": {
-                    "fork_name": fork.get("full_name"),
-                    "created_at": created_at_str,
-                    "private": fork.get("private", False),
-                },
-            }
+        db: Session | None = None,
+    ) -> int:
+        """Track forks for a repository.
 
+        Returns:
+            Number of interactions stored
+        """
         return self._track_with_error_handling(
             "forks",
             owner,
             repo,
             lambda: self.client.get_repository_forks(owner, repo),
             InteractionType.FORK,
-            extract_fork_data,
+            db,
         )
 
     def track_releases(
         self,
         owner: str,
         repo: str,
-    ) -> list[Interaction]:
-        """Track releases for a repository."""
-
-        def extract_release_data(release: dict[str, Any]) -> dict[str, Any]:
-            # Extract release timestamp from GitHub API
-            published_at_str = release.get("published_at")
-            release_timestamp = None
-            if published_at_str:
-                try:
-                    release_timestamp = date_parser.parse(published_at_str)
-                except (ValueError, TypeError):
-                    release_timestamp = None
-
-            return {
-                "timestamp": release_timestamp,  # Use real GitHub timestamp
-                "user": release.get("author", {}).get("login"),
-                "action": "release",
-                "resource_id": str(release.get("id")),
-                "resource_url": release.get("html_url"),
-                "extra_data": {
-                    "tag_name": release.get("tag_name"),
-                    "name": release.get("name"),
-                    "draft": release.get("draft", False),
-                    "prerelease": release.get("prerelease", False),
-                    "published_at": published_at_str,
-                    "created_at": release.get("created_at"),
-                },
-            }
+        db: Session | None = None,
+    ) -> int:
+        """Track releases for a repository.
 
+        Returns:
+            Number of interactions stored
+        """
         return self._track_with_error_handling(
             "releases",
             owner,
             repo,
             lambda: self.client.get_repository_releases(owner, repo),
             InteractionType.RELEASE,
-            extract_release_data,
+            db,
         )
 
     def track_workflow_runs(
         self,
         owner: str,
         repo: str,
-    ) -> list[Interaction]:
-        """Track workflow runs for a repository."""
-
-        def extract_workflow_data(run: dict[str, Any]) -> dict[str, Any]:
-            # Extract workflow run timestamp from GitHub API
-            created_at_str = run.get("created_at")
-            workflow_timestamp = None
-            if created_at_str:
-                try:
-                    workflow_timestamp = date_parser.parse(created_at_str)
-                except (ValueError, TypeError):
-                    workflow_timestamp = None
-
-            return {
-                "timestamp": workflow_timestamp,  # Use real GitHub timestamp
-                "user": run.get("actor", {}).get("login"),
-                "action": f"workflow_{run.get('status')}",
-                "resource_id": str(run.get("id")),
-                "resource_url": run.get("html_url"),
-                "extra_data": {
-                    "workflow_id": run.get("workflow_id"),
-                    "status": run.get("status"),
-                    "conclusion": run.get("conclusion"),
-                    "run_number": run.get("run_number"),
-                    "event": run.get("event"),
-                    "created_at": created_at_str,
-                    "updated_at": run.get("updated_at"),
-                },
-            }
+        db: Session | None = None,
+    ) -> int:
+        """Track workflow runs for a repository.
 
+        Returns:
+            Number of interactions stored
+        """
         return self._track_with_error_handling(
             "workflow_runs",
             owner,
             repo,
             lambda: self.client.get_repository_workflow_runs(owner, repo),
             InteractionType.WORKFLOW_RUN,
-            extract_workflow_data,
+            db,
         )
 
+    def track_all_interactions(
+        self,
+        owner: str,
+        repo: str,
+        max_workers: int = SYNC_MAX_WORKERS,
+    ) -> dict[str, int]:
+        """Track every interaction type for a repository concurrently.
+
+        A single GraphQL request first counts each type, so endpoints with
+        nothing to return are skipped, and endpoints whose ETag shows no new
+        items since the last sync are not fetched again. The rest are fetched
+        in worker threads and stored in their own sessions, so their latency
+        overlaps.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            max_workers: Maximum concurrent endpoint fetches
+
+        Returns:
+            Number of interactions stored, keyed by operation name
+        """
+        operations: dict[str, Callable[[str, str], int]] = {
+            "commits": self.track_commits,
+            "issues": self.track_issues,
+            "pull_requests": self.track_pull_requests,
+            "stargazers": self.track_stargazers,
+            "forks": self.track_forks,
+            "releases": self.track_releases,
+            "workflow_runs": self.track_workflow_runs,
+        }
+
+        try:
+            totals = self.client.get_repository_activity_counts(owner, repo)
+        except _TRACKING_ERRORS as e:
+            logger.warning("Could not count activity for %s/%s: %s", owner, repo, e)
+            totals = {}
+        results = {name: 0 for name in operations if totals.get(name) == 0}
+
+        # Create the repository up front so workers don't race to insert it
+        with self._session(None) as db:
+            repository_id = self._get_or_create_repository(
+                db, f"{owner}/{repo}", owner
+            ).id
+            etags = dict(
+                db.query(SyncCursor.endpoint, SyncCursor.etag)
+                .filter_by(repository_id=repository_id)
+                .all()
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    self._track_if_changed,
+                    name,
+                    track,
+                    owner,
+                    repo,
+                    etags.get(_api_endpoint(name, owner, repo)),
+                )
+                for name, track in operations.items()
+                if name not in results
+            }
+
+        new_etags = {}
+        for name, future in futures.items():
+            results[name], etag = future.result()
+            if etag:
+                new_etags[_api_endpoint(name, owner, repo)] = etag
+        if new_etags:
+            self._store_etags(repository_id, new_etags)
+
+        return results
+
+    def _track_if_changed(
+        self,
+        operation_name: str,
+        track: Callable[[str, str], int],
+        owner: str,
+        repo: str,
+        etag: str | None,
+    ) -> tuple[int, str | None]:
+        """Run ``track`` unless a conditional request shows no new items.
+
+        Returns:
+            Number of interactions stored, and the endpoint's new ETag if it
+            should be remembered
+        """
+        params = _CONDITIONAL_PARAMS.get(operation_name)
+        if params is None:
+            return track(owner, repo), None
+
+        endpoint = _api_endpoint(operation_name, owner, repo)
+        try:
+            unchanged, etag = self.client.check_unchanged(endpoint, etag, params)
+        except _TRACKING_ERRORS as e:
+            logger.warning("Conditional request to %s failed: %s", endpoint, e)
+            return track(owner, repo), None
+
+        if unchanged:
+            logger.debug("Skipping %s, unchanged since last sync", endpoint)
+            return 0, None
+
+        # Tracking errors yield no interactions; only remember the ETag once
+        # the endpoint's items were actually stored
+        interactions = track(owner, repo)
+        return interactions, etag if interactions else None
+
+    def _store_etags(self, repository_id: int, etags: dict[str, str]) -> None:
+        """Save the latest ETag per endpoint for a repository."""
+        with self._session(None) as db:
+            cursors = {
+                cursor.endpoint: cursor
+                for cursor in db.query(SyncCursor).filter_by(
+                    repository_id=repository_id
+                )
+            }
+            for endpoint, etag in etags.items():
+                if endpoint in cursors:
+                    cursors[endpoint].etag = etag
+                else:
+                    db.add(
+                        SyncCursor(
+                            repository_id=repository_id, endpoint=endpoint, etag=etag
+                        )
+                    )
+
     def _get_or_create_organization(
         self,
         db: Session,
@@ -507,9 +803,8 @@ class InteractionTracker:
         if not org:
             org = Organization(name=org_name)
             db.add(org)
-            db.commit()
-            db.refresh(org)
-            logger.debug(f"Created new organization: {org_name}")
+            db.flush()
+            logger.debug("Created new organization: %s", org_name)
 
         return org
 
@@ -530,7 +825,15 @@ class InteractionTracker:
         else:
             full_name = f"{organization}/{repo_name}" if organization else repo_name
 
-        repo = db.query(Repository).filter_by(full_name=full_name).first()
+        # Callers only read column attributes (id, organization_id) from the
+        # repository, so forbid relationship lazy loads rather than joining in
+        # the organization row.
+        repo = (
+            db.query(Repository)
+            .options(raiseload("*"))
+            .filter_by(full_name=full_name)
+            .first()
+        )
 
         if not repo:
             org_id = None
@@ -542,9 +845,8 @@ class InteractionTracker:
                 name=repo_name, full_name=full_name, organization_id=org_id
             )
             db.add(repo)
-            db.commit()
-            db.refresh(repo)
-            logger.debug(f"Created new repository: {full_name}")
+            db.flush()
+            logger.debug("Created new repository: %s", full_name)
 
         return repo
 
@@ -554,29 +856,56 @@ class InteractionTracker:
         interaction_type: InteractionType,
         repo_obj: Repository,
         items: list[dict[str, Any]],
-        extract_fn: callable,
-    ) -> list[Interaction]:
-        """Create a batch of interactions from API response items."""
-        interactions = []
+    ) -> int:
+        """Create a batch of interactions from API response items.
+
+        Rows are written with Core ``INSERT`` executemany statements, bypassing
+        per-row ORM object construction and flushes. Where the dialect supports
+        it, rows already stored for the same resource are refreshed for
+        mutable types and skipped otherwise. Rows are
+        inserted every ``commit_every`` rows, so only the pending chunk is held
+        in memory. In a session the tracker opened each chunk is also
+        committed; a caller's session (a SAVEPOINT, see ``_session``) is left
+        for the caller to commit.
+
+        Returns:
+            Number of rows inserted or refreshed
+        """
+        stmt = _insert_interactions(db, interaction_type)
+        commit_chunks = not db.in_nested_transaction()
+        chunk = []
+        written = 0
+        extract = _EXTRACTORS[interaction_type]
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        base_row = {
+            "type": interaction_type,
+            "repository_id": repo_obj.id,
+            "organization_id": repo_obj.organization_id,
+        }
 
         for item in items:
-            interaction_data = extract_fn(item)
-            
+            interaction_data = extract(item)
+
             # Skip interactions without valid timestamps to avoid synthetic data
             if interaction_data.get("timestamp") is None:
-                logger.debug(f"Skipping {interaction_type} interaction without timestamp")
+                if debug_enabled:
+                    logger.debug(
+                        "Skipping %s interaction without timestamp", interaction_type
+                    )
                 continue
-                
-            interaction = Interaction(
-                type=interaction_type,
-                repository_id=repo_obj.id,
-                organization_id=repo_obj.organization_id,
-                **interaction_data,
-            )
-            db.add(interaction)
-            interactions.append(interaction)
 
-        return interactions
+            chunk.append({**base_row, **interaction_data})
+
+            if len(chunk) >= self.commit_every:
+                written += _execute_rows(db, stmt, chunk)
+                if commit_chunks:
+                    db.commit()
+                chunk = []
+
+        if chunk:
+            written += _execute_rows(db, stmt, chunk)
+
+        return written
 
     def _track_with_error_handling(
         self,
@@ -585,62 +914,43 @@ class InteractionTracker:
         repo: str,
         api_call: callable,
         interaction_type: InteractionType,
-        extract_fn: callable,
-    ) -> list[Interaction]:
+        db: Session | None = None,
+    ) -> int:
         """Generic method to track interactions with error handling."""
-        interactions = []
+        interactions = 0
 
         try:
             # Call the API
             items = api_call()
 
             # Store interactions in database
-            with get_db() as db:
+            with self._session(db) as db, self._count_queries(db) as queries:
                 repo_obj = self._get_or_create_repository(db, f"{owner}/{repo}", owner)
 
                 interactions = self._create_interactions_batch(
-                    db, interaction_type, repo_obj, items, extract_fn
-                )
-
-                db.commit()
-
-                # Track the API call
-                endpoint = self._get_api_endpoint(operation_name, owner, repo)
-                self.track_api_call(
-                    endpoint,
-                    organization=owner,
-                    repository=f"{owner}/{repo}",
-                    extra_data={"count": len(items)},
+                    db, interaction_type, repo_obj, items
                 )
 
                 # Log the result
                 self._log_tracking_result(operation_name, len(items), owner, repo)
+                logger.debug("track_%s issued %d queries", operation_name, queries[0])
 
-        except Exception as e:
+        except _TRACKING_ERRORS as e:
             error_msg = ERROR_MESSAGES.get(
                 "api_request_failed", "Failed to track {operation}: {error}"
             )
-            logger.error(error_msg.format(operation=operation_name, error=e))
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(error_msg.format(operation=operation_name, error=e))
 
         return interactions
 
-    def _get_api_endpoint(self, operation_name: str, owner: str, repo: str) -> str:
-        """Get API endpoint path for operation."""
-        endpoints = {
-            "commits": f"/repos/{owner}/{repo}/commits",
-            "issues": f"/repos/{owner}/{repo}/issues",
-            "pull_requests": f"/repos/{owner}/{repo}/pulls",
-            "stargazers": f"/repos/{owner}/{repo}/stargazers",
-            "forks": f"/repos/{owner}/{repo}/forks",
-            "releases": f"/repos/{owner}/{repo}/releases",
-            "workflow_runs": f"/repos/{owner}/{repo}/actions/runs",
-        }
-        return endpoints.get(operation_name, f"/repos/{owner}/{repo}/{operation_name}")
-
     def _log_tracking_result(
         self, operation_name: str, count: int, owner: str, repo: str
     ) -> None:
         """Log tracking result in standardized format."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         message = LOG_MESSAGES.get(
             "interactions_tracked", "Tracked {count} {interaction_type} for {repo}"
         )
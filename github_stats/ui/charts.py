@@ -1,14 +1,188 @@
 """Comprehensive chart generation for GitHub stats visualization."""
 
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from datetime import datetime
+from functools import wraps
+from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Select, extract, func
+from sqlalchemy.orm import Query, Session
+
+from ..constants import DASHBOARD_CACHE_TTL
+from ..models.interactions import (
+    Interaction,
+    InteractionType,
+    Organization,
+    Repository,
+)
+from ..utils.database import get_database_url
+from ..utils.snapshot import (
+    INTERACTION_COLUMNS,
+    read_interactions_snapshot,
+    select_interaction_rows,
+    snapshot_available,
+)
+
+# Try to import pyarrow, CSV export falls back to pandas if not available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Days of week in the order charts display them
+DAY_ORDER = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+_DAY_INDEX = {day: index for index, day in enumerate(DAY_ORDER)}
+
+_HOUR_LABELS = [f"{hour}:00" for hour in range(24)]
+
+# SQL day-of-week numbers (0 = Sunday) to day names
+_SQL_DAY_NAMES = [
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+]
+
+# Columns that can be ranked by create_horizontal_bar_chart, mapped to SQL
+_CATEGORY_COLUMNS = {
+    "repository_name": Repository.full_name,
+    "organization_name": Organization.name,
+    "user": Interaction.user,
+}
+
+
+_TYPE_VALUES = {
+    interaction_type: interaction_type.value for interaction_type in InteractionType
+}
+
+
+# Filter keys that change which interactions are selected
+_FILTER_KEYS = (
+    "start_date",
+    "end_date",
+    "interaction_types",
+    "repositories",
+    "organizations",
+)
+
+
+def _filters_key(filters: dict[str, Any] | None) -> tuple[Any, ...] | None:
+    """Build a hashable cache key from the query-affecting filters."""
+    if not filters:
+        return None
+
+    key: list[tuple[str, Any]] = [
+        ("include_stars", bool(filters.get("include_stars", False)))
+    ]
+    for name in _FILTER_KEYS:
+        value = filters.get(name)
+        if isinstance(value, list | set | tuple):
+            value = tuple(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+T = TypeVar("T")
+
+# Interactions query types the dashboard filters: ORM queries and selects
+Q = TypeVar("Q", Query[Any], Select[*tuple[Any, ...]])
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_frame(_load: Callable[[], T], key: tuple[Any, ...]) -> T:
+    """Memoize a chart data loader on a hashable key of what it depends on."""
+    return _load()
+
+
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_figure(_build: Callable[[], go.Figure], key: tuple[Any, ...]) -> go.Figure:
+    """Memoize a built figure; figures are shared, so callers must not mutate them."""
+    return _build()
+
+
+def _frame_key(df: pd.DataFrame) -> tuple[Any, ...]:
+    """Build a cheap content key for a (usually pre-aggregated) frame."""
+    content = pd.util.hash_pandas_object(df, index=False).sum()
+    return tuple(df.columns), len(df), int(content)
+
 
-from ..models.interactions import Interaction, InteractionType
+def _memoize_figure(method: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """Cache a chart method's figure on its input frame's content and arguments."""
+
+    @wraps(method)
+    def wrapper(
+        self: Any, df: pd.DataFrame, *args: object, **kwargs: object
+    ) -> go.Figure:
+        key = (method.__name__, _frame_key(df), args, tuple(sorted(kwargs.items())))
+        return _cached_figure(lambda: method(self, df, *args, **kwargs), key)
+
+    return wrapper
+
+
+# Frame columns stored as pandas categoricals
+_CATEGORICAL_COLUMNS = [
+    "type",
+    "user",
+    "action",
+    "repository_name",
+    "organization_name",
+]
+
+_DAY_OF_WEEK_DTYPE = pd.CategoricalDtype(categories=DAY_ORDER, ordered=True)
+
+
+# Pandas period frequencies for week (Sunday-start) and month buckets
+_PERIOD_FREQUENCIES = {"week": "W-SAT", "month": "M"}
+
+
+def _period_start(timestamps: pd.Series, period: str) -> pd.Series:
+    """Truncate timestamps to the start of their week or month."""
+    return timestamps.dt.to_period(_PERIOD_FREQUENCIES[period]).dt.start_time
+
+
+def _count_by(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Count rows per group, summing a precomputed ``count`` column if present."""
+    if "count" in df.columns or len(columns) == 1:
+        grouped = df.groupby(columns, observed=True)
+        counts = grouped["count"].sum() if "count" in df.columns else grouped.size()
+        return counts.reset_index(name="count")
+
+    # Count combined integer group codes in one pass instead of a multi-key
+    # groupby; missing values get code -1 and are dropped like groupby does
+    factorized = [pd.factorize(df[column], sort=True) for column in columns]
+    codes, uniques = zip(*factorized, strict=True)
+    shape = tuple(len(values) for values in uniques)
+    valid = np.logical_and.reduce([code >= 0 for code in codes])
+    keys, counts = np.unique(
+        np.ravel_multi_index([code[valid] for code in codes], shape),
+        return_counts=True,
+    )
+    positions = np.unravel_index(keys, shape)
+    groups = {
+        column: values.take(position)
+        for column, values, position in zip(columns, uniques, positions, strict=True)
+    }
+    return pd.DataFrame({**groups, "count": counts})
 
 
 class ChartGenerator:
@@ -17,10 +191,8 @@ class ChartGenerator:
     def __init__(self, db_session: Session):
         self.db = db_session
 
-    def get_interactions_data(self, filters: dict | None = None) -> pd.DataFrame:
-        """Get interactions data as DataFrame with optional filters."""
-        query = self.db.query(Interaction)
-
+    def _apply_filters(self, query: Q, filters: dict[str, Any] | None) -> Q:
+        """Apply dashboard filters to an interactions query."""
         if filters:
             if filters.get("start_date"):
                 query = query.filter(Interaction.timestamp >= filters["start_date"])
@@ -39,35 +211,247 @@ class ChartGenerator:
             if not filters.get("include_stars", False):  # Default to exclude stars
                 query = query.filter(Interaction.type != InteractionType.STAR)
 
-        interactions = query.all()
-
-        data = []
-        for interaction in interactions:
-            data.append(
-                {
-                    "id": interaction.id,
-                    "type": interaction.type.value,
-                    "timestamp": interaction.timestamp,
-                    "user": interaction.user,
-                    "action": interaction.action,
-                    "repository_id": interaction.repository_id,
-                    "organization_id": interaction.organization_id,
-                    "repository_name": interaction.repository.full_name
-                    if interaction.repository
-                    else None,
-                    "organization_name": interaction.organization.name
-                    if interaction.organization
-                    else None,
-                    "date": interaction.timestamp.date(),
-                    "hour": interaction.timestamp.hour,
-                    "day_of_week": interaction.timestamp.strftime("%A"),
-                    "week": interaction.timestamp.strftime("%Y-W%U"),
-                    "month": interaction.timestamp.strftime("%Y-%m"),
-                }
+        return query
+
+    def _cached(self, name: str, load: Callable[[], T], *args: object) -> T:
+        """Return ``load()``, cached per database, query name, and arguments."""
+        return _cached_frame(load, (get_database_url(self.db), name, *args))
+
+    def _snapshot_frame(self, filters: dict[str, Any] | None) -> pd.DataFrame | None:
+        """Get the filtered snapshot frame, if the dashboard reads from one.
+
+        Aggregates are then counted from this frame rather than the database,
+        so every chart shows the same point in time as the raw rows.
+        """
+        if not snapshot_available():
+            return None
+        return self.get_interactions_data(filters)
+
+    def count_for_filters(self, filters: dict[str, Any] | None = None) -> int:
+        """Count interactions matching the filters, cached per filter set."""
+        return self._cached(
+            "count", lambda: self._load_count(filters), _filters_key(filters)
+        )
+
+    def _load_count(self, filters: dict[str, Any] | None) -> int:
+        """Count interactions matching the filters."""
+        df = self._snapshot_frame(filters)
+        if df is not None:
+            return len(df)
+        count: int = self._apply_filters(
+            self.db.query(func.count(Interaction.id)), filters
+        ).scalar()
+        return count
+
+    def get_interactions_data(
+        self, filters: dict[str, Any] | None = None
+    ) -> pd.DataFrame:
+        """Get interactions data as DataFrame with optional filters.
+
+        Results are cached for ``DASHBOARD_CACHE_TTL`` seconds per filter set.
+        """
+        return self._cached(
+            "interactions",
+            lambda: self._load_interactions_data(filters),
+            _filters_key(filters),
+        )
+
+    def _load_interactions_data(self, filters: dict[str, Any] | None) -> pd.DataFrame:
+        """Load interactions into a DataFrame with derived date columns.
+
+        Reads from the Parquet snapshot when one is configured, otherwise
+        queries the database.
+        """
+        df = read_interactions_snapshot(filters)
+        if df is None:
+            # Select plain columns and stream them straight into the frame,
+            # skipping ORM object construction
+            stmt = select_interaction_rows().execution_options(
+                stream_results=True, yield_per=10_000
+            )
+            result = self.db.execute(self._apply_filters(stmt, filters))
+            df = pd.DataFrame.from_records(result, columns=INTERACTION_COLUMNS)
+            df["type"] = df["type"].map(_TYPE_VALUES)
+
+        if df.empty:
+            return df
+
+        timestamps = df["timestamp"].dt
+        df["date"] = timestamps.normalize()
+        df["hour"] = timestamps.hour
+        df["day_of_week"] = timestamps.day_name()
+        df["week"] = _period_start(df["timestamp"], "week")
+        df["month"] = _period_start(df["timestamp"], "month")
+
+        # Low-cardinality labels are stored as category codes; day_of_week is
+        # ordered so it sorts Monday..Sunday without a reindex
+        for column in _CATEGORICAL_COLUMNS:
+            df[column] = df[column].astype("category")
+        df["day_of_week"] = df["day_of_week"].astype(_DAY_OF_WEEK_DTYPE)
+
+        return df
+
+    def get_time_series_counts(
+        self, groupby: str = "date", filters: dict[str, Any] | None = None
+    ) -> pd.DataFrame:
+        """Get interaction counts per time period and type, aggregated in SQL.
+
+        Rows are counted per day in the database; week and month buckets are
+        rolled up from the (small) daily result. Time buckets are datetimes
+        (the start of each period) so charts get a native date axis.
+        """
+        return self._cached(
+            "time_series",
+            lambda: self._load_time_series_counts(groupby, filters),
+            groupby,
+            _filters_key(filters),
+        )
+
+    def _load_time_series_counts(
+        self, groupby: str, filters: dict[str, Any] | None
+    ) -> pd.DataFrame:
+        """Query daily (or hourly) counts per type and roll them up to ``groupby``."""
+        df = self._snapshot_frame(filters)
+        if df is not None:
+            if df.empty:
+                return pd.DataFrame(columns=[groupby, "type", "count"])
+            return _count_by(df, [groupby, "type"])
+
+        bucket: ColumnElement[Any]
+        if groupby == "hour":
+            bucket = extract("hour", Interaction.timestamp)
+        else:
+            bucket = func.date(Interaction.timestamp)
+        query = self.db.query(bucket, Interaction.type, func.count(Interaction.id))
+        rows = (
+            self._apply_filters(query, filters).group_by(bucket, Interaction.type).all()
+        )
+        if not rows:
+            return pd.DataFrame(columns=[groupby, "type", "count"])
+
+        df = pd.DataFrame(rows, columns=["bucket", "type", "count"])
+        df["type"] = df["type"].map(_TYPE_VALUES)
+        if groupby == "hour":
+            df["hour"] = df["bucket"].astype(int)
+        else:
+            df["date"] = pd.to_datetime(df["bucket"])
+            if groupby in _PERIOD_FREQUENCIES:
+                df[groupby] = _period_start(df["date"], groupby)
+
+        return _count_by(df, [groupby, "type"])
+
+    def get_heatmap_counts(self, filters: dict[str, Any] | None = None) -> pd.DataFrame:
+        """Get interaction counts per day of week and hour, aggregated in SQL."""
+        return self._cached(
+            "heatmap",
+            lambda: self._load_heatmap_counts(filters),
+            _filters_key(filters),
+        )
+
+    def _load_heatmap_counts(self, filters: dict[str, Any] | None) -> pd.DataFrame:
+        """Query counts per day of week and hour."""
+        df = self._snapshot_frame(filters)
+        if df is not None:
+            if df.empty:
+                return pd.DataFrame(columns=["day_of_week", "hour", "count"])
+            return _count_by(df, ["day_of_week", "hour"])
+
+        dow = extract("dow", Interaction.timestamp)
+        hour = extract("hour", Interaction.timestamp)
+        query = self.db.query(dow, hour, func.count(Interaction.id))
+        rows = self._apply_filters(query, filters).group_by(dow, hour).all()
+
+        df = pd.DataFrame(rows, columns=["day_of_week", "hour", "count"])
+        df["day_of_week"] = df["day_of_week"].map(lambda d: _SQL_DAY_NAMES[int(d)])
+        df["hour"] = df["hour"].astype(int)
+        return df
+
+    def get_type_counts(self, filters: dict[str, Any] | None = None) -> pd.DataFrame:
+        """Get interaction counts per type, aggregated in SQL."""
+        return self._cached(
+            "type_counts",
+            lambda: self._load_type_counts(filters),
+            _filters_key(filters),
+        )
+
+    def _load_type_counts(self, filters: dict[str, Any] | None) -> pd.DataFrame:
+        """Query counts per interaction type."""
+        df = self._snapshot_frame(filters)
+        if df is not None:
+            return _count_by(df, ["type"])
+
+        query = self.db.query(Interaction.type, func.count(Interaction.id))
+        rows = self._apply_filters(query, filters).group_by(Interaction.type).all()
+
+        return pd.DataFrame(
+            [(interaction_type.value, count) for interaction_type, count in rows],
+            columns=["type", "count"],
+        )
+
+    def get_top_counts(
+        self,
+        category: str = "repository_name",
+        top_n: int = 15,
+        filters: dict[str, Any] | None = None,
+    ) -> pd.DataFrame:
+        """Get the top ``top_n`` values of a category by interaction count."""
+        return self._cached(
+            "top_counts",
+            lambda: self._load_top_counts(category, top_n, filters),
+            category,
+            top_n,
+            _filters_key(filters),
+        )
+
+    def _load_top_counts(
+        self, category: str, top_n: int, filters: dict[str, Any] | None
+    ) -> pd.DataFrame:
+        """Query the most frequent values of ``category``."""
+        df = self._snapshot_frame(filters)
+        if df is not None:
+            counts = _count_by(df, [category])
+            return counts.nlargest(top_n, "count").reset_index(drop=True)
+
+        column = _CATEGORY_COLUMNS[category]
+        count = func.count(Interaction.id).label("count")
+        query = self.db.query(column, count)
+        if category == "repository_name":
+            query = query.join(Repository, Interaction.repository_id == Repository.id)
+        elif category == "organization_name":
+            query = query.join(
+                Organization, Interaction.organization_id == Organization.id
             )
 
-        return pd.DataFrame(data)
+        rows = (
+            self._apply_filters(query, filters)
+            .filter(column.isnot(None))
+            .group_by(column)
+            .order_by(count.desc())
+            .limit(top_n)
+            .all()
+        )
+        return pd.DataFrame(rows, columns=[category, "count"])
+
+    def precompute(self, filters: dict[str, Any]) -> dict[str, pd.DataFrame]:
+        """Load every aggregate a dashboard render needs, once per render.
+
+        Returns frames keyed ``time_series``, ``day_hour``, ``type`` and one per
+        rankable category, ready to pass to the chart methods. Aggregates are
+        counted in SQL, or from the snapshot's rows when one is configured.
+        """
+        top_n = filters.get("top_n", 15)
+        aggregates = {
+            "time_series": self.get_time_series_counts(
+                filters.get("time_grouping", "date"), filters
+            ),
+            "day_hour": self.get_heatmap_counts(filters),
+            "type": self.get_type_counts(filters),
+        }
+        for category in _CATEGORY_COLUMNS:
+            aggregates[category] = self.get_top_counts(category, top_n, filters)
+        return aggregates
 
+    @_memoize_figure
     def create_time_series_chart(
         self, df: pd.DataFrame, groupby: str = "date"
     ) -> go.Figure:
@@ -78,7 +462,7 @@ class ChartGenerator:
             return fig
 
         # Group by time period and interaction type
-        time_series = df.groupby([groupby, "type"]).size().reset_index(name="count")
+        time_series = _count_by(df, [groupby, "type"])
 
         fig = px.bar(
             time_series,
@@ -99,6 +483,7 @@ class ChartGenerator:
 
         return fig
 
+    @_memoize_figure
     def create_stacked_bar_chart(
         self, df: pd.DataFrame, groupby: str = "date"
     ) -> go.Figure:
@@ -109,7 +494,7 @@ class ChartGenerator:
             return fig
 
         # Group by time period and interaction type
-        stacked_data = df.groupby([groupby, "type"]).size().reset_index(name="count")
+        stacked_data = _count_by(df, [groupby, "type"])
 
         fig = px.bar(
             stacked_data,
@@ -129,6 +514,7 @@ class ChartGenerator:
 
         return fig
 
+    @_memoize_figure
     def create_horizontal_bar_chart(
         self, df: pd.DataFrame, category: str = "repository_name", top_n: int = 15
     ) -> go.Figure:
@@ -138,15 +524,13 @@ class ChartGenerator:
             fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
             return fig
 
-        # Filter out None values and count interactions
-        filtered_df = df[df[category].notna()]
-        if filtered_df.empty:
+        # Count interactions per value; groupby already drops None values
+        counts = _count_by(df, [category]).set_index(category)["count"].nlargest(top_n)
+        if counts.empty:
             fig = go.Figure()
             fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
             return fig
 
-        counts = filtered_df[category].value_counts().head(top_n)
-
         fig = go.Figure(
             go.Bar(
                 x=counts.values,
@@ -165,8 +549,14 @@ class ChartGenerator:
 
         return fig
 
-    def create_metrics_cards(self, df: pd.DataFrame) -> dict[str, any]:
-        """Create metrics cards with key statistics."""
+    def create_metrics_cards(
+        self, df: pd.DataFrame, day_hour_counts: pd.DataFrame | None = None
+    ) -> dict[str, any]:
+        """Create metrics cards with key statistics.
+
+        If precomputed ``day_hour_counts`` are given, the most active day is
+        read from them instead of recounting the raw rows.
+        """
         if df.empty:
             return {
                 "total_interactions": 0,
@@ -193,7 +583,11 @@ class ChartGenerator:
             date_range = "Unknown"
 
         # Most active day
-        if "day_of_week" in df.columns:
+        if day_hour_counts is not None and not day_hour_counts.empty:
+            most_active_day = (
+                day_hour_counts.groupby("day_of_week")["count"].sum().idxmax()
+            )
+        elif "day_of_week" in df.columns:
             most_active_day = df["day_of_week"].value_counts().index[0]
         else:
             most_active_day = "Unknown"
@@ -201,15 +595,20 @@ class ChartGenerator:
         # Growth rate (last 7 days vs previous 7 days)
         growth_rate = 0
         if "timestamp" in df.columns and len(df) > 0:
-            now = datetime.now()
-            last_week = df[df["timestamp"] >= (now - timedelta(days=7))]
-            prev_week = df[
-                (df["timestamp"] >= (now - timedelta(days=14)))
-                & (df["timestamp"] < (now - timedelta(days=7)))
-            ]
+            # Count directly on the timestamp array rather than slicing frames
+            timestamps = df["timestamp"].to_numpy()
+            now = np.datetime64(datetime.now())
+            week_start = now - np.timedelta64(7, "D")
+            prev_week_start = now - np.timedelta64(14, "D")
+            last_week = int(np.count_nonzero(timestamps >= week_start))
+            prev_week = int(
+                np.count_nonzero(
+                    (timestamps >= prev_week_start) & (timestamps < week_start)
+                )
+            )
 
-            if len(prev_week) > 0:
-                growth_rate = ((len(last_week) - len(prev_week)) / len(prev_week)) * 100
+            if prev_week > 0:
+                growth_rate = ((last_week - prev_week) / prev_week) * 100
 
         return {
             "total_interactions": total_interactions,
@@ -220,44 +619,37 @@ class ChartGenerator:
             "growth_rate": round(growth_rate, 1),
         }
 
+    @_memoize_figure
     def create_heatmap(self, df: pd.DataFrame) -> go.Figure:
         """Create heatmap showing activity patterns by day of week and hour."""
-        if df.empty or "timestamp" not in df.columns:
+        if df.empty or not {"timestamp", "count"} & set(df.columns):
             fig = go.Figure()
             fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
             return fig
 
-        # Create hour and day of week columns if not present
-        if "hour" not in df.columns:
-            df["hour"] = df["timestamp"].dt.hour
-        if "day_of_week" not in df.columns:
-            df["day_of_week"] = df["timestamp"].dt.strftime("%A")
-
-        # Create pivot table for heatmap
-        heatmap_data = (
-            df.groupby(["day_of_week", "hour"]).size().reset_index(name="count")
+        # Count straight into a Monday-first 7x24 day/hour grid: bincount over
+        # the flattened cell index is a single compiled pass
+        if "count" in df.columns:
+            days = df["day_of_week"].map(_DAY_INDEX).to_numpy(dtype=np.int64)
+            hours = df["hour"].to_numpy(dtype=np.int64)
+            weights = df["count"].to_numpy()
+        else:
+            timestamps = pd.DatetimeIndex(df["timestamp"])
+            days = timestamps.dayofweek.to_numpy(dtype=np.int64)
+            hours = timestamps.hour.to_numpy(dtype=np.int64)
+            weights = None
+
+        grid = (
+            np.bincount(days * 24 + hours, weights=weights, minlength=7 * 24)
+            .astype(np.int64)
+            .reshape(7, 24)
         )
-        pivot_table = heatmap_data.pivot(
-            index="day_of_week", columns="hour", values="count"
-        ).fillna(0)
-
-        # Reorder days of week
-        day_order = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        pivot_table = pivot_table.reindex(day_order)
 
         fig = go.Figure(
             data=go.Heatmap(
-                z=pivot_table.values,
-                x=[f"{h}:00" for h in pivot_table.columns],
-                y=pivot_table.index,
+                z=grid,
+                x=_HOUR_LABELS,
+                y=DAY_ORDER,
                 colorscale="Blues",
                 hoverongaps=False,
             )
@@ -271,6 +663,7 @@ class ChartGenerator:
 
         return fig
 
+    @_memoize_figure
     def create_interaction_type_pie(self, df: pd.DataFrame) -> go.Figure:
         """Create pie chart showing distribution of meaningful interaction types."""
         if df.empty or "type" not in df.columns:
@@ -280,13 +673,19 @@ class ChartGenerator:
 
         # Filter out less meaningful interaction types for cleaner visualization
         filtered_df = df[~df["type"].isin(["api_call", "fork", "workflow_run"])]
-        
+
         if filtered_df.empty:
             fig = go.Figure()
-            fig.add_annotation(text="No meaningful interaction data", x=0.5, y=0.5, showarrow=False)
+            fig.add_annotation(
+                text="No meaningful interaction data", x=0.5, y=0.5, showarrow=False
+            )
             return fig
 
-        type_counts = filtered_df["type"].value_counts()
+        type_counts = (
+            _count_by(filtered_df, ["type"])
+            .set_index("type")["count"]
+            .sort_values(ascending=False)
+        )
 
         fig = go.Figure(
             data=[go.Pie(labels=type_counts.index, values=type_counts.values, hole=0.3)]
@@ -325,11 +724,17 @@ def display_metrics_cards(metrics: dict[str, any]):
     st.caption(f"Data range: {metrics['date_range']}")
 
 
-def export_to_csv(df: pd.DataFrame, filename: str = None) -> str:
-    """Export DataFrame to CSV and return download link."""
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"github_stats_export_{timestamp}.csv"
-
-    csv_data = df.to_csv(index=False)
-    return csv_data
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def export_to_csv(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV bytes for download.
+
+    Uses the PyArrow CSV writer when available. Results are cached per
+    DataFrame, so reruns with the same data skip serialization.
+    """
+    if PYARROW_AVAILABLE:
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+        csv: bytes = buffer.getvalue().to_pybytes()
+    else:
+        csv = df.to_csv(index=False).encode()
+    return csv
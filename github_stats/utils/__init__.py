@@ -1,7 +1,14 @@
 """Utility modules for GitHub Stats."""
 
 from .config import get_settings, setup_logging
-from .database import check_db_has_data, get_db, get_db_engine, get_db_session, init_db
+from .database import (
+    check_db_has_data,
+    get_database_url,
+    get_db,
+    get_db_engine,
+    get_db_session,
+    init_db,
+)
 
 __all__ = [
     "get_settings",
@@ -11,4 +18,5 @@ __all__ = [
     "get_db",
     "init_db",
     "check_db_has_data",
+    "get_database_url",
 ]
@@ -13,6 +13,9 @@ class Settings(BaseSettings):
     database_url: str = Field("sqlite:///./github_stats.db", env="DATABASE_URL")
     log_level: str = Field("WARNING", env="LOG_LEVEL")
 
+    # Dashboard reads interactions from this Parquet snapshot when it exists
+    interactions_snapshot: str | None = Field(None, env="INTERACTIONS_SNAPSHOT")
+
     # Email configuration
     smtp_server: str | None = Field(None, env="SMTP_SERVER")
     smtp_port: int = Field(587, env="SMTP_PORT")
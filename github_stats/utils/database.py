@@ -2,28 +2,97 @@
 
 from collections.abc import Generator
 from contextlib import contextmanager
-
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from sqlalchemy import (
+    Index,
+    Table,
+    and_,
+    create_engine,
+    delete,
+    event,
+    func,
+    inspect,
+    make_url,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from ..constants import DB_POOL_RECYCLE
 from ..models.base import Base
 from .config import get_settings
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns with orjson instead of the stdlib encoder."""
+    return orjson.dumps(value).decode()
+
+
+@lru_cache
+def _create_engine(database_url: str, echo: bool) -> Engine:
+    """Create the process-wide engine (and connection pool) for a database URL."""
+    kwargs: dict[str, Any] = {}
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # Pooled connections are shared across Streamlit's script threads
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # Keep the single in-memory database alive across sessions
+            kwargs["poolclass"] = StaticPool
+    else:
+        # Keep the warm pool usable after server restarts and idle timeouts
+        kwargs["pool_pre_ping"] = True
+        kwargs["pool_recycle"] = DB_POOL_RECYCLE
+
+    engine = create_engine(
+        database_url,
+        echo=echo,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        **kwargs,
+    )
+    if url.get_backend_name() == "sqlite":
+        _emit_sqlite_begin(engine)
+    return engine
+
+
+def _emit_sqlite_begin(engine: Engine) -> None:
+    """Have SQLAlchemy, rather than pysqlite, begin SQLite transactions.
+
+    pysqlite defers BEGIN until the first write, so a SAVEPOINT issued before
+    any write opens the transaction itself and releasing it commits. Beginning
+    transactions explicitly keeps ``Session.begin_nested()`` scopes nested.
+    """
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_begin(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection: Any) -> None:
+        # Issued on the driver connection so it is not counted as a query
+        connection.connection.driver_connection.execute("BEGIN")
+
+
+@lru_cache
+def _create_session_factory(engine: Engine) -> sessionmaker[Session]:
+    """Create the session factory bound to an engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
 def get_db_engine() -> Engine:
-    """Create and return database engine."""
+    """Return the shared database engine for the configured database URL."""
     settings = get_settings()
-    return create_engine(
-        settings.database_url,
-        echo=settings.log_level == "DEBUG",
-    )
+    return _create_engine(settings.database_url, settings.log_level == "DEBUG")
 
 
 def get_db_session() -> sessionmaker[Session]:
-    """Get database session factory."""
-    engine = get_db_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    """Get the shared database session factory."""
+    return _create_session_factory(get_db_engine())
 
 
 @contextmanager
@@ -41,6 +110,11 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_database_url(session: Session) -> str:
+    """Identify the database a session is bound to, for keying caches on it."""
+    return str(session.get_bind().engine.url)
+
+
 def check_db_has_data() -> dict[str, int]:
     """Check if database has existing data.
 
@@ -49,13 +123,25 @@ def check_db_has_data() -> dict[str, int]:
     """
     from ..models.interactions import Interaction, Organization, Repository
 
-    counts = {"organizations": 0, "repositories": 0, "interactions": 0}
+    models = {
+        "organizations": Organization,
+        "repositories": Repository,
+        "interactions": Interaction,
+    }
+    counts = dict.fromkeys(models, 0)
 
     try:
         with get_db() as db:
-            counts["organizations"] = db.query(Organization).count()
-            counts["repositories"] = db.query(Repository).count()
-            counts["interactions"] = db.query(Interaction).count()
+            # One round trip: each count is a scalar subquery of a single SELECT
+            row = db.execute(
+                select(
+                    *(
+                        select(func.count()).select_from(model).scalar_subquery()
+                        for model in models.values()
+                    )
+                )
+            ).one()
+            counts.update(zip(models, row, strict=True))
     except Exception:
         # Database doesn't exist yet or has no tables
         pass
@@ -63,7 +149,32 @@ def check_db_has_data() -> dict[str, int]:
     return counts
 
 
+def _delete_duplicate_rows(connection: Connection, table: Table, index: Index) -> None:
+    """Delete rows that would violate a unique index, keeping the newest.
+
+    Rows with a NULL in any indexed column never conflict and are kept.
+    """
+    columns = list(index.columns)
+    not_null = and_(*(column.isnot(None) for column in columns))
+    newest = select(func.max(table.c.id)).where(not_null).group_by(*columns)
+    connection.execute(delete(table).where(not_null, table.c.id.not_in(newest)))
+
+
 def init_db() -> None:
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     engine = get_db_engine()
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so add any indexes that
+    # were introduced after an existing database was created. Rows stored
+    # before a unique index existed may repeat, so those are removed first.
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                if index.unique:
+                    _delete_duplicate_rows(connection, table, index)
+                index.create(bind=connection)
@@ -0,0 +1,135 @@
+"""Parquet snapshots of the interactions table for read-heavy dashboards."""
+
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import Select, select
+
+from ..models.interactions import Interaction, Organization, Repository
+from .config import get_settings
+from .database import get_db_engine
+
+# Try to import pyarrow, snapshots are disabled if not available
+try:
+    import pyarrow.parquet  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Columns of an interactions frame, in order
+INTERACTION_COLUMNS = [
+    "id",
+    "type",
+    "timestamp",
+    "user",
+    "action",
+    "repository_id",
+    "organization_id",
+    "repository_name",
+    "organization_name",
+]
+
+SNAPSHOT_ROW_GROUP_SIZE = 100_000
+
+
+def select_interaction_rows() -> Select[*tuple[Any, ...]]:
+    """Select interaction columns with repository and organization names joined."""
+    return (
+        select(
+            Interaction.id,
+            Interaction.type,
+            Interaction.timestamp,
+            Interaction.user,
+            Interaction.action,
+            Interaction.repository_id,
+            Interaction.organization_id,
+            Repository.full_name,
+            Organization.name,
+        )
+        .select_from(Interaction)
+        .outerjoin(Repository, Interaction.repository_id == Repository.id)
+        .outerjoin(Organization, Interaction.organization_id == Organization.id)
+    )
+
+
+def get_snapshot_path() -> Path | None:
+    """Get the configured snapshot path, if snapshots are enabled."""
+    path = get_settings().interactions_snapshot
+    return Path(path) if path else None
+
+
+def snapshot_available() -> bool:
+    """Check whether the dashboard reads interactions from a snapshot."""
+    path = get_snapshot_path()
+    return PYARROW_AVAILABLE and path is not None and path.exists()
+
+
+def write_interactions_snapshot(path: str | Path | None = None) -> int:
+    """Write the interactions table to a Parquet snapshot.
+
+    Rows are sorted by timestamp so date-range filters can skip whole row
+    groups when the snapshot is read back.
+
+    Args:
+        path: Destination file, defaults to the configured snapshot path
+
+    Returns:
+        Number of interactions written
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to write interaction snapshots")
+
+    path = Path(path) if path else get_snapshot_path()
+    if path is None:
+        raise ValueError("No snapshot path given and INTERACTIONS_SNAPSHOT is not set")
+
+    stmt = select_interaction_rows().order_by(Interaction.timestamp)
+    with get_db_engine().connect() as connection:
+        df = pd.DataFrame.from_records(
+            connection.execute(stmt), columns=INTERACTION_COLUMNS
+        )
+    df["type"] = df["type"].map(attrgetter("value"))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(
+        path,
+        index=False,
+        compression="zstd",
+        row_group_size=SNAPSHOT_ROW_GROUP_SIZE,
+    )
+    return len(df)
+
+
+def read_interactions_snapshot(
+    filters: dict[str, Any] | None = None,
+) -> pd.DataFrame | None:
+    """Read filtered interactions from the configured snapshot.
+
+    Filters are pushed down to the Parquet reader, matching the dashboard's
+    SQL filters. Returns None when no snapshot is configured or available.
+    """
+    if not snapshot_available():
+        return None
+
+    predicates = []
+    if filters:
+        if filters.get("start_date"):
+            predicates.append(("timestamp", ">=", pd.Timestamp(filters["start_date"])))
+        if filters.get("end_date"):
+            predicates.append(("timestamp", "<=", pd.Timestamp(filters["end_date"])))
+        if filters.get("interaction_types"):
+            types = [t.value for t in filters["interaction_types"]]
+            predicates.append(("type", "in", types))
+        if filters.get("repositories"):
+            predicates.append(("repository_id", "in", list(filters["repositories"])))
+        if filters.get("organizations"):
+            predicates.append(("organization_id", "in", list(filters["organizations"])))
+        if not filters.get("include_stars", False):  # Default to exclude stars
+            predicates.append(("type", "!=", "star"))
+
+    return pd.read_parquet(
+        get_snapshot_path(), columns=INTERACTION_COLUMNS, filters=predicates or None
+    )
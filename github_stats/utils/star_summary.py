@@ -1,30 +1,43 @@
 """Utility to create star count summaries from GitHub API without individual timestamps."""
 
-from github_stats.models.interactions import Repository
+from contextlib import nullcontext
+
+from github_stats.api import GitHubClient
+from github_stats.models.interactions import Organization, Repository
 from github_stats.utils.database import get_db
 
 
-def get_star_counts_by_repository() -> list[dict[str, any]]:
-    """Get current star counts for tracked repositories."""
+def get_star_counts_by_repository(
+    client: GitHubClient | None = None,
+) -> list[dict[str, any]]:
+    """Get current star counts for tracked repositories.
+
+    Repository details are fetched from ``GET /repos/{owner}/{repo}``
+    concurrently rather than one request at a time.
+    """
     with get_db() as session:
-        repos = session.query(Repository).all()
-
-        star_data = []
-        for repo in repos:
-            # In a real implementation, you'd call GitHub API here to get current star count
-            # For now, we'll note that this would need to be implemented
-            star_data.append(
-                {
-                    "repository": repo.full_name,
-                    "organization": repo.organization.name
-                    if repo.organization
-                    else None,
-                    "stars": 0,  # Would be fetched from GitHub API
-                    "note": "Star count would be fetched from GitHub API /repos/{owner}/{repo} endpoint",
-                }
-            )
-
-        return star_data
+        repos = (
+            session.query(Repository.full_name, Organization.name)
+            .outerjoin(Organization, Repository.organization_id == Organization.id)
+            .all()
+        )
+
+    # Close the HTTP client only if it was created here
+    with nullcontext(client) if client else GitHubClient() as github:
+        details = github.get_repositories([full_name for full_name, _ in repos])
+
+    star_data = []
+    for full_name, organization in repos:
+        repo_data = details.get(full_name)
+        star_data.append(
+            {
+                "repository": full_name,
+                "organization": organization,
+                "stars": repo_data.get("stargazers_count", 0) if repo_data else None,
+            }
+        )
+
+    return star_data
 
 
 def create_star_summary_display() -> str:
@@ -35,8 +48,8 @@ def create_star_summary_display() -> str:
     Stars don't have individual timestamps in the GitHub API response, so they're tracked
     as current counts rather than individual interaction events.
 
-    To get current star counts, the application would need to call:
-    `GET /repos/{owner}/{repo}` and use the `stargazers_count` field.
+    Current star counts are read from the `stargazers_count` field of
+    `GET /repos/{owner}/{repo}`, fetched concurrently for all tracked repositories.
 
     This provides more accurate data than synthetic timestamps.
     """
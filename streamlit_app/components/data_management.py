@@ -1,317 +1,676 @@
 """Data management page for tracking organizations and repositories."""
 
+from datetime import datetime
+
+import pandas as pd
 import streamlit as st
-from sqlalchemy import func
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.orm import Session
 
-from github_stats.models.interactions import Interaction, Organization, Repository
+from github_stats.constants import DATA_MANAGEMENT_CACHE_TTL
+from github_stats.models.interactions import (
+    Interaction,
+    Organization,
+    Repository,
+    SyncCursor,
+)
 from github_stats.tracking.tracker import InteractionTracker
-from github_stats.api.client import GitHubClient
-from github_stats.utils.database import get_db
+from github_stats.utils.database import check_db_has_data, get_db
 
+# Panels rerun on their own with st.fragment (Streamlit 1.37+); older
+# versions rerun the whole page
+fragment = getattr(st, "fragment", lambda func: func)
+
+
+@st.cache_resource(show_spinner=False)
+def get_tracker() -> InteractionTracker:
+    """Get a tracker shared across reruns, reusing its GitHub HTTP connections."""
+    return InteractionTracker()
 
-def show():
-    """Display the data management interface."""
-    st.header("🗄️ Data Management")
-    st.markdown("Manage tracked organizations and repositories")
+
+@st.cache_data(ttl=DATA_MANAGEMENT_CACHE_TTL, show_spinner=False)
+def load_tracking_data() -> dict:
+    """Load the read-only statistics and listings shown on this page.
+
+    Cached across reruns; handlers that change tracked data call
+    ``record_change`` so the next run reloads it.
+    """
+    # Totals, all three counts in one round trip
+    counts = check_db_has_data()
 
     with get_db() as session:
-        # Current tracking status
-        st.subheader("📊 Current Tracking Status")
-        
-        # Get statistics
-        total_orgs = session.query(Organization).count()
-        total_repos = session.query(Repository).count()
-        total_interactions = session.query(Interaction).count()
-        
+        # Each listing is one query: rows joined to pre-aggregated counts
+        org_repos = (
+            select(Repository.organization_id, func.count().label("repo_count"))
+            .group_by(Repository.organization_id)
+            .subquery()
+        )
+        org_interactions = (
+            select(
+                Interaction.organization_id,
+                func.count().label("interaction_count"),
+            )
+            .group_by(Interaction.organization_id)
+            .subquery()
+        )
+        organizations = [
+            row._asdict()
+            for row in session.execute(
+                select(
+                    Organization.id,
+                    Organization.name,
+                    Organization.last_synced_at,
+                    func.coalesce(org_repos.c.repo_count, 0).label("repo_count"),
+                    func.coalesce(org_interactions.c.interaction_count, 0).label(
+                        "interaction_count"
+                    ),
+                )
+                .outerjoin(org_repos, org_repos.c.organization_id == Organization.id)
+                .outerjoin(
+                    org_interactions,
+                    org_interactions.c.organization_id == Organization.id,
+                )
+                .order_by(Organization.id)
+            )
+        ]
+
+        repo_activity = (
+            select(
+                Interaction.repository_id,
+                func.count().label("interaction_count"),
+                func.max(Interaction.timestamp).label("last_activity"),
+            )
+            .group_by(Interaction.repository_id)
+            .subquery()
+        )
+        repositories = [
+            row._asdict()
+            for row in session.execute(
+                select(
+                    Repository.id,
+                    Repository.full_name,
+                    Organization.name.label("organization_name"),
+                    Repository.last_synced_at,
+                    func.coalesce(repo_activity.c.interaction_count, 0).label(
+                        "interaction_count"
+                    ),
+                    repo_activity.c.last_activity,
+                )
+                .outerjoin(Organization, Repository.organization_id == Organization.id)
+                .outerjoin(
+                    repo_activity, repo_activity.c.repository_id == Repository.id
+                )
+                .order_by(Repository.id)
+            )
+        ]
+
+        # Freshness and data quality counts in a single scan of interactions
+        latest_interaction, missing_timestamps, missing_users, orphaned = (
+            session.execute(
+                select(
+                    func.max(Interaction.timestamp),
+                    func.count(case((Interaction.timestamp.is_(None), 1))),
+                    func.count(case((Interaction.user.is_(None), 1))),
+                    func.count(
+                        case(
+                            (
+                                and_(
+                                    Interaction.repository_id.is_(None),
+                                    Interaction.organization_id.is_(None),
+                                ),
+                                1,
+                            )
+                        )
+                    ),
+                )
+            ).one()
+        )
+
+    return {
+        "total_orgs": counts["organizations"],
+        "total_repos": counts["repositories"],
+        "total_interactions": counts["interactions"],
+        "organizations": organizations,
+        "repositories": repositories,
+        "latest_interaction": latest_interaction,
+        "missing_timestamps": missing_timestamps,
+        "missing_users": missing_users,
+        "orphaned": orphaned,
+    }
+
+
+def show_notices(kind: str) -> None:
+    """Render the messages left by the last change made in a panel."""
+    for level, message in st.session_state.pop(f"{kind}_notices", []):
+        getattr(st, level)(message)
+
+
+def record_change(kind: str, notices: list[tuple[str, str]]) -> None:
+    """Invalidate the page data after a handler changed tracked data.
+
+    Handlers are ``on_click`` callbacks, which run before the panel reruns,
+    so the panel loads fresh data without forcing another rerun.
+
+    Args:
+        kind: Panel the change was made in, "orgs" or "repos"
+        notices: Streamlit message function name and text pairs to show
+            in that panel when it reruns
+    """
+    st.session_state[f"{kind}_notices"] = notices
+    load_tracking_data.clear()
+
+
+def show_pending_delete(kind: str, rows: list[dict]) -> bool:
+    """Render only the confirmation for a pending delete of ``kind``, if any.
+
+    Returns:
+        True if a confirmation was rendered and the rest of the panel should
+        be skipped
+    """
+    state_key = f"confirm_delete_{kind}"
+    ids = st.session_state.get(state_key)
+    if not ids:
+        return False
+
+    delete_rows, name_key, label = DELETE_ACTIONS[kind]
+    names = ", ".join(row[name_key] for row in rows if row["id"] in ids)
+    st.warning(f"⚠️ Delete {len(ids)} {label}: **{names}**? This cannot be undone.")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button(
+            "✅ Confirm",
+            key=f"confirm_{kind}",
+            on_click=confirm_delete,
+            args=(kind, delete_rows, ids, label, names),
+        )
+    with col2:
+        st.button(
+            "✖️ Cancel",
+            key=f"cancel_{kind}",
+            on_click=st.session_state.pop,
+            args=(state_key, None),
+        )
+    return True
+
+
+def request_delete(kind: str, ids: list[int]) -> None:
+    """Mark rows for deletion so the next run renders the confirmation."""
+    st.session_state[f"confirm_delete_{kind}"] = ids
+
+
+def confirm_delete(
+    kind: str, delete_rows, ids: list[int], label: str, names: str
+) -> None:
+    """Delete the pending rows before the panel runs again."""
+    try:
+        with get_db() as session:
+            delete_rows(session, ids)
+    except Exception as e:
+        st.session_state[f"{kind}_notices"] = [("error", f"❌ Delete failed: {e}")]
+        return
+    del st.session_state[f"confirm_delete_{kind}"]
+    record_change(kind, [("success", f"✅ Deleted {label}: {names}")])
+
+
+def delete_organizations(session: Session, ids: list[int]) -> None:
+    """Delete organizations and their interactions with bulk statements.
+
+    Their repositories are kept and become unaffiliated.
+    """
+    session.execute(delete(Interaction).where(Interaction.organization_id.in_(ids)))
+    session.execute(
+        update(Repository)
+        .where(Repository.organization_id.in_(ids))
+        .values(organization_id=None)
+    )
+    session.execute(delete(Organization).where(Organization.id.in_(ids)))
+
+
+def delete_repositories(session: Session, ids: list[int]) -> None:
+    """Delete repositories with their interactions and sync cursors using bulk statements."""
+    session.execute(delete(Interaction).where(Interaction.repository_id.in_(ids)))
+    session.execute(delete(SyncCursor).where(SyncCursor.repository_id.in_(ids)))
+    session.execute(delete(Repository).where(Repository.id.in_(ids)))
+
+
+# Bulk delete, name column and label per kind of pending delete
+DELETE_ACTIONS = {
+    "orgs": (delete_organizations, "name", "organization(s)"),
+    "repos": (delete_repositories, "full_name", "repository(ies)"),
+}
+
+
+def sync_all_repositories(
+    tracker: InteractionTracker, org_name: str
+) -> tuple[int, int] | None:
+    """Track an organization and every one of its repositories.
+
+    Returns:
+        Number of repositories and interactions tracked, or None if the
+        organization does not exist on GitHub
+    """
+    # Track organization first
+    org_result = tracker.track_organization(org_name)
+    if not org_result["exists"]:
+        return None
+
+    # Get all repositories for this organization
+    repos = tracker.client.list_organization_repos(org_name)
+    tracked_repos = 0
+    total_interactions = 0
+
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    for i, repo in enumerate(repos):
+        status_text.text(f"Tracking {repo['full_name']}... ({i + 1}/{len(repos)})")
+        progress_bar.progress((i + 1) / len(repos))
+
+        repo_info = tracker.track_repository(repo["full_name"], org_name)
+
+        if repo_info["exists"]:
+            owner, repo_name = repo["full_name"].split("/")
+
+            # Track all interaction types concurrently
+            tracked = tracker.track_all_interactions(owner, repo_name)
+
+            total_interactions += sum(tracked.values())
+            tracked_repos += 1
+
+    progress_bar.empty()
+    status_text.empty()
+    return tracked_repos, total_interactions
+
+
+def add_organization() -> None:
+    """Track the organization named in the panel's input."""
+    name = st.session_state["new_org_input"]
+    try:
+        with st.spinner(f"Adding organization '{name}'..."):
+            result = get_tracker().track_organization(name)
+    except Exception as e:
+        st.session_state["orgs_notices"] = [
+            ("error", f"❌ Failed to add organization: {e}")
+        ]
+        return
+
+    if result["exists"]:
+        notice = ("success", f"✅ Successfully added organization: {name}")
+    else:
+        notice = (
+            "warning",
+            f"⚠️ Organization '{name}' added but may not exist on GitHub",
+        )
+    record_change("orgs", [notice])
+
+
+def sync_organizations(orgs: list[dict]) -> None:
+    """Re-track the selected organizations."""
+    try:
+        tracker = get_tracker()
+        for org in orgs:
+            with st.spinner(f"Syncing {org['name']}..."):
+                tracker.track_organization(org["name"])
+    except Exception as e:
+        notices = [("error", f"❌ Sync failed: {e}")]
+    else:
+        notices = [("success", f"✅ Synced {len(orgs)} organization(s)")]
+    record_change("orgs", notices)
+
+
+def sync_all_organizations(orgs: list[dict]) -> None:
+    """Track the selected organizations and all of their repositories."""
+    notices = []
+    try:
+        tracker = get_tracker()
+        for org in orgs:
+            with st.spinner(f"Fetching all repositories from {org['name']}..."):
+                synced = sync_all_repositories(tracker, org["name"])
+            if synced is None:
+                notices.append(
+                    ("error", f"❌ Organization {org['name']} not found on GitHub")
+                )
+            else:
+                tracked_repos, total_interactions = synced
+                notices.append(
+                    (
+                        "success",
+                        f"✅ Synced all {tracked_repos} repositories from {org['name']} ({total_interactions:,} total interactions)",
+                    )
+                )
+    except Exception as e:
+        notices.append(("error", f"❌ Sync All failed: {e}"))
+    # Organizations synced before a failure were still stored
+    record_change("orgs", notices)
+
+
+@fragment
+def show_organizations():
+    """Display the tracked organizations panel."""
+    data = load_tracking_data()
+
+    # Organizations management
+    st.subheader("🏢 Organizations")
+    show_notices("orgs")
+    st.metric("Tracked Organizations", data["total_orgs"])
+
+    # A pending delete renders just its confirmation, not the panel
+    if show_pending_delete("orgs", data["organizations"]):
+        return
+
+    # Add new organization
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        new_org_name = st.text_input(
+            "Organization name (e.g., 'microsoft', 'google'):", key="new_org_input"
+        )
+    with col2:
+        st.markdown("<br>", unsafe_allow_html=True)  # Add spacing to align with input
+        st.button(
+            "➕ Add Organization", disabled=not new_org_name, on_click=add_organization
+        )
+
+    # List current organizations in one table; actions apply to selected rows
+    organizations = data["organizations"]
+
+    if organizations:
+        st.markdown("**Tracked Organizations:**")
+        org_table = st.data_editor(
+            pd.DataFrame(organizations).assign(selected=False),
+            column_order=[
+                "selected",
+                "name",
+                "repo_count",
+                "interaction_count",
+                "last_synced_at",
+            ],
+            column_config={
+                "selected": st.column_config.CheckboxColumn("Select"),
+                "name": "Organization",
+                "repo_count": "Repositories",
+                "interaction_count": "Interactions",
+                "last_synced_at": st.column_config.DatetimeColumn(
+                    "Last synced", format="YYYY-MM-DD HH:mm"
+                ),
+            },
+            disabled=["name", "repo_count", "interaction_count", "last_synced_at"],
+            hide_index=True,
+            use_container_width=True,
+            key="org_table",
+        )
+        selected_orgs = org_table.loc[org_table["selected"], ["id", "name"]].to_dict(
+            "records"
+        )
+
         col1, col2, col3 = st.columns(3)
+
         with col1:
-            st.metric("Tracked Organizations", total_orgs)
+            st.button(
+                "🔄 Sync",
+                key="sync_orgs",
+                disabled=not selected_orgs,
+                on_click=sync_organizations,
+                args=(selected_orgs,),
+            )
+
         with col2:
-            st.metric("Tracked Repositories", total_repos)
+            st.button(
+                "🔄🔄 Sync All",
+                key="sync_all_orgs",
+                disabled=not selected_orgs,
+                on_click=sync_all_organizations,
+                args=(selected_orgs,),
+            )
+
         with col3:
-            st.metric("Total Interactions", total_interactions)
-        
-        st.markdown("---")
-        
-        # Organizations management
-        st.subheader("🏢 Organizations")
-        
-        # Add new organization
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            new_org_name = st.text_input("Organization name (e.g., 'microsoft', 'google'):", key="new_org_input")
-        with col2:
-            st.markdown("<br>", unsafe_allow_html=True)  # Add spacing to align with input
-            if st.button("➕ Add Organization", disabled=not new_org_name):
-                try:
-                    tracker = InteractionTracker()
-                    with st.spinner(f"Adding organization '{new_org_name}'..."):
-                        result = tracker.track_organization(new_org_name)
-                        if result["exists"]:
-                            st.success(f"✅ Successfully added organization: {new_org_name}")
-                        else:
-                            st.warning(f"⚠️ Organization '{new_org_name}' added but may not exist on GitHub")
-                        st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Failed to add organization: {str(e)}")
-        
-        # List current organizations
-        organizations = session.query(Organization).all()
-        
-        if organizations:
-            st.markdown("**Tracked Organizations:**")
-            for org in organizations:
-                repo_count = session.query(Repository).filter_by(organization_id=org.id).count()
-                interaction_count = session.query(Interaction).filter_by(organization_id=org.id).count()
-                last_synced = org.last_synced_at.strftime("%Y-%m-%d %H:%M") if org.last_synced_at else "Never"
-                
-                col1, col2, col3, col4, col5 = st.columns([2.5, 0.8, 0.8, 0.8, 1])
-                
-                with col1:
-                    st.write(f"**{org.name}** - {repo_count} repos, {interaction_count} interactions")
-                    st.caption(f"Last synced: {last_synced}")
-                
-                with col2:
-                    if st.button("🔄 Sync", key=f"sync_org_{org.id}"):
-                        try:
-                            tracker = InteractionTracker()
-                            with st.spinner(f"Syncing {org.name}..."):
-                                result = tracker.track_organization(org.name)
-                                st.success(f"✅ Synced {org.name}")
-                                st.rerun()
-                        except Exception as e:
-                            st.error(f"❌ Sync failed: {str(e)}")
-                
-                with col3:
-                    if st.button("🔄🔄 Sync All", key=f"sync_all_org_{org.id}"):
-                        try:
-                            with GitHubClient() as client:
-                                tracker = InteractionTracker(client)
-                                with st.spinner(f"Fetching all repositories from {org.name}..."):
-                                    # Track organization first
-                                    org_result = tracker.track_organization(org.name)
-                                    
-                                    if org_result["exists"]:
-                                        # Get all repositories for this organization
-                                        repos = client.list_organization_repos(org.name)
-                                        tracked_repos = 0
-                                        total_interactions = 0
-                                        
-                                        progress_bar = st.progress(0)
-                                        status_text = st.empty()
-                                        
-                                        for i, repo in enumerate(repos):
-                                            status_text.text(f"Tracking {repo['full_name']}... ({i+1}/{len(repos)})")
-                                            progress_bar.progress((i + 1) / len(repos))
-                                            
-                                            repo_info = tracker.track_repository(repo["full_name"], org.name)
-                                            
-                                            if repo_info["exists"]:
-                                                owner, repo_name = repo["full_name"].split("/")
-                                                
-                                                # Track all interaction types
-                                                commits = tracker.track_commits(owner, repo_name)
-                                                issues = tracker.track_issues(owner, repo_name)
-                                                prs = tracker.track_pull_requests(owner, repo_name)
-                                                stars = tracker.track_stargazers(owner, repo_name)
-                                                forks = tracker.track_forks(owner, repo_name)
-                                                releases = tracker.track_releases(owner, repo_name)
-                                                workflows = tracker.track_workflow_runs(owner, repo_name)
-                                                
-                                                repo_interactions = (
-                                                    len(commits) + len(issues) + len(prs) + 
-                                                    len(stars) + len(forks) + len(releases) + len(workflows)
-                                                )
-                                                total_interactions += repo_interactions
-                                                tracked_repos += 1
-                                        
-                                        progress_bar.empty()
-                                        status_text.empty()
-                                        st.success(f"✅ Synced all {tracked_repos} repositories from {org.name} ({total_interactions:,} total interactions)")
-                                    else:
-                                        st.error(f"❌ Organization {org.name} not found on GitHub")
-                                    st.rerun()
-                        except Exception as e:
-                            st.error(f"❌ Sync All failed: {str(e)}")
-                
-                with col4:
-                    if st.button("🗑️ Delete", key=f"delete_org_{org.id}"):
-                        st.session_state[f"confirm_delete_org_{org.id}"] = True
-                
-                with col5:
-                    if st.session_state.get(f"confirm_delete_org_{org.id}", False):
-                        if st.button("✅ Confirm", key=f"confirm_org_{org.id}"):
-                            try:
-                                session.delete(org)
-                                session.commit()
-                                st.success(f"✅ Deleted organization: {org.name}")
-                                if f"confirm_delete_org_{org.id}" in st.session_state:
-                                    del st.session_state[f"confirm_delete_org_{org.id}"]
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"❌ Delete failed: {str(e)}")
-                
-                st.markdown("---")
-        else:
-            st.info("No organizations currently tracked")
-        
-        st.markdown("---")
-        
-        # Repositories management  
-        st.subheader("📁 Repositories")
-        
-        # Add new repository
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            new_repo_name = st.text_input("Repository full name (e.g., 'microsoft/vscode', 'facebook/react'):", key="new_repo_input")
-        with col2:
-            st.markdown("<br>", unsafe_allow_html=True)  # Add spacing to align with input
-            if st.button("➕ Add Repository", disabled=not new_repo_name):
-                try:
-                    if "/" not in new_repo_name:
-                        st.error("❌ Repository name must be in 'owner/repo' format")
-                    else:
-                        tracker = InteractionTracker()
-                        with st.spinner(f"Adding repository '{new_repo_name}'..."):
-                            result = tracker.track_repository(new_repo_name)
-                            if result["exists"]:
-                                st.success(f"✅ Successfully added repository: {new_repo_name}")
-                            else:
-                                st.warning(f"⚠️ Repository '{new_repo_name}' added but may not exist on GitHub")
-                            st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Failed to add repository: {str(e)}")
-        
-        # List current repositories
-        repositories = session.query(Repository).all()
-        
-        if repositories:
-            st.markdown("**Tracked Repositories:**")
-            for repo in repositories:
-                interaction_count = session.query(Interaction).filter_by(repository_id=repo.id).count()
-                last_synced = repo.last_synced_at.strftime("%Y-%m-%d %H:%M") if repo.last_synced_at else "Never"
-                org_name = repo.organization.name if repo.organization else "No org"
-                
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                
-                with col1:
-                    st.write(f"**{repo.full_name}** ({org_name}) - {interaction_count} interactions")
-                    st.caption(f"Last synced: {last_synced}")
-                
-                with col2:
-                    if st.button("🔄 Sync", key=f"sync_repo_{repo.id}"):
-                        try:
-                            tracker = InteractionTracker()
-                            owner, repo_name = repo.full_name.split('/')
-                            with st.spinner(f"Syncing {repo.full_name}..."):
-                                # Run full sync for all interaction types
-                                result = tracker.track_repository(repo.full_name)
-                                tracker.track_commits(owner, repo_name)
-                                tracker.track_issues(owner, repo_name)
-                                tracker.track_pull_requests(owner, repo_name)
-                                tracker.track_stargazers(owner, repo_name)
-                                tracker.track_forks(owner, repo_name)
-                                tracker.track_releases(owner, repo_name)
-                                tracker.track_workflow_runs(owner, repo_name)
-                                st.success(f"✅ Synced {repo.full_name}")
-                                st.rerun()
-                        except Exception as e:
-                            st.error(f"❌ Sync failed: {str(e)}")
-                
-                with col3:
-                    if st.button("🗑️ Delete", key=f"delete_repo_{repo.id}"):
-                        st.session_state[f"confirm_delete_repo_{repo.id}"] = True
-                
-                with col4:
-                    if st.session_state.get(f"confirm_delete_repo_{repo.id}", False):
-                        if st.button("✅ Confirm", key=f"confirm_repo_{repo.id}"):
-                            try:
-                                session.delete(repo)
-                                session.commit()
-                                st.success(f"✅ Deleted repository: {repo.full_name}")
-                                if f"confirm_delete_repo_{repo.id}" in st.session_state:
-                                    del st.session_state[f"confirm_delete_repo_{repo.id}"]
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"❌ Delete failed: {str(e)}")
-                
-                st.markdown("---")
-        else:
-            st.info("No repositories currently tracked")
-        
-        st.markdown("---")
-        
-        # Data collection management
-        st.subheader("🔄 Data Collection")
-        
+            st.button(
+                "🗑️ Delete",
+                key="delete_orgs",
+                disabled=not selected_orgs,
+                on_click=request_delete,
+                args=("orgs", [org["id"] for org in selected_orgs]),
+            )
+    else:
+        st.info("No organizations currently tracked")
+
+
+def add_repository() -> None:
+    """Track the repository named in the panel's input."""
+    full_name = st.session_state["new_repo_input"]
+    if "/" not in full_name:
+        st.session_state["repos_notices"] = [
+            ("error", "❌ Repository name must be in 'owner/repo' format")
+        ]
+        return
+
+    try:
+        with st.spinner(f"Adding repository '{full_name}'..."):
+            result = get_tracker().track_repository(full_name)
+    except Exception as e:
+        st.session_state["repos_notices"] = [
+            ("error", f"❌ Failed to add repository: {e}")
+        ]
+        return
+
+    if result["exists"]:
+        notice = ("success", f"✅ Successfully added repository: {full_name}")
+    else:
+        notice = (
+            "warning",
+            f"⚠️ Repository '{full_name}' added but may not exist on GitHub",
+        )
+    record_change("repos", [notice])
+
+
+def sync_repositories(repos: list[dict]) -> None:
+    """Re-track the selected repositories and all their interaction types."""
+    try:
+        tracker = get_tracker()
+        for repo in repos:
+            owner, repo_name = repo["full_name"].split("/")
+            with st.spinner(f"Syncing {repo['full_name']}..."):
+                tracker.track_repository(repo["full_name"])
+                tracker.track_all_interactions(owner, repo_name)
+    except Exception as e:
+        notices = [("error", f"❌ Sync failed: {e}")]
+    else:
+        notices = [("success", f"✅ Synced {len(repos)} repository(ies)")]
+    record_change("repos", notices)
+
+
+@fragment
+def show_repositories():
+    """Display the tracked repositories panel."""
+    data = load_tracking_data()
+
+    # Repositories management
+    st.subheader("📁 Repositories")
+    show_notices("repos")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Tracked Repositories", data["total_repos"])
+    with col2:
+        st.metric("Total Interactions", data["total_interactions"])
+
+    # A pending delete renders just its confirmation, not the panel
+    if show_pending_delete("repos", data["repositories"]):
+        return
+
+    # Add new repository
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        new_repo_name = st.text_input(
+            "Repository full name (e.g., 'microsoft/vscode', 'facebook/react'):",
+            key="new_repo_input",
+        )
+    with col2:
+        st.markdown("<br>", unsafe_allow_html=True)  # Add spacing to align with input
+        st.button(
+            "➕ Add Repository", disabled=not new_repo_name, on_click=add_repository
+        )
+
+    # List current repositories in one table; actions apply to selected rows
+    repositories = data["repositories"]
+
+    if repositories:
+        st.markdown("**Tracked Repositories:**")
+        repo_table = st.data_editor(
+            pd.DataFrame(repositories).assign(selected=False),
+            column_order=[
+                "selected",
+                "full_name",
+                "organization_name",
+                "interaction_count",
+                "last_synced_at",
+                "last_activity",
+            ],
+            column_config={
+                "selected": st.column_config.CheckboxColumn("Select"),
+                "full_name": "Repository",
+                "organization_name": "Organization",
+                "interaction_count": "Interactions",
+                "last_synced_at": st.column_config.DatetimeColumn(
+                    "Last synced", format="YYYY-MM-DD HH:mm"
+                ),
+                "last_activity": st.column_config.DatetimeColumn(
+                    "Last activity", format="YYYY-MM-DD HH:mm"
+                ),
+            },
+            disabled=[
+                "full_name",
+                "organization_name",
+                "interaction_count",
+                "last_synced_at",
+                "last_activity",
+            ],
+            hide_index=True,
+            use_container_width=True,
+            key="repo_table",
+        )
+        selected_repos = repo_table.loc[
+            repo_table["selected"], ["id", "full_name"]
+        ].to_dict("records")
+
         col1, col2 = st.columns(2)
-        
+
         with col1:
-            st.markdown("**Manual Data Collection**")
-            if st.button("🚀 Trigger Full Sync", type="primary"):
-                st.warning("⚠️ Manual sync requires implementation of tracking triggers")
-                st.info("This would trigger a full data collection cycle for all tracked repositories")
-        
+            st.button(
+                "🔄 Sync",
+                key="sync_repos",
+                disabled=not selected_repos,
+                on_click=sync_repositories,
+                args=(selected_repos,),
+            )
+
         with col2:
-            st.markdown("**Bulk Operations**")
-            if st.button("📤 Export Configuration"):
-                st.warning("⚠️ Export functionality requires implementation")
-                st.info("This would export the current tracking configuration as JSON")
-            
-            if st.button("📥 Import Configuration"):
-                st.warning("⚠️ Import functionality requires implementation")
-                st.info("This would allow importing tracking configuration from JSON")
-        
-        st.markdown("---")
-        
-        # Data health monitoring
-        st.subheader("🏥 Data Health")
-        
-        # Calculate data freshness
-        if total_interactions > 0:
-            latest_interaction = session.query(func.max(Interaction.timestamp)).scalar()
-            if latest_interaction:
-                import datetime
-                days_since_update = (datetime.datetime.now() - latest_interaction).days
-                
-                if days_since_update == 0:
-                    st.success(f"✅ Data is fresh (last update: today)")
-                elif days_since_update <= 1:
-                    st.success(f"✅ Data is fresh (last update: {days_since_update} day ago)")
-                elif days_since_update <= 7:
-                    st.warning(f"⚠️ Data is {days_since_update} days old")
-                else:
-                    st.error(f"❌ Data is stale ({days_since_update} days old)")
+            st.button(
+                "🗑️ Delete",
+                key="delete_repos",
+                disabled=not selected_repos,
+                on_click=request_delete,
+                args=("repos", [repo["id"] for repo in selected_repos]),
+            )
+    else:
+        st.info("No repositories currently tracked")
+
+
+def show():
+    """Display the data management interface."""
+    st.header("🗄️ Data Management")
+    st.markdown("Manage tracked organizations and repositories")
+
+    data = load_tracking_data()
+    total_interactions = data["total_interactions"]
+
+    st.markdown("---")
+
+    # Each panel shows its own totals so a change made in it updates them
+    # without rerunning the page
+    show_organizations()
+
+    st.markdown("---")
+
+    show_repositories()
+
+    st.markdown("---")
+
+    # Data collection management
+    st.subheader("🔄 Data Collection")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Manual Data Collection**")
+        if st.button("🚀 Trigger Full Sync", type="primary"):
+            st.warning("⚠️ Manual sync requires implementation of tracking triggers")
+            st.info(
+                "This would trigger a full data collection cycle for all tracked repositories"
+            )
+
+    with col2:
+        st.markdown("**Bulk Operations**")
+        if st.button("📤 Export Configuration"):
+            st.warning("⚠️ Export functionality requires implementation")
+            st.info("This would export the current tracking configuration as JSON")
+
+        if st.button("📥 Import Configuration"):
+            st.warning("⚠️ Import functionality requires implementation")
+            st.info("This would allow importing tracking configuration from JSON")
+
+    st.markdown("---")
+
+    # Data health monitoring
+    st.subheader("🏥 Data Health")
+
+    # Calculate data freshness
+    if total_interactions > 0:
+        latest_interaction = data["latest_interaction"]
+        if latest_interaction:
+            days_since_update = (datetime.now() - latest_interaction).days
+
+            if days_since_update == 0:
+                st.success("✅ Data is fresh (last update: today)")
+            elif days_since_update <= 1:
+                st.success(
+                    f"✅ Data is fresh (last update: {days_since_update} day ago)"
+                )
+            elif days_since_update <= 7:
+                st.warning(f"⚠️ Data is {days_since_update} days old")
             else:
-                st.error("❌ No interaction timestamps found")
-        else:
-            st.error("❌ No data collected yet")
-        
-        # Data quality checks
-        st.markdown("**Data Quality Checks:**")
-        
-        # Check for interactions without timestamps
-        interactions_without_timestamps = session.query(Interaction).filter(Interaction.timestamp.is_(None)).count()
-        if interactions_without_timestamps > 0:
-            st.warning(f"⚠️ {interactions_without_timestamps} interactions missing timestamps")
+                st.error(f"❌ Data is stale ({days_since_update} days old)")
         else:
-            st.success("✅ All interactions have timestamps")
-        
-        # Check for interactions without users
-        interactions_without_users = session.query(Interaction).filter(Interaction.user.is_(None)).count()
-        if interactions_without_users > 0:
-            st.info(f"ℹ️ {interactions_without_users} interactions without user information (normal for some interaction types)")
-        
-        # Check for orphaned interactions
-        orphaned_interactions = session.query(Interaction).filter(
-            Interaction.repository_id.is_(None),
-            Interaction.organization_id.is_(None)
-        ).count()
-        if orphaned_interactions > 0:
-            st.warning(f"⚠️ {orphaned_interactions} interactions not linked to any repository or organization")
-        else:
-            st.success("✅ All interactions properly linked")
+            st.error("❌ No interaction timestamps found")
+    else:
+        st.error("❌ No data collected yet")
+
+    # Data quality checks
+    st.markdown("**Data Quality Checks:**")
+
+    # Check for interactions without timestamps
+    interactions_without_timestamps = data["missing_timestamps"]
+    if interactions_without_timestamps > 0:
+        st.warning(
+            f"⚠️ {interactions_without_timestamps} interactions missing timestamps"
+        )
+    else:
+        st.success("✅ All interactions have timestamps")
+
+    # Check for interactions without users
+    interactions_without_users = data["missing_users"]
+    if interactions_without_users > 0:
+        st.info(
+            f"ℹ️ {interactions_without_users} interactions without user information (normal for some interaction types)"
+        )
+
+    # Check for orphaned interactions
+    orphaned_interactions = data["orphaned"]
+    if orphaned_interactions > 0:
+        st.warning(
+            f"⚠️ {orphaned_interactions} interactions not linked to any repository or organization"
+        )
+    else:
+        st.success("✅ All interactions properly linked")
 
 
 if __name__ == "__main__":
-    show()
\ No newline at end of file
+    show()
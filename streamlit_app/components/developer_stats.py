@@ -7,15 +7,113 @@ import streamlit as st
 
 # Try to import plotly, fall back to basic charts if not available
 try:
-    import plotly.express as px
+    import plotly.graph_objects as go
 
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
 from sqlalchemy import func
 
+from github_stats.constants import (
+    DASHBOARD_CACHE_TTL,
+    TIME_RANGE_DAYS,
+    TIMELINE_MAX_DAYS,
+)
 from github_stats.models.interactions import Interaction, Repository
-from github_stats.utils.database import get_db
+from github_stats.utils.database import get_database_url, get_db
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_developer_usernames(_session, database_url):
+    """Get the unique usernames found in interactions."""
+    developers = (
+        _session.query(Interaction.user)
+        .filter(Interaction.user.isnot(None))
+        .distinct()
+        .all()
+    )
+    return [dev.user for dev in developers]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_developer_metrics(_session, database_url, username):
+    """Get the header metrics for a developer.
+
+    All three counts are aggregates over the developer's interactions in
+    one query. The most common action is derived from
+    ``get_action_distribution``.
+
+    Returns:
+        Dictionary with total interactions, repositories contributed to and
+        interactions in the last 7 days
+    """
+    return (
+        _session.query(
+            func.count(Interaction.id).label("total_interactions"),
+            func.count(func.distinct(Interaction.repository_id)).label("unique_repos"),
+            func.count(Interaction.id)
+            .filter(Interaction.timestamp >= datetime.now() - timedelta(days=7))
+            .label("recent_interactions"),
+        )
+        .filter(Interaction.user == username)
+        .one()
+        ._asdict()
+    )
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_developer_activity(_session, database_url, username, time_range):
+    """Get a developer's daily interaction counts as ``(date, count)`` rows."""
+    days = TIME_RANGE_DAYS[time_range]
+    since = datetime.now() - timedelta(days=days) if days else datetime.min
+    day = func.date(Interaction.timestamp)
+    return [
+        tuple(row)
+        for row in _session.query(day, func.count(Interaction.id))
+        .filter(Interaction.user == username, Interaction.timestamp >= since)
+        .group_by(day)
+        .all()
+    ]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_action_distribution(_session, database_url, username):
+    """Get a developer's interaction counts per action as ``(action, count)`` rows."""
+    return [
+        tuple(row)
+        for row in _session.query(Interaction.action, func.count(Interaction.id))
+        .filter(Interaction.user == username)
+        .group_by(Interaction.action)
+        .all()
+    ]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_top_repositories(_session, database_url, username, limit=5):
+    """Get the repositories a developer interacts with most.
+
+    Interactions are counted per repository id first, so only the top
+    repositories are joined for their names.
+
+    Returns:
+        ``(full_name, count)`` rows, most active first
+    """
+    count = func.count(Interaction.id)
+    top = (
+        _session.query(Interaction.repository_id, count.label("count"))
+        .filter(Interaction.user == username, Interaction.repository_id.isnot(None))
+        .group_by(Interaction.repository_id)
+        .order_by(count.desc())
+        .limit(limit)
+        .subquery()
+    )
+    return [
+        tuple(row)
+        for row in _session.query(Repository.full_name, top.c.count)
+        .join(top, Repository.id == top.c.repository_id)
+        .order_by(top.c.count.desc())
+        .all()
+    ]
 
 
 def show():
@@ -23,14 +121,8 @@ def show():
     st.header("👨‍💻 Developer Statistics")
 
     with get_db() as session:
-        # Get unique usernames from interactions
-        developers = (
-            session.query(Interaction.user)
-            .filter(Interaction.user.isnot(None))
-            .distinct()
-            .all()
-        )
-        dev_usernames = [dev.user for dev in developers]
+        database_url = get_database_url(session)
+        dev_usernames = get_developer_usernames(session, database_url)
 
         if not dev_usernames:
             st.warning("No developers found. Start tracking some developers first!")
@@ -43,47 +135,25 @@ def show():
             developer_username = selected_dev
 
             col1, col2, col3, col4 = st.columns(4)
+            metrics = get_developer_metrics(session, database_url, developer_username)
+            # One grouped query feeds both the metric and the pie chart
+            action_dist = get_action_distribution(
+                session, database_url, developer_username
+            )
+            most_common_action = max(action_dist, key=lambda row: row[1], default=None)
 
             with col1:
-                total_interactions = (
-                    session.query(func.count(Interaction.id))
-                    .filter(Interaction.user == developer_username)
-                    .scalar()
-                )
-                st.metric("Total Interactions", total_interactions)
+                st.metric("Total Interactions", metrics["total_interactions"])
 
             with col2:
-                unique_repos = (
-                    session.query(func.count(func.distinct(Interaction.repository_id)))
-                    .filter(Interaction.user == developer_username)
-                    .scalar()
-                )
-                st.metric("Repositories Contributed To", unique_repos)
+                st.metric("Repositories Contributed To", metrics["unique_repos"])
 
             with col3:
-                recent_interactions = (
-                    session.query(func.count(Interaction.id))
-                    .filter(
-                        Interaction.user == developer_username,
-                        Interaction.timestamp >= datetime.now() - timedelta(days=7),
-                    )
-                    .scalar()
-                )
-                st.metric("Interactions (Last 7 Days)", recent_interactions)
+                st.metric("Interactions (Last 7 Days)", metrics["recent_interactions"])
 
             with col4:
-                most_common_action = (
-                    session.query(
-                        Interaction.action, func.count(Interaction.id).label("count")
-                    )
-                    .filter(Interaction.user == developer_username)
-                    .group_by(Interaction.action)
-                    .order_by(func.count(Interaction.id).desc())
-                    .first()
-                )
-
-                if most_common_action and most_common_action.action:
-                    st.metric("Most Common Action", most_common_action.action)
+                if most_common_action and most_common_action[0]:
+                    st.metric("Most Common Action", most_common_action[0])
                 else:
                     st.metric("Most Common Action", "N/A")
 
@@ -93,47 +163,33 @@ def show():
 
             time_range = st.selectbox(
                 "Time Range:",
-                ["Last 7 days", "Last 30 days", "Last 90 days", "All time"],
+                list(TIME_RANGE_DAYS),
                 index=1,
             )
 
-            if time_range == "Last 7 days":
-                date_filter = datetime.now() - timedelta(days=7)
-            elif time_range == "Last 30 days":
-                date_filter = datetime.now() - timedelta(days=30)
-            elif time_range == "Last 90 days":
-                date_filter = datetime.now() - timedelta(days=90)
-            else:
-                date_filter = datetime.min
-
-            activity_data = (
-                session.query(
-                    func.date(Interaction.timestamp).label("date"),
-                    func.count(Interaction.id).label("count"),
-                )
-                .filter(
-                    Interaction.user == developer_username,
-                    Interaction.timestamp >= date_filter,
-                )
-                .group_by(func.date(Interaction.timestamp))
-                .all()
+            activity_data = get_developer_activity(
+                session, database_url, developer_username, time_range
             )
 
             if activity_data:
-                df = pd.DataFrame(
-                    [{"date": a.date, "interactions": a.count} for a in activity_data]
-                )
+                df = pd.DataFrame(activity_data, columns=["date", "interactions"])
+
+                # Long histories are plotted as weekly bars to keep charts light
+                period = "Daily"
+                df["date"] = pd.to_datetime(df["date"])
+                if len(df) > TIMELINE_MAX_DAYS:
+                    period = "Weekly"
+                    df["date"] = df["date"].dt.to_period("W-SAT").dt.start_time
+                    df = df.groupby("date", as_index=False)["interactions"].sum()
 
                 if PLOTLY_AVAILABLE:
-                    fig = px.bar(
-                        df,
-                        x="date",
-                        y="interactions",
-                        title=f"Daily Activity for {selected_dev}",
-                        labels={
-                            "interactions": "Number of Interactions",
-                            "date": "Date",
-                        },
+                    # Traces are built directly; the frame is already one
+                    # bar per date, so plotly express has nothing to split
+                    fig = go.Figure(go.Bar(x=df["date"], y=df["interactions"]))
+                    fig.update_layout(
+                        title=f"{period} Activity for {selected_dev}",
+                        xaxis_title="Date",
+                        yaxis_title="Number of Interactions",
                     )
                     st.plotly_chart(fig, use_container_width=True)
                 else:
@@ -148,30 +204,19 @@ def show():
             with col1:
                 st.subheader("🎯 Action Types Distribution")
 
-                action_dist = (
-                    session.query(
-                        Interaction.action, func.count(Interaction.id).label("count")
-                    )
-                    .filter(Interaction.user == developer_username)
-                    .group_by(Interaction.action)
-                    .all()
-                )
-
                 if action_dist:
                     action_df = pd.DataFrame(
-                        [
-                            {"Action Type": a.action or "Unknown", "Count": a.count}
-                            for a in action_dist
-                        ]
-                    )
+                        action_dist, columns=["Action Type", "Count"]
+                    ).fillna({"Action Type": "Unknown"})
 
                     if PLOTLY_AVAILABLE:
-                        fig_pie = px.pie(
-                            action_df,
-                            values="Count",
-                            names="Action Type",
-                            title="Distribution of Actions",
+                        fig_pie = go.Figure(
+                            go.Pie(
+                                labels=action_df["Action Type"],
+                                values=action_df["Count"],
+                            )
                         )
+                        fig_pie.update_layout(title="Distribution of Actions")
                         st.plotly_chart(fig_pie, use_container_width=True)
                     else:
                         st.write("**Distribution of Actions**")
@@ -183,25 +228,16 @@ def show():
             with col2:
                 st.subheader("🏢 Top Repositories")
 
-                top_repos = (
-                    session.query(
-                        Repository.full_name,
-                        func.count(Interaction.id).label("interaction_count"),
-                    )
-                    .join(Interaction)
-                    .filter(Interaction.user == developer_username)
-                    .group_by(Repository.id)
-                    .order_by(func.count(Interaction.id).desc())
-                    .limit(5)
-                    .all()
+                top_repos = get_top_repositories(
+                    session, database_url, developer_username
                 )
 
                 if top_repos:
-                    for repo in top_repos:
-                        st.write(
-                            f"**{repo.full_name}**: "
-                            f"{repo.interaction_count} interactions"
-                        )
+                    st.dataframe(
+                        pd.DataFrame(top_repos, columns=["Repository", "Interactions"]),
+                        use_container_width=True,
+                        hide_index=True,
+                    )
                 else:
                     st.info("No repository interactions found.")
 
@@ -209,8 +245,16 @@ def show():
 
             st.subheader("📊 Detailed Activity Log")
 
+            # Only displayed columns are loaded, with repository names joined
+            # in rather than looked up per row
             recent_activities = (
-                session.query(Interaction)
+                session.query(
+                    Interaction.timestamp,
+                    Repository.full_name,
+                    Interaction.action,
+                    Interaction.extra_data,
+                )
+                .outerjoin(Repository, Repository.id == Interaction.repository_id)
                 .filter(Interaction.user == developer_username)
                 .order_by(Interaction.timestamp.desc())
                 .limit(20)
@@ -218,19 +262,15 @@ def show():
             )
 
             if recent_activities:
-                activity_list = []
-                for activity in recent_activities:
-                    repo = session.query(Repository).get(activity.repository_id)
-                    activity_list.append(
-                        {
-                            "Date": activity.timestamp.strftime("%Y-%m-%d %H:%M"),
-                            "Repository": repo.full_name if repo else "Unknown",
-                            "Action": activity.action or "Unknown",
-                            "Details": getattr(activity, "extra_data", {}) or "N/A",
-                        }
-                    )
-
-                activity_df = pd.DataFrame(activity_list)
+                activity_df = pd.DataFrame(
+                    recent_activities,
+                    columns=["Date", "Repository", "Action", "Details"],
+                ).fillna({"Repository": "Unknown", "Action": "Unknown"})
+                # Empty details are shown as N/A, like missing ones
+                activity_df["Details"] = [
+                    details or "N/A" for details in activity_df["Details"]
+                ]
+                activity_df["Date"] = activity_df["Date"].dt.strftime("%Y-%m-%d %H:%M")
                 st.dataframe(activity_df, use_container_width=True)
             else:
                 st.info("No recent activities found.")
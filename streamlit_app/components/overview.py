@@ -2,11 +2,63 @@
 
 from datetime import datetime, timedelta
 
+import pandas as pd
 import streamlit as st
-from sqlalchemy import func
+from sqlalchemy import func, select
 
+from github_stats.constants import DASHBOARD_CACHE_TTL
 from github_stats.models.interactions import Interaction, Repository
-from github_stats.utils.database import get_db
+from github_stats.utils.database import get_database_url, get_db
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_overview_metrics(_session, database_url):
+    """Get the headline developer, repository and interaction counts.
+
+    The four counts are scalar subqueries of one statement, so they take a
+    single round trip.
+    """
+    query = select(
+        select(func.count(func.distinct(Interaction.user)))
+        .where(Interaction.user.isnot(None))
+        .scalar_subquery()
+        .label("total_devs"),
+        select(func.count(Repository.id)).scalar_subquery().label("total_repos"),
+        select(func.count(Interaction.id))
+        .scalar_subquery()
+        .label("total_interactions"),
+        select(func.count(Interaction.id))
+        .where(Interaction.timestamp >= datetime.now() - timedelta(days=7))
+        .scalar_subquery()
+        .label("recent_interactions"),
+    )
+    return _session.execute(query).one()._asdict()
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_recent_activity(_session, database_url):
+    """Get interaction counts per action over the last 30 days."""
+    return [
+        tuple(row)
+        for row in _session.query(Interaction.action, func.count(Interaction.id))
+        .filter(Interaction.timestamp >= datetime.now() - timedelta(days=30))
+        .group_by(Interaction.action)
+        .all()
+    ]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_top_contributors(_session, database_url, limit=5):
+    """Get the most active users as ``(user, count)`` rows."""
+    return [
+        tuple(row)
+        for row in _session.query(Interaction.user, func.count(Interaction.id))
+        .filter(Interaction.user.isnot(None))
+        .group_by(Interaction.user)
+        .order_by(func.count(Interaction.id).desc())
+        .limit(limit)
+        .all()
+    ]
 
 
 def show():
@@ -14,31 +66,21 @@ def show():
     st.header("📈 GitHub Stats Overview")
 
     with get_db() as session:
+        database_url = get_database_url(session)
         col1, col2, col3, col4 = st.columns(4)
+        metrics = get_overview_metrics(session, database_url)
 
         with col1:
-            total_devs = (
-                session.query(func.count(func.distinct(Interaction.user)))
-                .filter(Interaction.user.isnot(None))
-                .scalar()
-            )
-            st.metric("Total Developers", total_devs)
+            st.metric("Total Developers", metrics["total_devs"])
 
         with col2:
-            total_repos = session.query(func.count(Repository.id)).scalar()
-            st.metric("Total Repositories", total_repos)
+            st.metric("Total Repositories", metrics["total_repos"])
 
         with col3:
-            total_interactions = session.query(func.count(Interaction.id)).scalar()
-            st.metric("Total Interactions", total_interactions)
+            st.metric("Total Interactions", metrics["total_interactions"])
 
         with col4:
-            recent_interactions = (
-                session.query(func.count(Interaction.id))
-                .filter(Interaction.timestamp >= datetime.now() - timedelta(days=7))
-                .scalar()
-            )
-            st.metric("Interactions (Last 7 Days)", recent_interactions)
+            st.metric("Interactions (Last 7 Days)", metrics["recent_interactions"])
 
         st.markdown("---")
 
@@ -46,42 +88,26 @@ def show():
 
         with col1:
             st.subheader("📊 Recent Activity")
-            recent_activity = (
-                session.query(
-                    Interaction.action, func.count(Interaction.id).label("count")
-                )
-                .filter(Interaction.timestamp >= datetime.now() - timedelta(days=30))
-                .group_by(Interaction.action)
-                .all()
-            )
+            recent_activity = get_recent_activity(session, database_url)
 
             if recent_activity:
-                for activity in recent_activity:
-                    action_name = activity.action or "Unknown"
-                    st.write(f"**{action_name}**: {activity.count}")
+                for action, count in recent_activity:
+                    st.write(f"**{action or 'Unknown'}**: {count}")
             else:
                 st.info("No activity in the last 30 days")
 
         with col2:
             st.subheader("👥 Top Contributors")
-            top_contributors = (
-                session.query(
-                    Interaction.user,
-                    func.count(Interaction.id).label("interaction_count"),
-                )
-                .filter(Interaction.user.isnot(None))
-                .group_by(Interaction.user)
-                .order_by(func.count(Interaction.id).desc())
-                .limit(5)
-                .all()
-            )
+            top_contributors = get_top_contributors(session, database_url)
 
             if top_contributors:
-                for contributor in top_contributors:
-                    st.write(
-                        f"**{contributor.user}**: "
-                        f"{contributor.interaction_count} interactions"
-                    )
+                st.dataframe(
+                    pd.DataFrame(
+                        top_contributors, columns=["Developer", "Interactions"]
+                    ),
+                    use_container_width=True,
+                    hide_index=True,
+                )
             else:
                 st.info("No contributors found")
 
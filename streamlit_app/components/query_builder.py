@@ -1,18 +1,38 @@
 """Query Builder dashboard page with real database integration."""
 
+import csv
+import io
+import json
 from datetime import datetime, timedelta
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import func
+from sqlalchemy import (
+    String,
+    and_,
+    cast,
+    distinct,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 
+from github_stats.constants import (
+    DASHBOARD_CACHE_TTL,
+    QUERY_EXPORT_CHUNK_SIZE,
+    QUERY_PREVIEW_MAX_VALUES,
+    QUERY_RESULTS_CACHE_ENTRIES,
+    QUERY_RESULTS_CACHE_TTL,
+)
 from github_stats.models.interactions import (
     Interaction,
     InteractionType,
     Organization,
     Repository,
 )
-from github_stats.utils.database import get_db
+from github_stats.utils.database import get_database_url, get_db, get_db_engine
 
 # Try to import plotly, fall back to basic charts if not available
 try:
@@ -22,46 +42,207 @@ try:
 except ImportError:
     PLOTLY_AVAILABLE = False
 
+# The results table reruns on its own with st.fragment (Streamlit 1.37+);
+# older versions rerun the whole page
+fragment = getattr(st, "fragment", lambda func: func)
+
+# Display headers for the columns selected by execute_query
+RESULT_COLUMNS = {
+    "id": "ID",
+    "timestamp": "Timestamp",
+    "organization": "Organization",
+    "repository": "Repository",
+    "user": "User",
+    "type": "Interaction Type",
+    "action": "Action",
+    "resource_id": "Resource ID",
+    "extra_data": "Details",
+}
+
+# Interaction type enum members to their display values, for Series.map
+INTERACTION_TYPE_VALUES = {t: t.value for t in InteractionType}
+# Stored enum names to display values, for raw aggregate rows
+INTERACTION_TYPE_NAMES = {t.name: t.value for t in InteractionType}
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_organizations(_session, database_url):
+    """Get list of organizations from database.
+
+    Filter options are cached across reruns for ``DASHBOARD_CACHE_TTL`` seconds.
+    Loaders take the page's session as ``_session``; the leading underscore
+    keeps it out of the cache key, so they also take the ``database_url``
+    it is bound to and never serve one database's results for another.
+    Data tracked from the CLI shows up once the TTL expires.
+    """
+    organizations = _session.query(Organization.name).all()
+    return [org.name for org in organizations]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_repositories(_session, database_url):
+    """Get list of repositories from database."""
+    repositories = _session.query(Repository.full_name).all()
+    return [repo.full_name for repo in repositories]
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_name_lookups(_session, database_url):
+    """Get organization and repository id to name dicts for the results table."""
+    organizations = dict(
+        _session.execute(select(Organization.id, Organization.name)).all()
+    )
+    repositories = dict(
+        _session.execute(select(Repository.id, Repository.full_name)).all()
+    )
+    return organizations, repositories
+
+
+def lookup_names(session, results):
+    """Fill in organization and repository names for a page of interactions.
+
+    The cached lookups are reloaded when a page refers to an id they do not
+    know yet, such as a repository added since they were cached.
+    """
+    database_url = get_database_url(session)
+    organizations, repositories = get_name_lookups(session, database_url)
+    known = results["organization_id"].dropna().isin(organizations).all() and (
+        results["repository_id"].dropna().isin(repositories).all()
+    )
+    if not known:
+        get_name_lookups.clear()
+        organizations, repositories = get_name_lookups(session, database_url)
+
+    results.insert(2, "organization", results.pop("organization_id").map(organizations))
+    results.insert(3, "repository", results.pop("repository_id").map(repositories))
+    return results
+
+
+def get_latest_interaction_id(session):
+    """Get the newest interaction id, a cheap probe for new interactions."""
+    return session.scalar(select(func.max(Interaction.id)))
+
+
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_users(_session, database_url, latest_id=None):
+    """Get tuple of users from database.
+
+    ``latest_id`` only keys the cache, so the DISTINCT scan reruns as soon
+    as new interactions are stored rather than on every page render. The
+    tuple is shared across reruns and sessions instead of being copied
+    like ``st.cache_data`` results, so it must not be modified.
+    """
+    users = (
+        _session.query(Interaction.user)
+        .filter(Interaction.user.isnot(None))
+        .distinct()
+        .all()
+    )
+    return tuple(user.user for user in users)
+
+
+@st.cache_resource(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_actions(_session, database_url, latest_id=None):
+    """Get tuple of actions from database, cached like ``get_users``."""
+    actions = (
+        _session.query(Interaction.action)
+        .filter(Interaction.action.isnot(None))
+        .distinct()
+        .all()
+    )
+    return tuple(action.action for action in actions)
+
+
+def refresh_filter_options():
+    """Drop the cached filter options so the next render reloads them."""
+    for loader in (
+        get_organizations,
+        get_repositories,
+        get_users,
+        get_actions,
+        get_name_lookups,
+    ):
+        loader.clear()
+
+
+def build_conditions(
+    selected_orgs,
+    selected_repos,
+    selected_users,
+    selected_types,
+    selected_actions,
+    date_range,
+    exclude_stars=True,
+    logical_operator="AND",
+):
+    """Build the filter conditions shared by the results and chart queries.
+
+    Conditions on organization and repository names expect both tables to be
+    outer-joined to the interactions. With AND logic, excluded stars are
+    removed from the selected types instead of adding a separate predicate,
+    so selecting only stars yields an always-false condition.
+    """
+    conditions = []
+
+    if selected_orgs:
+        conditions.append(Organization.name.in_(selected_orgs))
+
+    if selected_repos:
+        conditions.append(Repository.full_name.in_(selected_repos))
+
+    if selected_users:
+        conditions.append(Interaction.user.in_(selected_users))
+
+    if selected_types:
+        # The column stores enum names, so convert selected values to members
+        types = [InteractionType(t) for t in selected_types]
+        if exclude_stars and logical_operator == "AND":
+            # Drop stars from the selection rather than adding a second
+            # predicate on the same column
+            types = [t for t in types if t is not InteractionType.STAR]
+            exclude_stars = False
+        conditions.append(Interaction.type.in_(types))
+
+    if selected_actions:
+        conditions.append(Interaction.action.in_(selected_actions))
+
+    if len(date_range) == 2 and date_range[0] is not None and date_range[1] is not None:
+        start_date, end_date = date_range
+        # Half-open range on the dates themselves: the whole end date is
+        # included without building end-of-day datetimes
+        conditions.append(
+            and_(
+                Interaction.timestamp >= start_date,
+                Interaction.timestamp < end_date + timedelta(days=1),
+            )
+        )
 
-def get_organizations():
-    """Get list of organizations from database."""
-    with get_db() as session:
-        organizations = session.query(Organization.name).all()
-        return [org.name for org in organizations]
-
+    # Exclude stars if requested
+    if exclude_stars:
+        conditions.append(Interaction.type != InteractionType.STAR)
 
-def get_repositories():
-    """Get list of repositories from database."""
-    with get_db() as session:
-        repositories = session.query(Repository.full_name).all()
-        return [repo.full_name for repo in repositories]
+    return conditions
 
 
-def get_users():
-    """Get list of users from database."""
-    with get_db() as session:
-        users = (
-            session.query(Interaction.user)
-            .filter(Interaction.user.isnot(None))
-            .distinct()
-            .all()
-        )
-        return [user.user for user in users]
+def join_names(query):
+    """Outer-join repositories and organizations onto an interactions select."""
+    return (
+        query.select_from(Interaction)
+        .outerjoin(Repository, Interaction.repository_id == Repository.id)
+        .outerjoin(Organization, Interaction.organization_id == Organization.id)
+    )
 
 
-def get_actions():
-    """Get list of actions from database."""
-    with get_db() as session:
-        actions = (
-            session.query(Interaction.action)
-            .filter(Interaction.action.isnot(None))
-            .distinct()
-            .all()
-        )
-        return [action.action for action in actions]
+def apply_filters(query, conditions, logical_operator="AND"):
+    """Apply filter conditions to a query, combined with AND or OR."""
+    if not conditions:
+        return query
+    if logical_operator == "AND":
+        return query.filter(*conditions)
+    return query.filter(or_(*conditions))
 
 
-def execute_query(
+def build_query(
     selected_orgs,
     selected_repos,
     selected_users,
@@ -70,12 +251,19 @@ def execute_query(
     date_range,
     logical_operator="AND",
     exclude_stars=True,
+    names=True,
 ):
-    """Execute real database query based on filter selections."""
-    with get_db() as session:
-        # Build base query with joins
-        query = (
-            session.query(
+    """Build the filtered and ordered statement behind the results table.
+
+    With ``names`` False, organization and repository ids are selected in
+    place of their names and the joins are skipped. That is only valid when
+    no organizations or repositories are selected.
+    """
+    # Only columns are selected, so no ORM objects or relationship loads
+    # are involved
+    if names:
+        query = join_names(
+            select(
                 Interaction.id,
                 Interaction.timestamp,
                 Organization.name.label("organization"),
@@ -86,75 +274,221 @@ def execute_query(
                 Interaction.resource_id,
                 Interaction.extra_data,
             )
-            .outerjoin(Repository, Interaction.repository_id == Repository.id)
-            .outerjoin(Organization, Interaction.organization_id == Organization.id)
+        )
+    else:
+        query = select(
+            Interaction.id,
+            Interaction.timestamp,
+            Interaction.organization_id,
+            Interaction.repository_id,
+            Interaction.user,
+            Interaction.type,
+            Interaction.action,
+            Interaction.resource_id,
+            Interaction.extra_data,
         )
 
-        # Build filter conditions
-        conditions = []
-
-        if selected_orgs:
-            conditions.append(Organization.name.in_(selected_orgs))
-
-        if selected_repos:
-            conditions.append(Repository.full_name.in_(selected_repos))
-
-        if selected_users:
-            conditions.append(Interaction.user.in_(selected_users))
-
-        if selected_types:
-            conditions.append(Interaction.type.in_(selected_types))
-
-        if selected_actions:
-            conditions.append(Interaction.action.in_(selected_actions))
-
-        if len(date_range) == 2 and date_range[0] is not None and date_range[1] is not None:
-            start_date, end_date = date_range
-            # Convert dates to datetime for comparison
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            conditions.append(
-                Interaction.timestamp.between(start_datetime, end_datetime)
+    # Apply filter conditions with logical operator
+    query = apply_filters(
+        query,
+        build_conditions(
+            selected_orgs,
+            selected_repos,
+            selected_users,
+            selected_types,
+            selected_actions,
+            date_range,
+            exclude_stars,
+            logical_operator,
+        ),
+        logical_operator,
+    )
+
+    # Order by id as well so pages are stable when timestamps tie
+    return query.order_by(Interaction.timestamp.desc(), Interaction.id.desc())
+
+
+def preview_sql(query):
+    """Render a statement as SQL for the configured database, values inlined."""
+    compiled = query.compile(
+        dialect=get_db_engine().dialect, compile_kwargs={"literal_binds": True}
+    )
+    return f"{compiled};"
+
+
+@st.cache_data(
+    ttl=QUERY_RESULTS_CACHE_TTL,
+    max_entries=QUERY_RESULTS_CACHE_ENTRIES,
+    show_spinner="Running query...",
+)
+def execute_query(
+    _session,
+    database_url,
+    selected_orgs,
+    selected_repos,
+    selected_users,
+    selected_types,
+    selected_actions,
+    date_range,
+    logical_operator="AND",
+    exclude_stars=True,
+    page=1,
+    page_size=None,
+):
+    """Execute real database query based on filter selections.
+
+    Only the requested page of results is fetched; all matching rows are
+    returned when ``page_size`` is None. Results are cached per filter
+    selection and page.
+    """
+    # Without organization or repository filters the joins would only
+    # supply names, so page through the interactions alone and look the
+    # names up afterwards
+    names = bool(selected_orgs or selected_repos)
+    query = build_query(
+        selected_orgs,
+        selected_repos,
+        selected_users,
+        selected_types,
+        selected_actions,
+        date_range,
+        logical_operator,
+        exclude_stars,
+        names,
+    )
+    if page_size is not None:
+        query = query.limit(page_size).offset((page - 1) * page_size)
+
+    # Execute query straight into a DataFrame
+    results = pd.read_sql(query, _session.connection())
+    if not names:
+        results = lookup_names(_session, results)
+    results["type"] = results["type"].map(INTERACTION_TYPE_VALUES)
+    results["extra_data"] = results["extra_data"].map(lambda d: str(d) if d else None)
+
+    return results.rename(columns=RESULT_COLUMNS).fillna("N/A")
+
+
+@st.cache_data(
+    ttl=QUERY_RESULTS_CACHE_TTL,
+    max_entries=QUERY_RESULTS_CACHE_ENTRIES,
+    show_spinner="Running query...",
+)
+def summarize_query(
+    _session,
+    database_url,
+    selected_orgs,
+    selected_repos,
+    selected_users,
+    selected_types,
+    selected_actions,
+    date_range,
+    logical_operator="AND",
+    exclude_stars=True,
+):
+    """Count the matching interactions, users, repositories and days.
+
+    Missing users and repositories count as one "N/A" value, as they are
+    shown in the results table.
+    """
+    query = join_names(
+        select(
+            func.count(Interaction.id).label("total"),
+            func.count(distinct(func.coalesce(Interaction.user, "N/A"))).label("users"),
+            func.count(distinct(func.coalesce(Repository.full_name, "N/A"))).label(
+                "repositories"
+            ),
+            func.count(distinct(func.date(Interaction.timestamp))).label("days"),
+        )
+    )
+    query = apply_filters(
+        query,
+        build_conditions(
+            selected_orgs,
+            selected_repos,
+            selected_users,
+            selected_types,
+            selected_actions,
+            date_range,
+            exclude_stars,
+            logical_operator,
+        ),
+        logical_operator,
+    )
+    return _session.execute(query).one()._asdict()
+
+
+@st.cache_data(
+    ttl=QUERY_RESULTS_CACHE_TTL,
+    max_entries=QUERY_RESULTS_CACHE_ENTRIES,
+    show_spinner="Exporting results...",
+)
+def export_query_csv(
+    _session,
+    database_url,
+    selected_orgs,
+    selected_repos,
+    selected_users,
+    selected_types,
+    selected_actions,
+    date_range,
+    logical_operator="AND",
+    exclude_stars=True,
+):
+    """Export every matching interaction as CSV bytes.
+
+    Rows are streamed from the database in chunks and written straight to
+    the CSV buffer, without building a DataFrame of the full result.
+    """
+    query = build_query(
+        selected_orgs,
+        selected_repos,
+        selected_users,
+        selected_types,
+        selected_actions,
+        date_range,
+        logical_operator,
+        exclude_stars,
+    )
+    result = _session.execute(
+        query.execution_options(yield_per=QUERY_EXPORT_CHUNK_SIZE)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(RESULT_COLUMNS.values())
+    for rows in result.partitions():
+        writer.writerows(
+            (
+                row.id,
+                row.timestamp,
+                row.organization,
+                row.repository,
+                row.user,
+                row.type.value if row.type else None,
+                row.action,
+                row.resource_id,
+                json.dumps(row.extra_data) if row.extra_data else None,
             )
+            for row in rows
+        )
+    return buffer.getvalue().encode()
 
-        # Exclude stars if requested
-        if exclude_stars:
-            conditions.append(Interaction.type != InteractionType.STAR)
-
-        # Apply conditions with logical operator
-        if conditions:
-            if logical_operator == "AND":
-                for condition in conditions:
-                    query = query.filter(condition)
-            else:  # OR
-                from sqlalchemy import or_
-
-                query = query.filter(or_(*conditions))
-
-        # Execute query
-        results = query.order_by(Interaction.timestamp.desc()).all()
-
-        # Convert to DataFrame
-        data = []
-        for result in results:
-            data.append(
-                {
-                    "ID": result.id,
-                    "Timestamp": result.timestamp,
-                    "Organization": result.organization or "N/A",
-                    "Repository": result.repository or "N/A",
-                    "User": result.user or "N/A",
-                    "Interaction Type": result.type.value if result.type else "N/A",
-                    "Action": result.action or "N/A",
-                    "Resource ID": result.resource_id or "N/A",
-                    "Details": str(result.extra_data) if result.extra_data else "N/A",
-                }
-            )
 
-        return pd.DataFrame(data)
+def split_aggregate(rows, kind, columns):
+    """Select one aggregate's rows from a tagged UNION ALL result."""
+    part = rows.loc[rows["kind"] == kind, ["key", "count"]]
+    return part.set_axis(columns, axis=1).reset_index(drop=True)
 
 
+@st.cache_data(
+    ttl=QUERY_RESULTS_CACHE_TTL,
+    max_entries=QUERY_RESULTS_CACHE_ENTRIES,
+    show_spinner="Building charts...",
+)
 def generate_chart_data(
+    _session,
+    database_url,
     selected_orgs,
     selected_repos,
     selected_users,
@@ -164,110 +498,143 @@ def generate_chart_data(
     logical_operator="AND",
     exclude_stars=True,
 ):
-    """Generate real chart data from database based on filters."""
-    with get_db() as session:
-        # Build base query with same filters as main query
-        base_query = (
-            session.query(Interaction)
-            .outerjoin(Repository, Interaction.repository_id == Repository.id)
-            .outerjoin(Organization, Interaction.organization_id == Organization.id)
-        )
-
-        # Apply same filters as main query
-        conditions = []
-
-        if selected_orgs:
-            conditions.append(Organization.name.in_(selected_orgs))
-
-        if selected_repos:
-            conditions.append(Repository.full_name.in_(selected_repos))
-
-        if selected_users:
-            conditions.append(Interaction.user.in_(selected_users))
-
-        if selected_types:
-            conditions.append(Interaction.type.in_(selected_types))
-
-        if selected_actions:
-            conditions.append(Interaction.action.in_(selected_actions))
-
-        if len(date_range) == 2 and date_range[0] is not None and date_range[1] is not None:
-            start_date, end_date = date_range
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            conditions.append(
-                Interaction.timestamp.between(start_datetime, end_datetime)
-            )
-
-        # Exclude stars if requested
-        if exclude_stars:
-            conditions.append(Interaction.type != InteractionType.STAR)
-
-        # Apply conditions
-        if conditions:
-            if logical_operator == "AND":
-                for condition in conditions:
-                    base_query = base_query.filter(condition)
-            else:  # OR
-                from sqlalchemy import or_
-
-                base_query = base_query.filter(or_(*conditions))
-
-        # Time series data - daily interaction counts
-        time_series_query = (
-            base_query.with_entities(
-                func.date(Interaction.timestamp).label("date"),
-                func.count(Interaction.id).label("interactions"),
+    """Generate real chart data from database based on filters.
+
+    Daily counts, the type distribution and the top users come from a single
+    UNION ALL statement whose rows are tagged with the aggregate they belong to.
+    """
+    # Interactions matching the same filters as the main query
+    filtered = apply_filters(
+        join_names(
+            select(
+                Interaction.id,
+                Interaction.timestamp,
+                Interaction.type,
+                Interaction.user,
             )
-            .group_by(func.date(Interaction.timestamp))
-            .order_by(func.date(Interaction.timestamp))
+        ),
+        build_conditions(
+            selected_orgs,
+            selected_repos,
+            selected_users,
+            selected_types,
+            selected_actions,
+            date_range,
+            exclude_stars,
+            logical_operator,
+        ),
+        logical_operator,
+    ).cte("filtered")
+
+    day = func.date(filtered.c.timestamp)
+    count = func.count(filtered.c.id)
+
+    # LIMIT is not allowed on a compound member, so rank users in a subquery
+    top_users_query = (
+        select(literal("user"), filtered.c.user, count)
+        .where(filtered.c.user.isnot(None))
+        .group_by(filtered.c.user)
+        .order_by(count.desc())
+        .limit(10)
+        .subquery()
+    )
+
+    query = union_all(
+        select(
+            literal("time").label("kind"),
+            cast(day, String).label("key"),
+            count.label("count"),
+        ).group_by(day),
+        select(literal("type"), cast(filtered.c.type, String), count).group_by(
+            filtered.c.type
+        ),
+        select(top_users_query),
+    )
+    rows = pd.DataFrame(_session.execute(query).all(), columns=["kind", "key", "count"])
+
+    # Time series data - daily interaction counts
+    time_series = split_aggregate(rows, "time", ["date", "interactions"])
+    time_series = time_series.sort_values("date", ignore_index=True)
+
+    # Interaction type distribution; the column stores enum names
+    interaction_dist = split_aggregate(rows, "type", ["type", "count"])
+    interaction_dist["type"] = (
+        interaction_dist["type"].map(INTERACTION_TYPE_NAMES).fillna("Unknown")
+    )
+
+    # Top users
+    top_users = split_aggregate(rows, "user", ["user", "interactions"])
+    top_users = top_users.sort_values(
+        "interactions", ascending=False, kind="stable", ignore_index=True
+    )
+
+    return time_series, interaction_dist, top_users
+
+
+def build_figures(time_series, interaction_dist, top_users):
+    """Build the Visualizations tab figures for non-empty chart data."""
+    if not PLOTLY_AVAILABLE:
+        return {}
+
+    figures = {}
+    if not time_series.empty:
+        figures["time"] = px.line(
+            time_series,
+            x="date",
+            y="interactions",
+            title="Daily Interaction Volume",
+            labels={
+                "interactions": "Number of Interactions",
+                "date": "Date",
+            },
+            render_mode="webgl",
         )
-
-        time_series_results = time_series_query.all()
-        time_series = pd.DataFrame(
-            [
-                {"date": result.date, "interactions": result.interactions}
-                for result in time_series_results
-            ]
+    if not interaction_dist.empty:
+        figures["types"] = px.pie(
+            interaction_dist,
+            values="count",
+            names="type",
+            title="Interaction Types",
         )
+    if not top_users.empty:
+        figures["users"] = px.bar(
+            top_users,
+            x="user",
+            y="interactions",
+            title="Most Active Users",
+        )
+        figures["users"].update_layout(xaxis_tickangle=-45)
+    return figures
 
-        # Interaction type distribution
-        type_dist_query = base_query.with_entities(
-            Interaction.type.label("type"), func.count(Interaction.id).label("count")
-        ).group_by(Interaction.type)
 
-        type_dist_results = type_dist_query.all()
-        interaction_dist = pd.DataFrame(
-            [
-                {
-                    "type": result.type.value if result.type else "Unknown",
-                    "count": result.count,
-                }
-                for result in type_dist_results
-            ]
-        )
+@fragment
+def show_results_table(filters, total):
+    """Display one page of query results with its pagination controls."""
+    # Pagination controls
+    page_size = st.selectbox("Results per page", [10, 25, 50, 100], index=1)
+    total_pages = (total - 1) // page_size + 1
 
-        # Top users
-        user_query = (
-            base_query.filter(Interaction.user.isnot(None))
-            .with_entities(
-                Interaction.user.label("user"),
-                func.count(Interaction.id).label("interactions"),
-            )
-            .group_by(Interaction.user)
-            .order_by(func.count(Interaction.id).desc())
-            .limit(10)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        page = st.number_input(
+            f"Page (1-{total_pages})",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
         )
 
-        user_results = user_query.all()
-        top_users = pd.DataFrame(
-            [
-                {"user": result.user, "interactions": result.interactions}
-                for result in user_results
-            ]
-        )
+    # Display paginated results, fetching only this page
+    try:
+        with get_db() as session:
+            database_url = get_database_url(session)
+            page_df = execute_query(
+                session, database_url, *filters, page=page, page_size=page_size
+            )
+    except Exception as e:
+        st.error(f"Error executing query: {e}")
+        return
 
-        return time_series, interaction_dist, top_users
+    st.dataframe(page_df, use_container_width=True, hide_index=True)
 
 
 def show():
@@ -289,14 +656,22 @@ def show():
         **Time span**: 65 days of authentic activity (April-July 2025)
         """)
 
-    # Get real data from database
-    available_orgs = get_organizations()
-    available_repos = get_repositories()
-    available_users = get_users()
-    available_actions = get_actions()
+    # Get real data from database, sharing one session
+    with get_db() as session:
+        database_url = get_database_url(session)
+        available_orgs = get_organizations(session, database_url)
+        available_repos = get_repositories(session, database_url)
+        latest_id = get_latest_interaction_id(session)
+        available_users = get_users(session, database_url, latest_id)
+        available_actions = get_actions(session, database_url, latest_id)
 
     # Full width layout with filters at top
     st.subheader("🛠️ Query Filters")
+    st.button(
+        "🔄 Refresh Options",
+        on_click=refresh_filter_options,
+        help="Reload organizations, repositories, users and actions",
+    )
 
     # Filters in a grid layout
     col1, col2, col3 = st.columns(3)
@@ -346,9 +721,10 @@ def show():
 
         # Date range filter
         st.markdown("**📅 Date Range**")
+        now = datetime.now()
         date_range = st.date_input(
             "Select date range",
-            value=(datetime.now() - timedelta(days=30), datetime.now()),
+            value=(now - timedelta(days=30), now),
             key="date_range",
             help="Choose the date range for the query",
         )
@@ -385,6 +761,8 @@ def show():
         # Execute query button
         if st.button("🚀 Execute Query", type="primary", use_container_width=True):
             st.session_state.query_executed = True
+            # Executing again always fetches fresh results
+            st.session_state.pop("query_results", None)
             st.success("Query executed successfully!")
 
     with col4:
@@ -397,10 +775,8 @@ def show():
             st.session_state.selected_repos = []
             st.session_state.selected_actions = []
             st.session_state.selected_users = []
-            st.session_state.date_range = (
-                datetime.now() - timedelta(days=30),
-                datetime.now(),
-            )
+            now = datetime.now()
+            st.session_state.date_range = (now - timedelta(days=30), now)
             st.session_state.exclude_stars = False
             st.session_state.logical_operator = "AND"
             if "query_executed" in st.session_state:
@@ -413,48 +789,32 @@ def show():
         st.markdown("---")
         st.subheader("📋 Query Preview")
 
-        # Generate SQL query preview with correct column names
-        query_parts = []
-        if selected_orgs:
-            org_list = "', '".join(selected_orgs)
-            query_parts.append(f"o.name IN ('{org_list}')")
-        if selected_repos:
-            repo_list = "', '".join(selected_repos)
-            query_parts.append(f"r.full_name IN ('{repo_list}')")
-        if selected_users:
-            user_list = "', '".join(selected_users)
-            query_parts.append(f"i.user IN ('{user_list}')")
-        if selected_types:
-            type_list = "', '".join(selected_types)
-            query_parts.append(f"i.type IN ('{type_list}')")
-        if selected_actions:
-            action_list = "', '".join(selected_actions)
-            query_parts.append(f"i.action IN ('{action_list}')")
-
-        if len(date_range) == 2 and date_range[0] is not None and date_range[1] is not None:
-            query_parts.append(
-                f"i.timestamp BETWEEN '{date_range[0]}' AND '{date_range[1]}'"
-            )
-
-        # Add star exclusion if not including stars
-        if not exclude_stars:
-            query_parts.append("i.type != 'star'")
-
-        where_clause = (
-            f" {logical_operator} ".join(query_parts) if query_parts else "1=1"
+        # Show the statement execute_query actually runs, with long
+        # selections shortened so the preview stays readable
+        selections = {
+            "organizations": selected_orgs,
+            "repositories": selected_repos,
+            "users": selected_users,
+            "interaction types": selected_types,
+            "actions": selected_actions,
+        }
+        query = build_query(
+            *(values[:QUERY_PREVIEW_MAX_VALUES] for values in selections.values()),
+            date_range,
+            logical_operator,
+            not exclude_stars,  # Invert because checkbox is "Include stars"
+            names=bool(selected_orgs or selected_repos),
         )
-
-        mock_sql = f"""SELECT *
-FROM interactions i
-LEFT JOIN repositories r ON i.repository_id = r.id
-LEFT JOIN organizations o ON i.organization_id = o.id
-WHERE {where_clause}
-ORDER BY i.timestamp DESC;"""
-
-        st.code(mock_sql, language="sql")
+        st.code(preview_sql(query), language="sql")
+        for name, values in selections.items():
+            if len(values) > QUERY_PREVIEW_MAX_VALUES:
+                st.caption(
+                    f"Preview lists {QUERY_PREVIEW_MAX_VALUES} of "
+                    f"{len(values):,} selected {name}"
+                )
 
         # Query validation status
-        if query_parts:
+        if query.whereclause is not None:
             st.success("✅ Query is valid")
         else:
             st.warning("⚠️ No filters selected - will return all data")
@@ -527,24 +887,48 @@ ORDER BY i.timestamp DESC;"""
         st.markdown("---")
         st.subheader("📊 Query Results")
 
-        # Execute real query
-        try:
-            results_df = execute_query(
-                selected_orgs,
-                selected_repos,
-                selected_users,
-                selected_types,
-                selected_actions,
-                date_range,
-                logical_operator,
-                not exclude_stars,  # Invert because checkbox is "Include stars"
-            )
-        except Exception as e:
-            st.error(f"Error executing query: {e}")
-            return
+        filters = (
+            selected_orgs,
+            selected_repos,
+            selected_users,
+            selected_types,
+            selected_actions,
+            date_range,
+            logical_operator,
+            not exclude_stars,  # Invert because checkbox is "Include stars"
+        )
+
+        # Execute real query, reusing this session's summary while the
+        # filters are unchanged (tab switches, pagination); table rows are
+        # fetched a page at a time below
+        filters_key = tuple(
+            tuple(value) if isinstance(value, list | tuple) else value
+            for value in filters
+        )
+        query_results = st.session_state.get("query_results")
+        if query_results is None or query_results[0] != filters_key:
+            try:
+                with get_db() as session:
+                    database_url = get_database_url(session)
+                    summary = summarize_query(session, database_url, *filters)
+                    if summary["total"]:
+                        chart_data = generate_chart_data(
+                            session, database_url, *filters
+                        )
+                    else:
+                        chart_data = None
+            except Exception as e:
+                st.error(f"Error executing query: {e}")
+                return
+            # Figures are built once per filter selection, not on every rerun
+            figures = build_figures(*chart_data) if chart_data else {}
+            query_results = (filters_key, summary, chart_data, figures)
+            st.session_state.query_results = query_results
+
+        _, summary, chart_data, figures = query_results
 
         # Check if we have results
-        if len(results_df) == 0:
+        if summary["total"] == 0:
             st.info(
                 "No results found for the selected filters. Try adjusting your criteria or expanding the date range."
             )
@@ -553,32 +937,35 @@ ORDER BY i.timestamp DESC;"""
         # Results summary
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Results", len(results_df))
+            st.metric("Total Results", summary["total"])
         with col2:
-            if len(results_df) > 0 and "User" in results_df.columns:
-                unique_users = results_df["User"].nunique()
-            else:
-                unique_users = 0
-            st.metric("Unique Users", unique_users)
+            st.metric("Unique Users", summary["users"])
         with col3:
-            if len(results_df) > 0 and "Repository" in results_df.columns:
-                unique_repos = results_df["Repository"].nunique()
-            else:
-                unique_repos = 0
-            st.metric("Unique Repos", unique_repos)
+            st.metric("Unique Repos", summary["repositories"])
         with col4:
-            if len(results_df) > 0 and "Timestamp" in results_df.columns:
-                unique_days = len(results_df["Timestamp"].dt.date.unique())
-            else:
-                unique_days = 0
-            st.metric("Date Range", f"{unique_days} days")
+            st.metric("Date Range", f"{summary['days']} days")
 
         # Export options
         st.markdown("**Export Options:**")
         col1, col2, col3 = st.columns(3)
         with col1:
             if st.button("📄 Export CSV", use_container_width=True):
-                st.success("CSV export initiated! (Mock)")
+                st.session_state.csv_export = filters_key
+            if st.session_state.get("csv_export") == filters_key:
+                try:
+                    with get_db() as session:
+                        database_url = get_database_url(session)
+                        csv_data = export_query_csv(session, database_url, *filters)
+                except Exception as e:
+                    st.error(f"Error exporting results: {e}")
+                else:
+                    st.download_button(
+                        "⬇️ Download CSV",
+                        csv_data,
+                        file_name="query_results.csv",
+                        mime="text/csv",
+                        use_container_width=True,
+                    )
         with col2:
             if st.button("📋 Export JSON", use_container_width=True):
                 st.success("JSON export initiated! (Mock)")
@@ -594,33 +981,13 @@ ORDER BY i.timestamp DESC;"""
         with tab1:
             st.subheader("Data Visualizations")
 
-            # Generate real chart data
-            time_series, interaction_dist, top_users = generate_chart_data(
-                selected_orgs,
-                selected_repos,
-                selected_users,
-                selected_types,
-                selected_actions,
-                date_range,
-                logical_operator,
-                not exclude_stars,  # Invert because checkbox is "Include stars"
-            )
+            time_series, interaction_dist, top_users = chart_data
 
             # Time series chart
             st.markdown("**📈 Interactions Over Time**")
             if not time_series.empty:
                 if PLOTLY_AVAILABLE:
-                    fig_time = px.line(
-                        time_series,
-                        x="date",
-                        y="interactions",
-                        title="Daily Interaction Volume",
-                        labels={
-                            "interactions": "Number of Interactions",
-                            "date": "Date",
-                        },
-                    )
-                    st.plotly_chart(fig_time, use_container_width=True)
+                    st.plotly_chart(figures["time"], use_container_width=True)
                 else:
                     st.line_chart(time_series.set_index("date"))
             else:
@@ -633,13 +1000,7 @@ ORDER BY i.timestamp DESC;"""
                 st.markdown("**🔧 Interaction Type Distribution**")
                 if not interaction_dist.empty:
                     if PLOTLY_AVAILABLE:
-                        fig_pie = px.pie(
-                            interaction_dist,
-                            values="count",
-                            names="type",
-                            title="Interaction Types",
-                        )
-                        st.plotly_chart(fig_pie, use_container_width=True)
+                        st.plotly_chart(figures["types"], use_container_width=True)
                     else:
                         st.bar_chart(interaction_dist.set_index("type"))
                 else:
@@ -651,14 +1012,7 @@ ORDER BY i.timestamp DESC;"""
                 st.markdown("**👥 Top Contributors**")
                 if not top_users.empty:
                     if PLOTLY_AVAILABLE:
-                        fig_bar = px.bar(
-                            top_users,
-                            x="user",
-                            y="interactions",
-                            title="Most Active Users",
-                        )
-                        fig_bar.update_layout(xaxis_tickangle=-45)
-                        st.plotly_chart(fig_bar, use_container_width=True)
+                        st.plotly_chart(figures["users"], use_container_width=True)
                     else:
                         st.bar_chart(top_users.set_index("user"))
                 else:
@@ -667,28 +1021,8 @@ ORDER BY i.timestamp DESC;"""
         with tab2:
             st.subheader("Query Results Table")
 
-            # Pagination controls
-            page_size = st.selectbox("Results per page", [10, 25, 50, 100], index=1)
-            total_pages = (len(results_df) - 1) // page_size + 1
-
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                page = st.number_input(
-                    f"Page (1-{total_pages})",
-                    min_value=1,
-                    max_value=total_pages,
-                    value=1,
-                )
-
-            # Display paginated results
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-
-            st.dataframe(
-                results_df.iloc[start_idx:end_idx],
-                use_container_width=True,
-                hide_index=True,
-            )
+            # Paging reruns only the table
+            show_results_table(filters, summary["total"])
 
         with tab3:
             st.subheader("Analytics Summary")
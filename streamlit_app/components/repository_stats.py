@@ -8,14 +8,125 @@ import streamlit as st
 # Try to import plotly, fall back to basic charts if not available
 try:
     import plotly.express as px
+    import plotly.graph_objects as go
 
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
-from sqlalchemy import func
+from sqlalchemy import String, cast, func, literal, null, select, union_all
 
+from github_stats.constants import (
+    DASHBOARD_CACHE_TTL,
+    TIME_RANGE_DAYS,
+    TIMELINE_MAX_DAYS,
+)
 from github_stats.models.interactions import Interaction, InteractionType, Repository
-from github_stats.utils.database import get_db
+from github_stats.utils.database import get_database_url, get_db
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_repository_ids(_session, database_url):
+    """Get tracked repository ids keyed by full name."""
+    return dict(_session.query(Repository.full_name, Repository.id).all())
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_repository_totals(_session, database_url, repo_ids):
+    """Get star, fork and open issue totals for repositories.
+
+    Totals are counted from the tracked interactions in one query.
+    """
+    return (
+        _session.query(
+            func.count(Interaction.id)
+            .filter(Interaction.type == InteractionType.STAR)
+            .label("stars"),
+            func.count(Interaction.id)
+            .filter(Interaction.type == InteractionType.FORK)
+            .label("forks"),
+            func.count(Interaction.id)
+            .filter(
+                Interaction.type == InteractionType.ISSUE,
+                Interaction.action == "issue_open",
+            )
+            .label("open_issues"),
+        )
+        .filter(Interaction.repository_id.in_(repo_ids))
+        .one()
+        ._asdict()
+    )
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
+def get_repository_activity(_session, database_url, repo_ids, time_range):
+    """Get the interaction timeline and top contributors for repositories.
+
+    Daily counts per action within ``time_range``, per-action totals for the
+    same range and the ten most active users come from a single UNION ALL
+    statement over the repositories' non-star interactions, with rows tagged
+    by the part they belong to.
+    Results are cached per repository selection and time range, so reruns
+    that change neither skip the query.
+
+    Returns:
+        Tuple of ``(date, action, count)`` timeline rows, ``(action, count)``
+        totals and ``(user, count)`` contributor rows, most active first
+    """
+    days = TIME_RANGE_DAYS[time_range]
+    since = datetime.now() - timedelta(days=days) if days else datetime.min
+
+    filtered = (
+        select(
+            Interaction.id,
+            Interaction.timestamp,
+            Interaction.action,
+            Interaction.user,
+        )
+        .where(
+            Interaction.repository_id.in_(repo_ids),
+            Interaction.type != InteractionType.STAR,  # Exclude stars by default
+        )
+        .cte("filtered")
+    )
+
+    day = func.date(filtered.c.timestamp)
+    count = func.count(filtered.c.id)
+
+    # LIMIT is not allowed on a compound member, so rank users in a subquery
+    top_contributors = (
+        select(literal("user"), null(), filtered.c.user, count)
+        .where(filtered.c.user.isnot(None))
+        .group_by(filtered.c.user)
+        .order_by(count.desc())
+        .limit(10)
+        .subquery()
+    )
+
+    query = union_all(
+        select(
+            literal("time").label("kind"),
+            cast(day, String).label("date"),
+            filtered.c.action.label("key"),
+            count.label("count"),
+        )
+        .where(filtered.c.timestamp >= since)
+        .group_by(day, filtered.c.action),
+        select(literal("action"), null(), filtered.c.action, count)
+        .where(filtered.c.timestamp >= since)
+        .group_by(filtered.c.action),
+        select(top_contributors),
+    )
+
+    timeline, action_totals, contributors = [], [], []
+    for kind, date, key, total in _session.execute(query):
+        if kind == "time":
+            timeline.append((date, key, total))
+        elif kind == "action":
+            action_totals.append((key, total))
+        else:
+            contributors.append((key, total))
+    contributors.sort(key=lambda row: row[1], reverse=True)
+    return timeline, action_totals, contributors
 
 
 def show():
@@ -23,8 +134,9 @@ def show():
     st.header("🏢 Repository Statistics")
 
     with get_db() as session:
-        repos = session.query(Repository).all()
-        repo_names = [repo.full_name for repo in repos]
+        database_url = get_database_url(session)
+        repo_ids_by_name = get_repository_ids(session, database_url)
+        repo_names = list(repo_ids_by_name)
 
         if not repo_names:
             st.warning("No repositories found. Start tracking some repositories first!")
@@ -38,23 +150,20 @@ def show():
         )
 
         if selected_repos:
-            repos = session.query(Repository).filter(Repository.full_name.in_(selected_repos)).all()
-            repo_ids = [repo.id for repo in repos]
+            repo_ids = [repo_ids_by_name[name] for name in selected_repos]
+
+            totals = get_repository_totals(session, database_url, repo_ids)
 
-            # Display aggregate metrics for selected repositories
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                total_stars = sum(getattr(repo, "stars_count", 0) or 0 for repo in repos)
-                st.metric("Total Stars", total_stars)
+                st.metric("Total Stars", totals["stars"])
 
             with col2:
-                total_forks = sum(getattr(repo, "forks_count", 0) or 0 for repo in repos)
-                st.metric("Total Forks", total_forks)
+                st.metric("Total Forks", totals["forks"])
 
             with col3:
-                total_issues = sum(getattr(repo, "open_issues_count", 0) or 0 for repo in repos)
-                st.metric("Total Open Issues", total_issues)
+                st.metric("Total Open Issues", totals["open_issues"])
 
             st.markdown("---")
 
@@ -66,45 +175,33 @@ def show():
 
             time_range = st.selectbox(
                 "Time Range:",
-                ["Last 7 days", "Last 30 days", "Last 90 days", "All time"],
+                list(TIME_RANGE_DAYS),
                 index=1,
             )
 
-            if time_range == "Last 7 days":
-                date_filter = datetime.now() - timedelta(days=7)
-            elif time_range == "Last 30 days":
-                date_filter = datetime.now() - timedelta(days=30)
-            elif time_range == "Last 90 days":
-                date_filter = datetime.now() - timedelta(days=90)
-            else:
-                date_filter = datetime.min
-
-            interactions_data = (
-                session.query(
-                    func.date(Interaction.timestamp).label("date"),
-                    Interaction.action,
-                    func.count(Interaction.id).label("count"),
-                )
-                .filter(
-                    Interaction.repository_id.in_(repo_ids),
-                    Interaction.timestamp >= date_filter,
-                    Interaction.type != InteractionType.STAR,  # Exclude stars by default
-                )
-                .group_by(func.date(Interaction.timestamp), Interaction.action)
-                .all()
+            interactions_data, action_totals, top_contributors = (
+                get_repository_activity(session, database_url, repo_ids, time_range)
             )
 
             if interactions_data:
                 df = pd.DataFrame(
-                    [
-                        {
-                            "date": i.date,
-                            "action_type": i.action or "Unknown",
-                            "count": i.count,
-                        }
-                        for i in interactions_data
-                    ]
+                    interactions_data, columns=["date", "action_type", "count"]
+                )
+                df["action_type"] = (
+                    df["action_type"].fillna("Unknown").astype("category")
                 )
+                # Per-action totals are summed in SQL alongside the timeline
+                action_summary = pd.DataFrame(
+                    action_totals, columns=["action_type", "count"]
+                ).fillna({"action_type": "Unknown"})
+
+                # Long timelines are plotted as weekly points to keep charts light
+                df["date"] = pd.to_datetime(df["date"])
+                if df["date"].nunique() > TIMELINE_MAX_DAYS:
+                    df["date"] = df["date"].dt.to_period("W-SAT").dt.start_time
+                    df = df.groupby(
+                        ["date", "action_type"], as_index=False, observed=True
+                    )["count"].sum()
 
                 if PLOTLY_AVAILABLE:
                     title = f"Interactions over time for {repo_names_str}" if len(selected_repos) == 1 else f"Interactions over time for {len(selected_repos)} repositories"
@@ -115,35 +212,30 @@ def show():
                         color="action_type",
                         title=title,
                         labels={"count": "Number of Interactions", "date": "Date"},
+                        render_mode="webgl",
                     )
                     st.plotly_chart(fig, use_container_width=True)
 
                     st.subheader("📈 Interaction Breakdown")
 
-                    action_summary = (
-                        df.groupby("action_type")["count"].sum().reset_index()
-                    )
-                    fig_pie = px.pie(
-                        action_summary,
-                        values="count",
-                        names="action_type",
-                        title="Distribution of Interaction Types",
+                    fig_pie = go.Figure(
+                        go.Pie(
+                            labels=action_summary["action_type"],
+                            values=action_summary["count"],
+                        )
                     )
+                    fig_pie.update_layout(title="Distribution of Interaction Types")
                     st.plotly_chart(fig_pie, use_container_width=True)
                 else:
                     # Fallback to basic Streamlit charts
-                    pivot_df = df.pivot_table(
-                        values="count",
-                        index="date",
-                        columns="action_type",
-                        fill_value=0,
+                    # Rows are already one count per date and action, so
+                    # reshape them without aggregating again
+                    pivot_df = df.set_index(["date", "action_type"])["count"].unstack(
+                        fill_value=0
                     )
                     st.line_chart(pivot_df)
 
                     st.subheader("📈 Interaction Breakdown")
-                    action_summary = (
-                        df.groupby("action_type")["count"].sum().reset_index()
-                    )
                     st.write("**Distribution of Interaction Types**")
                     for _, row in action_summary.iterrows():
                         st.write(f"- {row['action_type']}: {row['count']}")
@@ -155,36 +247,19 @@ def show():
             contributors_title = "👥 Top Contributors to these Repositories" if len(selected_repos) > 1 else f"👥 Top Contributors to {repo_names_str}"
             st.subheader(contributors_title)
 
-            top_contributors = (
-                session.query(
-                    Interaction.user,
-                    func.count(Interaction.id).label("interaction_count"),
-                )
-                .filter(
-                    Interaction.repository_id.in_(repo_ids), 
-                    Interaction.user.isnot(None),
-                    Interaction.type != InteractionType.STAR,  # Exclude stars by default
-                )
-                .group_by(Interaction.user)
-                .order_by(func.count(Interaction.id).desc())
-                .limit(10)
-                .all()
-            )
-
             if top_contributors:
                 contrib_df = pd.DataFrame(
-                    [
-                        {"Developer": c.user, "Interactions": c.interaction_count}
-                        for c in top_contributors
-                    ]
+                    top_contributors, columns=["Developer", "Interactions"]
                 )
 
                 if PLOTLY_AVAILABLE:
-                    fig_bar = px.bar(
-                        contrib_df,
-                        x="Developer",
-                        y="Interactions",
+                    fig_bar = go.Figure(
+                        go.Bar(x=contrib_df["Developer"], y=contrib_df["Interactions"])
+                    )
+                    fig_bar.update_layout(
                         title="Top 10 Contributors",
+                        xaxis_title="Developer",
+                        yaxis_title="Interactions",
                     )
                     st.plotly_chart(fig_bar, use_container_width=True)
                 else:
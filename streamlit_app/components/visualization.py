@@ -3,9 +3,10 @@
 from datetime import datetime, timedelta
 
 import streamlit as st
+from sqlalchemy import literal, select, union_all
 
+from github_stats.constants import DASHBOARD_CACHE_TTL
 from github_stats.models.interactions import (
-    Interaction,
     InteractionType,
     Organization,
     Repository,
@@ -14,24 +15,33 @@ from github_stats.ui.charts import ChartGenerator, display_metrics_cards, export
 from github_stats.utils.database import get_db
 
 
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL, show_spinner=False)
 def get_filter_options():
-    """Get filter options from database."""
+    """Get filter options from database.
+
+    Options are cached across reruns for ``DASHBOARD_CACHE_TTL`` seconds, with
+    the name-to-id lookups ``convert_names_to_ids`` reads.
+    """
+    # Organizations and repositories come back in one round trip, tagged
+    # with the list they belong to
+    query = union_all(
+        select(literal("organization"), Organization.name, Organization.id),
+        select(literal("repository"), Repository.full_name, Repository.id),
+    )
     with get_db() as session:
-        organizations = session.query(Organization.name).all()
-        repositories = session.query(Repository.full_name).all()
-        users = (
-            session.query(Interaction.user)
-            .filter(Interaction.user.isnot(None))
-            .distinct()
-            .all()
-        )
-
-        return {
-            "organizations": [org.name for org in organizations],
-            "repositories": [repo.full_name for repo in repositories],
-            "users": [user.user for user in users],
-            "interaction_types": [t.value for t in InteractionType],
-        }
+        rows = session.execute(query).all()
+
+    ids = {"organization": {}, "repository": {}}
+    for kind, name, id_ in rows:
+        ids[kind][name] = id_
+
+    return {
+        "organizations": list(ids["organization"]),
+        "repositories": list(ids["repository"]),
+        "interaction_types": [t.value for t in InteractionType],
+        "organization_ids": ids["organization"],
+        "repository_ids": ids["repository"],
+    }
 
 
 def create_sidebar_filters() -> dict:
@@ -43,13 +53,13 @@ def create_sidebar_filters() -> dict:
 
     # Date range filter
     st.sidebar.subheader("📅 Date Range")
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=30)
+    default_end = datetime.now().date()
+    default_start = default_end - timedelta(days=30)
 
     date_range = st.sidebar.date_input(
         "Select date range:",
-        value=(start_date, end_date),
-        max_value=end_date,
+        value=(default_start, default_end),
+        max_value=default_end,
         help="Select the date range for analysis",
     )
 
@@ -57,18 +67,18 @@ def create_sidebar_filters() -> dict:
     if isinstance(date_range, tuple) and len(date_range) == 2:
         start_date, end_date = date_range
     elif hasattr(date_range, '__iter__') and len(date_range) > 0:
-        start_date = date_range[0] if date_range[0] is not None else datetime.now().date() - timedelta(days=30)
-        end_date = date_range[1] if len(date_range) > 1 and date_range[1] is not None else datetime.now().date()
+        start_date = date_range[0] if date_range[0] is not None else default_start
+        end_date = date_range[1] if len(date_range) > 1 and date_range[1] is not None else default_end
     else:
         # Fallback to default range if date_range is None or empty
-        start_date = datetime.now().date() - timedelta(days=30)
-        end_date = datetime.now().date()
+        start_date = default_start
+        end_date = default_end
 
     # Ensure dates are valid date objects
     if start_date is None:
-        start_date = datetime.now().date() - timedelta(days=30)
+        start_date = default_start
     if end_date is None:
-        end_date = datetime.now().date()
+        end_date = default_end
 
     # Interaction type filter
     st.sidebar.subheader("🔧 Interaction Types")
@@ -149,24 +159,25 @@ def create_sidebar_filters() -> dict:
 
 def convert_names_to_ids(filters: dict) -> dict:
     """Convert repository and organization names to IDs."""
-    with get_db() as session:
-        # Convert repository names to IDs
-        if filters["selected_repo_names"]:
-            repo_ids = (
-                session.query(Repository.id)
-                .filter(Repository.full_name.in_(filters["selected_repo_names"]))
-                .all()
-            )
-            filters["repositories"] = [r.id for r in repo_ids]
-
-        # Convert organization names to IDs
-        if filters["selected_org_names"]:
-            org_ids = (
-                session.query(Organization.id)
-                .filter(Organization.name.in_(filters["selected_org_names"]))
-                .all()
-            )
-            filters["organizations"] = [o.id for o in org_ids]
+    options = get_filter_options()
+
+    # Convert repository names to IDs
+    if filters["selected_repo_names"]:
+        repository_ids = options["repository_ids"]
+        filters["repositories"] = [
+            repository_ids[name]
+            for name in filters["selected_repo_names"]
+            if name in repository_ids
+        ]
+
+    # Convert organization names to IDs
+    if filters["selected_org_names"]:
+        organization_ids = options["organization_ids"]
+        filters["organizations"] = [
+            organization_ids[name]
+            for name in filters["selected_org_names"]
+            if name in organization_ids
+        ]
 
     return filters
 
@@ -191,20 +202,23 @@ def show():
     with get_db() as session:
         chart_gen = ChartGenerator(session)
 
-        # Get filtered data
+        # Get filtered data, skipping the load entirely when nothing matches
         try:
-            df = chart_gen.get_interactions_data(filters)
-
-            if df.empty:
+            if chart_gen.count_for_filters(filters) == 0:
                 st.warning(
                     "No data found for the selected filters. Try expanding your "
                     "date range or removing some filters."
                 )
                 return
 
+            df = chart_gen.get_interactions_data(filters)
+
+            # Every chart input is aggregated in SQL once for this render
+            aggregates = chart_gen.precompute(filters)
+
             # Display metrics cards
             st.subheader("📊 Key Metrics")
-            metrics = chart_gen.create_metrics_cards(df)
+            metrics = chart_gen.create_metrics_cards(df, aggregates["day_hour"])
             display_metrics_cards(metrics)
             st.markdown("---")
 
@@ -214,23 +228,23 @@ def show():
             with col1:
                 st.subheader("📈 Interactions Over Time")
                 time_series_chart = chart_gen.create_time_series_chart(
-                    df, filters["time_grouping"]
+                    aggregates["time_series"], filters["time_grouping"]
                 )
                 st.plotly_chart(time_series_chart, use_container_width=True)
 
                 st.subheader("🥧 Interaction Types Distribution")
-                pie_chart = chart_gen.create_interaction_type_pie(df)
+                pie_chart = chart_gen.create_interaction_type_pie(aggregates["type"])
                 st.plotly_chart(pie_chart, use_container_width=True)
 
             with col2:
                 st.subheader("📊 Interactions by Type (Stacked)")
                 stacked_chart = chart_gen.create_stacked_bar_chart(
-                    df, filters["time_grouping"]
+                    aggregates["time_series"], filters["time_grouping"]
                 )
                 st.plotly_chart(stacked_chart, use_container_width=True)
 
                 st.subheader("🌡️ Activity Heatmap")
-                heatmap = chart_gen.create_heatmap(df)
+                heatmap = chart_gen.create_heatmap(aggregates["day_hour"])
                 st.plotly_chart(heatmap, use_container_width=True)
 
             # Top charts section
@@ -244,7 +258,9 @@ def show():
             with tab1:
                 if "repository_name" in df.columns:
                     repo_chart = chart_gen.create_horizontal_bar_chart(
-                        df, "repository_name", filters["top_n"]
+                        aggregates["repository_name"],
+                        "repository_name",
+                        filters["top_n"],
                     )
                     st.plotly_chart(repo_chart, use_container_width=True)
                 else:
@@ -253,7 +269,9 @@ def show():
             with tab2:
                 if "user" in df.columns:
                     user_chart = chart_gen.create_horizontal_bar_chart(
-                        df, "user", filters["top_n"]
+                        aggregates["user"],
+                        "user",
+                        filters["top_n"],
                     )
                     st.plotly_chart(user_chart, use_container_width=True)
                 else:
@@ -262,7 +280,9 @@ def show():
             with tab3:
                 if "organization_name" in df.columns:
                     org_chart = chart_gen.create_horizontal_bar_chart(
-                        df, "organization_name", filters["top_n"]
+                        aggregates["organization_name"],
+                        "organization_name",
+                        filters["top_n"],
                     )
                     st.plotly_chart(org_chart, use_container_width=True)
                 else:
@@ -279,14 +299,23 @@ def show():
                     st.info(f"Export {len(df):,} filtered interactions to CSV")
 
                 with col2:
-                    csv_data = export_to_csv(df)
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv_data,
-                        file_name=f"github_stats_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        help="Download the filtered data as CSV",
-                    )
+                    # Serialize only on request, and keep the CSV for these
+                    # filters so later reruns don't rebuild it
+                    export_key = repr(filters)
+                    if st.button("📄 Prepare CSV"):
+                        st.session_state.visualization_csv = (
+                            export_key,
+                            export_to_csv(df),
+                        )
+                    prepared = st.session_state.get("visualization_csv")
+                    if prepared and prepared[0] == export_key:
+                        st.download_button(
+                            label="📥 Download CSV",
+                            data=prepared[1],
+                            file_name=f"github_stats_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                            mime="text/csv",
+                            help="Download the filtered data as CSV",
+                        )
 
             # Raw data table
             if filters["show_raw_data"]:
@@ -335,7 +364,7 @@ def show():
                 
                 # Get all unique users with their interaction counts
                 all_users_data = (
-                    df.groupby("user")
+                    df.groupby("user", observed=True)
                     .agg({
                         "id": "count",
                         "repository_name": "nunique",
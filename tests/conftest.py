@@ -5,6 +5,7 @@ import tempfile
 from unittest.mock import patch
 
 import pytest
+import streamlit as st
 
 
 @pytest.fixture
@@ -33,6 +34,10 @@ def temp_db():
 @pytest.fixture
 def mock_empty_db():
     """Mock database with no data."""
+    # Drop anything cached by earlier tests before the pages query the mock
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
     with patch("github_stats.utils.database.get_db") as mock_get_db:
         from unittest.mock import MagicMock
 
@@ -0,0 +1,90 @@
+"""Tests for dashboard chart builders."""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+import streamlit as st
+from pandas.testing import assert_frame_equal
+
+from github_stats.models import Interaction, InteractionType, Repository
+from github_stats.ui.charts import ChartGenerator
+from github_stats.utils import get_db, init_db
+from github_stats.utils.config import get_settings
+from github_stats.utils.snapshot import write_interactions_snapshot
+
+
+def test_heatmap_does_not_mutate_input():
+    """Test that the heatmap derives day/hour without touching the caller's frame."""
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                ["2025-05-05 09:15", "2025-05-05 09:45", "2025-05-11 23:00"]
+            ),
+            "type": ["fork", "star", "fork"],
+        }
+    )
+    original = df.copy()
+
+    fig = ChartGenerator(None).create_heatmap(df)
+
+    assert_frame_equal(df, original)
+    grid = fig.data[0].z
+    assert grid[0][9] == 2  # Monday 09:00
+    assert grid[6][23] == 1  # Sunday 23:00
+
+
+@pytest.fixture
+def snapshot_db(tmp_path, monkeypatch):
+    """Point the dashboard at a fresh database and a snapshot path."""
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'stats.db'}")
+    monkeypatch.setenv("INTERACTIONS_SNAPSHOT", str(tmp_path / "interactions.parquet"))
+    get_settings.cache_clear()
+    st.cache_data.clear()
+    init_db()
+
+    yield
+
+    st.cache_data.clear()
+    get_settings.cache_clear()
+
+
+def _add_forks(repository_id: int, *timestamps: str) -> None:
+    with get_db() as db:
+        db.add_all(
+            Interaction(
+                type=InteractionType.FORK,
+                repository_id=repository_id,
+                timestamp=datetime.fromisoformat(timestamp),
+                user="octocat",
+            )
+            for timestamp in timestamps
+        )
+
+
+def test_aggregates_come_from_the_snapshot_like_the_rows(snapshot_db):
+    """Test that charts and raw rows agree when the snapshot is behind the database."""
+    with get_db() as db:
+        repo = Repository(name="repo", full_name="octo/repo")
+        db.add(repo)
+        db.flush()
+        repository_id = repo.id
+    _add_forks(repository_id, "2025-05-05 09:15", "2025-05-06 10:00")
+    write_interactions_snapshot()
+    # Synced after the snapshot was written, so not in it yet
+    _add_forks(repository_id, "2025-05-07 11:00")
+
+    with get_db() as db:
+        charts = ChartGenerator(db)
+        rows = charts.get_interactions_data()
+        aggregates = charts.precompute({"time_grouping": "date"})
+
+        assert len(rows) == charts.count_for_filters() == 2
+        assert aggregates["time_series"]["count"].sum() == 2
+        assert aggregates["day_hour"]["count"].sum() == 2
+        assert aggregates["type"]["count"].tolist() == [2]
+        assert aggregates["repository_name"].to_dict("records") == [
+            {"repository_name": "octo/repo", "count": 2}
+        ]
@@ -0,0 +1,117 @@
+"""Tests for the Data Management page."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+import streamlit as st
+from sqlalchemy import Engine, event
+from streamlit.testing.v1 import AppTest
+
+from github_stats.models import Interaction, InteractionType, Organization, Repository
+from github_stats.tracking import InteractionTracker
+from github_stats.utils import get_db, init_db
+from github_stats.utils.config import get_settings
+from github_stats.utils.database import get_db_engine
+
+# Statements one page render may issue, however many rows are tracked
+QUERY_BUDGET = 4
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    """Collect the SQL statements executed on ``engine``."""
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def populated_db(tmp_path, monkeypatch):
+    """Point the app at a fresh database with several orgs and repositories."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'stats.db'}")
+    get_settings.cache_clear()
+    st.cache_data.clear()
+    init_db()
+
+    with get_db() as db:
+        for org_index in range(3):
+            org = Organization(name=f"org{org_index}")
+            db.add(org)
+            db.flush()
+            for repo_index in range(5):
+                repo = Repository(
+                    name=f"repo{repo_index}",
+                    full_name=f"org{org_index}/repo{repo_index}",
+                    organization_id=org.id,
+                )
+                db.add(repo)
+                db.flush()
+                db.add_all(
+                    Interaction(
+                        type=InteractionType.COMMIT,
+                        repository_id=repo.id,
+                        organization_id=org.id,
+                        user="octocat",
+                    )
+                    for _ in range(4)
+                )
+
+    yield
+
+    st.cache_data.clear()
+    get_settings.cache_clear()
+
+
+def test_page_query_count_does_not_grow_with_rows(populated_db):
+    """Test that rendering the page stays within a fixed query budget."""
+    with count_queries(get_db_engine()) as statements:
+        at = AppTest.from_file("streamlit_app/components/data_management.py")
+        at.run()
+
+    assert not at.exception, f"Page crashed with: {at.exception}"
+    assert [metric.value for metric in at.metric] == ["3", "15", "60"]
+    assert len(statements) <= QUERY_BUDGET, "\n".join(statements)
+
+
+def test_added_organization_is_listed_right_away(populated_db, monkeypatch):
+    """Test that the panel reloads its data after adding, without a forced rerun."""
+
+    def track_organization(_tracker, name):
+        with get_db() as db:
+            db.add(Organization(name=name))
+        return {"exists": True}
+
+    monkeypatch.setattr(InteractionTracker, "track_organization", track_organization)
+    monkeypatch.setattr(st, "rerun", lambda **_kwargs: pytest.fail("forced rerun"))
+
+    at = AppTest.from_file("streamlit_app/components/data_management.py")
+    at.run()
+    at.text_input(key="new_org_input").input("org3").run()
+    next(b for b in at.button if b.label == "➕ Add Organization").click().run()
+
+    assert not at.exception, f"Page crashed with: {at.exception}"
+    assert "✅ Successfully added organization: org3" in [s.value for s in at.success]
+    assert "org3" in at.dataframe[0].value["name"].tolist()
+    assert at.metric[0].value == "4"
+
+
+def test_deleting_organization_reloads_panel_data(populated_db):
+    """Test that a confirmed delete is gone from the panel and its totals."""
+    at = AppTest.from_file("streamlit_app/components/data_management.py")
+    at.session_state["confirm_delete_orgs"] = [1]
+    at.run()
+    next(b for b in at.button if b.label == "✅ Confirm").click().run()
+
+    assert not at.exception, f"Page crashed with: {at.exception}"
+    assert "✅ Deleted organization(s): org0" in [s.value for s in at.success]
+    assert at.metric[0].value == "2"
+    assert "org0" not in at.dataframe[0].value["name"].tolist()
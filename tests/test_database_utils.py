@@ -1,6 +1,12 @@
 """Tests for database utility functions."""
 
-from github_stats.utils.database import check_db_has_data
+import streamlit as st
+
+from github_stats.models import Repository
+from github_stats.utils import get_db, init_db
+from github_stats.utils.config import get_settings
+from github_stats.utils.database import check_db_has_data, get_database_url
+from streamlit_app.components.overview import get_overview_metrics
 
 
 def test_check_db_has_data_returns_counts():
@@ -27,3 +33,26 @@ def test_check_db_has_data_handles_missing_database():
     # Should return zero counts for missing database
     assert isinstance(counts, dict)
     assert all(isinstance(count, int) for count in counts.values())
+
+
+def test_page_caches_are_keyed_on_the_database(tmp_path, monkeypatch):
+    """Test that switching databases does not serve the previous one's results."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    st.cache_data.clear()
+    totals = []
+    for name, repositories in (("first.db", 1), ("second.db", 2)):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / name}")
+        get_settings.cache_clear()
+        init_db()
+        with get_db() as session:
+            session.add_all(
+                Repository(name=f"repo{i}", full_name=f"octo/repo{i}")
+                for i in range(repositories)
+            )
+        with get_db() as session:
+            metrics = get_overview_metrics(session, get_database_url(session))
+            totals.append(metrics["total_repos"])
+
+    st.cache_data.clear()
+    get_settings.cache_clear()
+    assert totals == [1, 2]
@@ -0,0 +1,366 @@
+"""Tests for interaction tracking helpers."""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from github_stats.api import GitHubAPIError, GitHubClient
+from github_stats.models.interactions import Interaction, InteractionType, Organization
+from github_stats.tracking import InteractionTracker
+from github_stats.tracking.tracker import _EXTRACTORS
+from github_stats.utils import get_db, init_db
+from github_stats.utils.config import get_settings
+from github_stats.utils.database import get_db_engine
+
+
+@pytest.fixture
+def tracking_db(tmp_path, monkeypatch):
+    """Point the tracker at a fresh SQLite database."""
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'stats.db'}")
+    get_settings.cache_clear()
+    init_db()
+    yield
+    get_settings.cache_clear()
+
+
+# Tables as created by init_db() before interactions had a resource key
+BASELINE_SCHEMA = """
+CREATE TABLE organizations (
+    id INTEGER NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    github_id INTEGER,
+    description TEXT,
+    last_synced_at DATETIME,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_organizations_name ON organizations (name);
+CREATE TABLE repositories (
+    id INTEGER NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    full_name VARCHAR(512) NOT NULL,
+    github_id INTEGER,
+    organization_id INTEGER,
+    description TEXT,
+    is_private BOOLEAN NOT NULL,
+    last_synced_at DATETIME,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(organization_id) REFERENCES organizations (id)
+);
+CREATE INDEX ix_repositories_name ON repositories (name);
+CREATE UNIQUE INDEX ix_repositories_full_name ON repositories (full_name);
+CREATE TABLE interactions (
+    id INTEGER NOT NULL,
+    type VARCHAR(12) NOT NULL,
+    repository_id INTEGER,
+    organization_id INTEGER,
+    timestamp DATETIME NOT NULL,
+    user VARCHAR(255),
+    action VARCHAR(255),
+    resource_id VARCHAR(255),
+    resource_url TEXT,
+    extra_data JSON,
+    PRIMARY KEY (id),
+    FOREIGN KEY(repository_id) REFERENCES repositories (id),
+    FOREIGN KEY(organization_id) REFERENCES organizations (id)
+);
+CREATE INDEX ix_interactions_timestamp ON interactions (timestamp);
+INSERT INTO repositories VALUES
+    (1, 'repo', 'octo/repo', NULL, NULL, NULL, 0, NULL,
+     '2025-05-01', '2025-05-01');
+INSERT INTO interactions VALUES
+    (1, 'FORK', 1, NULL, '2025-05-01', NULL, 'fork', '2', NULL, NULL),
+    (2, 'FORK', 1, NULL, '2025-05-01', NULL, 'fork', '2', NULL, NULL),
+    (3, 'ISSUE', 1, NULL, '2025-05-01', NULL, 'issue_open', '7', NULL, NULL);
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path, monkeypatch):
+    """Point the tracker at a database created by the original schema."""
+    path = tmp_path / "stats.db"
+    with sqlite3.connect(path) as connection:
+        connection.executescript(BASELINE_SCHEMA)
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{path}")
+    get_settings.cache_clear()
+    init_db()
+    yield
+    get_settings.cache_clear()
+
+
+def test_star_extractor_handles_wrapped_user():
+    """Test that stargazers returned with the star media type are unwrapped."""
+    star = {
+        "starred_at": "2025-05-01T12:00:00Z",
+        "user": {"login": "octocat", "id": 1, "html_url": "u", "type": "User"},
+    }
+
+    data = _EXTRACTORS[InteractionType.STAR](star)
+
+    assert data["user"] == "octocat"
+    assert data["resource_id"] == "1"
+    assert data["resource_url"] == "u"
+    assert data["action"] == "star"
+    assert data["timestamp"].year == 2025
+    assert data["extra_data"] == {
+        "starred_at": "2025-05-01T12:00:00Z",
+        "user_type": "User",
+    }
+
+
+def test_star_extractor_handles_bare_user():
+    """Test that stargazers returned as plain user objects are supported."""
+    data = _EXTRACTORS[InteractionType.STAR]({"login": "octocat", "id": 2})
+
+    assert data["user"] == "octocat"
+    assert data["resource_id"] == "2"
+    assert data["timestamp"] is None
+
+
+def test_workflow_extractor_builds_action_and_extra_data():
+    """Test workflow run extraction of prefixed actions and nested fields."""
+    run = {
+        "id": 10,
+        "status": "completed",
+        "conclusion": "success",
+        "actor": {"login": "bot"},
+        "created_at": "2025-05-01T12:00:00Z",
+    }
+
+    data = _EXTRACTORS[InteractionType.WORKFLOW_RUN](run)
+
+    assert data["action"] == "workflow_completed"
+    assert data["user"] == "bot"
+    assert data["resource_id"] == "10"
+    assert data["extra_data"]["conclusion"] == "success"
+    assert isinstance(data["timestamp"], datetime)
+
+
+def test_extractor_tolerates_missing_nested_objects():
+    """Test that missing or null nested objects do not raise."""
+    data = _EXTRACTORS[InteractionType.RELEASE]({"id": 3, "author": None})
+
+    assert data["user"] is None
+    assert data["timestamp"] is None
+    assert data["extra_data"]["draft"] is False
+
+
+def test_invalid_timestamp_is_ignored():
+    """Test that unparsable timestamps are treated as missing."""
+    data = _EXTRACTORS[InteractionType.FORK]({"created_at": "not a date"})
+
+    assert data["timestamp"] is None
+
+
+def test_tracking_api_errors_are_logged_not_raised():
+    """Test that GitHub API failures are swallowed and store no interactions."""
+    client = MagicMock()
+    client.get_repository_forks.side_effect = GitHubAPIError("boom")
+
+    tracker = InteractionTracker(client)
+
+    assert tracker.track_forks("octo", "repo") == 0
+
+
+def test_check_unchanged_sends_etag_and_reads_304():
+    """Test that the probe is conditional and 304 means unchanged."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{}], headers={"ETag": '"abc"'})
+
+    client = GitHubClient(token="test")  # noqa: S106
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    params = {"state": "all", "sort": "updated", "direction": "desc"}
+
+    with client:
+        assert client.check_unchanged("/repos/o/r/issues", None, params) == (
+            False,
+            '"abc"',
+        )
+        assert client.check_unchanged("/repos/o/r/issues", '"abc"', params) == (
+            True,
+            '"abc"',
+        )
+
+    assert requests[0].url.params["sort"] == "updated"
+    assert requests[0].url.params["per_page"] == "1"
+
+
+def test_track_if_changed_skips_unchanged_and_tracks_changed():
+    """Test that a 304 probe skips the fetch and a 200 probe runs it."""
+    client = MagicMock()
+    track = MagicMock(return_value=3)
+    tracker = InteractionTracker(client)
+
+    client.check_unchanged.return_value = (True, '"old"')
+    assert tracker._track_if_changed("issues", track, "o", "r", '"old"') == (0, None)
+    track.assert_not_called()
+
+    client.check_unchanged.return_value = (False, '"new"')
+    assert tracker._track_if_changed("issues", track, "o", "r", '"old"') == (
+        3,
+        '"new"',
+    )
+    track.assert_called_once_with("o", "r")
+    _, _, params = client.check_unchanged.call_args.args
+    assert params["sort"] == "updated"
+
+
+def test_track_if_changed_always_fetches_unordered_endpoints():
+    """Test that endpoints that cannot be probed by update order are fetched."""
+    client = MagicMock()
+    tracker = InteractionTracker(client)
+
+    assert tracker._track_if_changed(
+        "workflow_runs", MagicMock(return_value=2), "o", "r", '"old"'
+    ) == (2, None)
+    client.check_unchanged.assert_not_called()
+
+
+def test_interactions_batch_commits_every_n_rows():
+    """Test that large batches in the tracker's own session commit in chunks."""
+    tracker = InteractionTracker(MagicMock(), commit_every=2)
+    db = MagicMock()
+    db.in_nested_transaction.return_value = False
+    db.execute.side_effect = lambda stmt, rows: MagicMock(rowcount=len(rows))
+    repo_obj = MagicMock(id=1, organization_id=1)
+    forks = [{"id": i, "created_at": "2025-05-01T12:00:00Z"} for i in range(5)]
+
+    written = tracker._create_interactions_batch(
+        db, InteractionType.FORK, repo_obj, forks
+    )
+
+    assert written == 5
+    assert [len(call.args[1]) for call in db.execute.call_args_list] == [2, 2, 1]
+    assert db.commit.call_count == 2
+
+
+def test_interactions_batch_leaves_caller_session_uncommitted():
+    """Test that chunks written in a caller's session are not committed."""
+    tracker = InteractionTracker(MagicMock(), commit_every=2)
+    db = MagicMock()
+    db.in_nested_transaction.return_value = True
+    db.execute.side_effect = lambda stmt, rows: MagicMock(rowcount=len(rows))
+    repo_obj = MagicMock(id=1, organization_id=1)
+    forks = [{"id": i, "created_at": "2025-05-01T12:00:00Z"} for i in range(5)]
+
+    written = tracker._create_interactions_batch(
+        db, InteractionType.FORK, repo_obj, forks
+    )
+
+    assert written == 5
+    assert [len(call.args[1]) for call in db.execute.call_args_list] == [2, 2, 1]
+    db.commit.assert_not_called()
+
+
+def test_failed_call_does_not_break_shared_session(tracking_db, monkeypatch):
+    """Test that a failing track_* call rolls back only its own work."""
+    client = MagicMock()
+    client.get_repository_releases.return_value = [
+        {"id": 1, "published_at": "2025-05-01T12:00:00Z"}
+    ]
+    client.get_repository_forks.return_value = [
+        {"id": 2, "created_at": "2025-05-01T12:00:00Z"}
+    ]
+    tracker = InteractionTracker(client)
+    create_batch = tracker._create_interactions_batch
+
+    def fail_on_releases(db, interaction_type, repo_obj, items):
+        if interaction_type is InteractionType.RELEASE:
+            db.add(Organization(name="octo"))  # Duplicate name fails the flush
+            db.flush()
+        return create_batch(db, interaction_type, repo_obj, items)
+
+    monkeypatch.setattr(tracker, "_create_interactions_batch", fail_on_releases)
+
+    with get_db() as db:
+        assert tracker.track_releases("octo", "repo", db=db) == 0
+        assert tracker.track_forks("octo", "repo", db=db) == 1
+
+    with get_db() as db:
+        assert db.query(Interaction.type).all() == [(InteractionType.FORK,)]
+
+
+def test_resync_refreshes_mutable_and_skips_stored_interactions(tracking_db):
+    """Test that re-syncing updates changed issues and skips stored forks."""
+    issue = {"number": 7, "state": "open", "created_at": "2025-05-01T12:00:00Z"}
+    fork = {"id": 2, "created_at": "2025-05-01T12:00:00Z"}
+    client = MagicMock()
+    client.get_repository_issues.return_value = [issue]
+    client.get_repository_forks.return_value = [fork]
+    tracker = InteractionTracker(client)
+
+    assert tracker.track_issues("octo", "repo") == 1
+    assert tracker.track_forks("octo", "repo") == 1
+
+    client.get_repository_issues.return_value = [{**issue, "state": "closed"}]
+    assert tracker.track_issues("octo", "repo") == 1
+    assert tracker.track_forks("octo", "repo") == 0
+
+    with get_db() as db:
+        rows = db.query(Interaction.type, Interaction.action).all()
+    assert sorted(rows, key=lambda row: row.type.name) == [
+        (InteractionType.FORK, "fork"),
+        (InteractionType.ISSUE, "issue_closed"),
+    ]
+
+
+def test_resync_on_database_from_original_schema(baseline_db):
+    """Test that init_db upgrades old databases so re-syncs stay idempotent."""
+    client = MagicMock()
+    client.get_repository_issues.return_value = [
+        {"number": 7, "state": "closed", "created_at": "2025-05-01T12:00:00Z"}
+    ]
+    client.get_repository_forks.return_value = [
+        {"id": 2, "created_at": "2025-05-01T12:00:00Z"}
+    ]
+    tracker = InteractionTracker(client)
+
+    assert tracker.track_issues("octo", "repo") == 1
+    assert tracker.track_forks("octo", "repo") == 0
+
+    with get_db() as db:
+        rows = db.query(Interaction.type, Interaction.action).all()
+    assert sorted(rows, key=lambda row: row.type.name) == [
+        (InteractionType.FORK, "fork"),
+        (InteractionType.ISSUE, "issue_closed"),
+    ]
+
+
+def test_query_count_ignores_other_threads(tracking_db, caplog):
+    """Test that concurrent tracking calls do not count each other's queries."""
+    caplog.set_level(logging.DEBUG, logger="github_stats.tracking.tracker")
+    tracker = InteractionTracker(MagicMock())
+    counting = threading.Event()
+    done = threading.Event()
+
+    def other_worker():
+        counting.wait()
+        with get_db_engine().connect() as connection:
+            for _ in range(5):
+                connection.exec_driver_sql("SELECT 1")
+        done.set()
+
+    worker = threading.Thread(target=other_worker)
+    worker.start()
+    with get_db() as db, tracker._count_queries(db) as queries:
+        counting.set()
+        done.wait()
+        db.query(Organization).all()
+    worker.join()
+
+    assert queries[0] == 1